@@ -3,175 +3,709 @@
 Flask web application for visualizing YC Companies and Team Members
 """
 
-from flask import Flask, render_template, jsonify, request, send_from_directory
+from flask import Flask, Response, g, render_template, jsonify, request, send_from_directory, make_response
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+import functools
+import hashlib
+import itertools
 import sqlite3
 import json
 import os
+import time
+from urllib.parse import urlencode
+
+from company_changes import current_version, setup_company_changes, read_changes
+from company_facets import (DEFAULT_FACET_LIMIT, LISTED_COMPANY, facet_condition, facet_counts,
+                            parse_facet_filters, setup_company_facets)
+from company_names import setup_display_names
+from db_version import read_db_version, setup_db_version
+from json_stream import (COMPRESS_MIN_BYTES, columnar_json, compress_bytes, dumps, iter_compressed,
+                         iter_json_array, iter_ndjson, negotiate_encoding)
+from metrics import Metrics, MetricsMiddleware, TimedConnection, request_sql_time
+from response_cache import ResponseCache
+from scrape_telemetry import pid_alive, read_progress
+from static_assets import StaticAssets
+from pagination import (DEFAULT_PAGE_SIZE, decode_cursor, encode_cursor, keyset_condition,
+                        parse_fields, parse_page_size, parse_sort)
+from stats_rollup import setup_stats_rollup, read_stats
+from text_storage import (load_company_descriptions, load_founder_bios, offload_texts,
+                          register_text_functions)
+
+class FastJSONProvider(DefaultJSONProvider):
+    """jsonify() through json_stream.dumps (orjson when installed, stdlib otherwise)"""
+    def dumps(self, obj, **kwargs):
+        return dumps(obj).decode('utf-8')
 
 app = Flask(__name__, static_folder='static', static_url_path='/static')
+app.json = FastJSONProvider(app)
 CORS(app)  # Enable CORS for all routes
 
+# Cache-Control for JSON responses. With both at 0 clients revalidate every time
+# (cheap: a matching ETag is answered with 304 before any query runs).
+app.config['JSON_MAX_AGE'] = int(os.environ.get('JSON_MAX_AGE', 0))
+app.config['JSON_STALE_WHILE_REVALIDATE'] = int(os.environ.get('JSON_STALE_WHILE_REVALIDATE', 0))
+
+# Serialized JSON responses, dropped whenever the database write version moves
+# (RESPONSE_CACHE_SIZE=0 disables it)
+response_cache = ResponseCache(
+    max_entries=int(os.environ.get('RESPONSE_CACHE_SIZE', 256)),
+    ttl=int(os.environ.get('RESPONSE_CACHE_TTL', 300))
+)
+
+# Response headers worth replaying from the cache (Content-Length is recomputed)
+CACHED_HEADERS = ('Content-Type', 'Content-Encoding', 'Vary', 'X-Total-Count', 'X-Next-Cursor', 'Link')
+
+# Per-route request metrics, exposed at /metrics. Under gunicorn each worker
+# writes its totals to METRICS_DIR (set in gunicorn.conf.py) so /metrics can
+# sum them; without it only this process is counted.
+metrics = Metrics(os.environ.get('METRICS_DIR'))
+app.wsgi_app = MetricsMiddleware(app.wsgi_app, metrics)
+
+# Minified, fingerprinted JS/CSS from build_assets.py; templates link them
+# with asset_url() and fall back to the source files when there is no build
+assets = StaticAssets(app.static_folder, app.static_url_path)
+app.jinja_env.globals.update(asset_url=assets.url, asset_built=assets.built)
+
+app.config['DATABASE'] = os.environ.get('YC_DB_PATH', 'yc_companies.db')
+# Production workers only read; schema setup runs once in the gunicorn master
+app.config['DB_READ_ONLY'] = os.environ.get('DB_READ_ONLY') == '1'
+
+_schema_ready = False
+
+def prepare_database():
+    """Set up derived columns, rollups, side tables and triggers (needs write access)"""
+    global _schema_ready
+    conn = sqlite3.connect(app.config['DATABASE'])
+    try:
+        setup_display_names(conn)
+        setup_stats_rollup(conn)
+        setup_company_changes(conn)
+        offload_texts(conn)
+        setup_company_facets(conn)
+        setup_db_version(conn)
+    finally:
+        conn.close()
+    _schema_ready = True
+
 def get_db_connection():
-    """Get database connection"""
-    conn = sqlite3.connect('yc_companies.db')
+    """Get database connection (derived columns and rollups are set up once per process)"""
+    if not _schema_ready:
+        prepare_database()
+    if app.config['DB_READ_ONLY']:
+        conn = sqlite3.connect(f"file:{app.config['DATABASE']}?mode=ro", uri=True, factory=TimedConnection)
+    else:
+        conn = sqlite3.connect(app.config['DATABASE'], factory=TimedConnection)
     conn.row_factory = sqlite3.Row
     return conn
 
+def _json_cache_control():
+    max_age = app.config['JSON_MAX_AGE']
+    stale = app.config['JSON_STALE_WHILE_REVALIDATE']
+    if not max_age and not stale:
+        return 'no-cache'
+    value = f'public, max-age={max_age}'
+    if stale:
+        value += f', stale-while-revalidate={stale}'
+    return value
+
+def versioned(view):
+    """Conditional GET and response caching for a JSON view
+
+    The ETag is derived from the database write version plus the route and
+    its normalized query args, so If-None-Match is answered with 304 without
+    running the view's queries. Otherwise the serialized (and compressed)
+    body is served from response_cache while the version is unchanged.
+    """
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        conn = get_db_connection()
+        version = read_db_version(conn)
+        conn.close()
+        
+        args_key = tuple(sorted(request.args.items(multi=True)))
+        etag_key = json.dumps([version, request.path, args_key])
+        etag = hashlib.sha1(etag_key.encode('utf-8')).hexdigest()[:20]
+        
+        if request.if_none_match.contains_weak(etag):
+            response = make_response('', 304)
+        else:
+            cache_key = (request.path, args_key, negotiate_encoding(request.headers.get('Accept-Encoding')))
+            entry = response_cache.get(cache_key, version) if response_cache.enabled else None
+            if entry is not None:
+                response = Response(entry.body, status=entry.status, headers=entry.headers)
+                response.headers['X-Cache'] = 'HIT'
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                response = _compress_response(response)
+                if response_cache.enabled:
+                    _cache_response(response, cache_key, version)
+                response.headers['X-Cache'] = 'MISS'
+        response.set_etag(etag, weak=True)
+        response.headers['Cache-Control'] = _json_cache_control()
+        return response
+    return wrapper
+
+def _cache_response(response, key, version):
+    """Store a finished response in response_cache (streamed bodies once fully sent)"""
+    headers = [(name, value) for name, value in response.headers if name in CACHED_HEADERS]
+    if response.is_streamed:
+        response.response = response_cache.tee(key, version, response.response, headers)
+    else:
+        response_cache.put(key, version, response.get_data(), headers)
+
+# Rows rendered into the table page itself; the rest is streamed in by table.js
+FIRST_PAGE_ROWS = 100
+
 @app.route('/')
 def index():
-    """Main table view page"""
-    return render_template('index.html')
-
-@app.route('/api/companies')
-def get_companies():
-    """Get all companies"""
+    """Main table view page, with the first page of rows and the stats inlined"""
+    fields = list(DEFAULT_COMPANY_FIELDS) + ['founder_count']
     conn = get_db_connection()
+    try:
+        stats = read_stats(conn)
+        # Read before the rows: changes landing in between are picked up by the next sync
+        version = current_version(conn)
+        conn.row_factory = None
+        query, params = _page_sql(fields, COMPANY_FIELDS, 'companies', LISTED_COMPANY, [],
+                                  COMPANY_SORTS['name'], False, None, FIRST_PAGE_ROWS)
+        rows = [row[:len(fields)] for row in conn.execute(query, params).fetchall()[:FIRST_PAGE_ROWS]]
+    finally:
+        conn.close()
     
-    # Get query parameters
-    search = request.args.get('search', '')
-    limit = request.args.get('limit', type=int)
+    columns = fields + ['founders']
+    companies = [dict(zip(columns, row)) for row in _with_founders(0, rows, ('id', 'name', 'role'))]
+    return render_template('index.html', bootstrap={'version': version, 'stats': stats, 'companies': companies})
+
+# fields= projections for the list endpoints (name -> SQL expression)
+COMPANY_FIELDS = {
+    'id': 'id',
+    'name': 'display_name',
+    'batch': 'batch',
+    'location': 'location',
+    'industry': 'industry',
+    'website': 'website',
+    'yc_url': 'yc_url',
+    'is_hiring': 'is_hiring',
+    'founder_count': 'founder_count',
+}
+DEFAULT_COMPANY_FIELDS = ('id', 'name', 'batch', 'location', 'industry', 'website', 'yc_url', 'is_hiring')
+
+# sort= keys for company lists; every key ends in unique columns so keyset cursors are stable
+COMPANY_SORTS = {
+    'name': ('sort_name', 'id'),
+    'batch': ('batch', 'sort_name', 'id'),
+    'founders': ('founder_count', 'sort_name', 'id'),
+}
+
+# Most companies one ?ids= (details) or ?id= (list filter) request may name
+MAX_DETAIL_IDS = 100
+
+FOUNDER_FIELDS = {
+    'id': 'f.id',
+    'company_id': 'f.company_id',
+    'company_name': 'f.company_name',
+    'name': 'f.name',
+    'role': 'f.role',
+    'previous_company': 'f.previous_company',
+    'linkedin_url': 'f.linkedin_url',
+    'twitter_url': 'f.twitter_url',
+    'yc_profile_url': 'f.yc_profile_url',
+    'created_at': 'f.created_at',
+    'company_display_name': 'c.display_name',
+    'bio': 'unpack_text(t.bio, t.compressed)',
+}
+DEFAULT_FOUNDER_FIELDS = tuple(field for field in FOUNDER_FIELDS if field != 'bio')
+
+def _paged_query(conn, fields, field_sql, from_sql, count_from_sql, where, params, sort_columns,
+                 descending=False):
+    """Run a keyset-paginated list query for the current request
+
+    ?page_size= (or the older ?limit=) sets the page size and ?after= takes the
+    cursor from the previous page. Without either the whole list is returned,
+    lazily: rows is then a generator reading the cursor row by row.
+    Rows are plain tuples in `fields` order (no per-row dicts).
+    Takes ownership of conn. Returns (rows, total, next_cursor).
+    """
+    try:
+        after = request.args.get('after')
+        page_size = parse_page_size(
+            request.args.get('page_size', type=int) or request.args.get('limit', type=int),
+            default=DEFAULT_PAGE_SIZE if after else None
+        )
+        
+        conn.row_factory = None
+        total = conn.execute(f'SELECT COUNT(*) FROM {count_from_sql} WHERE {where}', params).fetchone()[0]
+        query, query_params = _page_sql(fields, field_sql, from_sql, where, params, sort_columns,
+                                        descending, after, page_size)
+        
+        if not page_size:
+            return _iter_rows(conn, conn.execute(query, query_params)), total, None
+        rows = conn.execute(query, query_params).fetchall()
+    except Exception:
+        conn.close()
+        raise
+    conn.close()
+    
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        # The sort key columns are selected after the requested fields
+        next_cursor = encode_cursor(rows[-1][len(fields):])
+    
+    return [row[:len(fields)] for row in rows], total, next_cursor
+
+def _iter_rows(conn, cursor):
+    """Yield rows from an open cursor, closing the connection when done"""
+    try:
+        yield from cursor
+    finally:
+        conn.close()
+
+def _page_sql(fields, field_sql, from_sql, where, params, sort_columns, descending, after, page_size):
+    """Build the SELECT for one page (or the whole list when page_size is None)
+
+    Paged queries also select the sort key columns, which the next cursor is built from.
+    """
+    query_params = list(params)
+    if after:
+        condition, cursor_params = keyset_condition(
+            sort_columns, decode_cursor(after, len(sort_columns)), descending
+        )
+        where += f' AND {condition}'
+        query_params += cursor_params
     
-    query = '''
-        SELECT id, name, batch, location, industry, website, yc_url, is_hiring
-        FROM companies 
-        WHERE yc_url LIKE "%/companies/%" 
-        AND yc_url NOT LIKE "%?%" 
-        AND yc_url NOT LIKE "%industry=%" 
-        AND yc_url NOT LIKE "%batch=%"
-    '''
+    select = ', '.join(f'{field_sql[field]} AS {field}' for field in fields)
+    if page_size:
+        select += ', ' + ', '.join(sort_columns)
+    direction = ' DESC' if descending else ''
+    order_by = ', '.join(column + direction for column in sort_columns)
+    query = f'SELECT {select} FROM {from_sql} WHERE {where} ORDER BY {order_by}'
+    if page_size:
+        # One extra row tells us whether there is a next page
+        query += ' LIMIT ?'
+        query_params.append(page_size + 1)
     
+    return query, query_params
+
+def _paged_response(columns, rows, total, next_cursor):
+    """List response with the pagination headers
+
+    Streamed JSON array of objects by default, NDJSON with ?format=ndjson, or
+    one array per column with ?format=columns (smallest payload).
+    """
+    output = request.args.get('format', 'json')
+    if output == 'ndjson':
+        response = Response(iter_ndjson(columns, rows), mimetype='application/x-ndjson')
+    elif output == 'columns':
+        response = Response(columnar_json(columns, rows), mimetype='application/json')
+    elif output == 'json':
+        response = Response(iter_json_array(columns, rows), mimetype='application/json')
+    else:
+        close = getattr(rows, 'close', None)
+        if close is not None:
+            close()
+        return jsonify({'error': f'unknown format: {output} (available: json, ndjson, columns)'}), 400
+    response.headers['X-Total-Count'] = str(total)
+    if next_cursor:
+        args = request.args.copy()
+        args['after'] = next_cursor
+        response.headers['X-Next-Cursor'] = next_cursor
+        response.headers['Link'] = f'<{request.path}?{urlencode(list(args.items(multi=True)))}>; rel="next"'
+    return response
+
+# Name search matches the cleaned name and the raw scraped one
+NAME_SEARCH = '(display_name LIKE ? OR name LIKE ?)'
+
+def _company_filters():
+    """(where, params) for the listed companies matching ?search= and the facet filters"""
+    where = LISTED_COMPANY
     params = []
+    search = request.args.get('search', '')
     if search:
-        query += ' AND name LIKE ?'
-        params.append(f'%{search}%')
+        where += f' AND {NAME_SEARCH}'
+        params += [f'%{search}%'] * 2
+    condition, condition_params = facet_condition(parse_facet_filters(request.args))
+    if condition:
+        where += f' AND {condition}'
+        params += condition_params
+    ids = request.args.getlist('id', type=int)
+    if ids:
+        if len(ids) > MAX_DETAIL_IDS:
+            raise ValueError(f'too many ids: {len(ids)} (max {MAX_DETAIL_IDS})')
+        where += f" AND id IN ({','.join(['?'] * len(ids))})"
+        params += ids
+    return where, params
+
+def _company_list_query(fields):
+    """Run the paged company list query for the current request
+
+    (?search=&batch=&industry=&location=&is_hiring=&sort=&page_size=&after=)
+    """
+    sort, descending = parse_sort(request.args.get('sort'), COMPANY_SORTS, 'name')
+    where, params = _company_filters()
+    
+    return _paged_query(
+        get_db_connection(), fields, COMPANY_FIELDS, 'companies', 'companies', where, params,
+        COMPANY_SORTS[sort], descending
+    )
+
+@app.route('/api/companies')
+@versioned
+def get_companies():
+    """Get companies (?search=&batch=&industry=&location=&is_hiring=&id=&sort=&fields=&page_size=&after=)
+
+    Repeat a filter parameter to match any of several values (?batch=W24&batch=S24).
+    ?id=1&id=2 limits the list to those companies (e.g. to refresh changed rows).
+    ?ids=1,2,3 instead returns the full details (description, founders with bios)
+    of those companies, like /api/companies/<id> for several ids in one request.
+    """
+    if 'ids' in request.args:
+        return _company_details_response(request.args['ids'])
     
-    query += ' ORDER BY name'
+    try:
+        fields = parse_fields(request.args.get('fields'), COMPANY_FIELDS, DEFAULT_COMPANY_FIELDS)
+        companies, total, next_cursor = _company_list_query(fields)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
-    if limit:
-        query += f' LIMIT {limit}'
+    return _paged_response(fields, companies, total, next_cursor)
+
+@app.route('/api/companies/with-founders')
+@versioned
+def get_companies_with_founders():
+    """Get companies with their founders embedded (same params as /api/companies)
+
+    ?founders=names (default) embeds id/name/role per founder, ?founders=full
+    embeds every founder field except the bio.
+    """
+    mode = request.args.get('founders', 'names')
+    if mode not in ('names', 'full'):
+        return jsonify({'error': f'unknown founders mode: {mode} (available: names, full)'}), 400
     
-    cursor = conn.execute(query, params)
-    companies = [dict(row) for row in cursor.fetchall()]
+    try:
+        fields = parse_fields(request.args.get('fields'), COMPANY_FIELDS, DEFAULT_COMPANY_FIELDS)
+        if 'id' not in fields:
+            fields = ['id'] + fields
+        fields = list(dict.fromkeys(fields + ['founder_count']))
+        companies, total, next_cursor = _company_list_query(fields)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
-    # Clean company names
-    for company in companies:
-        if company['name']:
-            company['name'] = company['name'].split('\n')[0]
+    founder_fields = ('id', 'name', 'role') if mode == 'names' else DEFAULT_FOUNDER_FIELDS
+    return _paged_response(fields + ['founders'], _with_founders(fields.index('id'), companies, founder_fields),
+                           total, next_cursor)
+
+@app.route('/api/companies/facets')
+@versioned
+def get_company_facets():
+    """Counts per batch/industry/location/is_hiring value for the current filters
+
+    Takes the same ?search= and filter parameters as /api/companies. A facet's
+    counts ignore that facet's own filter, so each value's count is what
+    selecting it (too) would match. ?facet_limit= caps values per facet.
+    """
+    try:
+        filters = parse_facet_filters(request.args)
+        limit = request.args.get('facet_limit', DEFAULT_FACET_LIMIT, type=int)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
-    conn.close()
-    return jsonify(companies)
+    search = request.args.get('search', '')
+    conn = get_db_connection()
+    try:
+        counts = facet_counts(conn, filters,
+                              NAME_SEARCH if search else '',
+                              [f'%{search}%'] * 2 if search else [],
+                              limit=max(1, limit))
+    finally:
+        conn.close()
+    return jsonify({'filters': filters, 'facets': counts})
+
+def _with_founders(id_index, companies, founder_fields, batch_size=500):
+    """Append a founders list to each company row, one join on the founders company_id index per batch"""
+    select = ', '.join(f'{FOUNDER_FIELDS[field]} AS {field}' for field in founder_fields)
+    conn = get_db_connection()
+    conn.row_factory = None
+    try:
+        companies = iter(companies)
+        while True:
+            batch = list(itertools.islice(companies, batch_size))
+            if not batch:
+                break
+            by_company = {company[id_index]: [] for company in batch}
+            rows = conn.execute(f'''
+                SELECT f.company_id AS _company_id, {select}
+                FROM json_each(?) page
+                JOIN founders f ON f.company_id = page.value
+                LEFT JOIN companies c ON c.id = f.company_id
+                ORDER BY f.company_id, f.id
+            ''', (json.dumps(list(by_company)),))
+            for row in rows:
+                by_company[row[0]].append(dict(zip(founder_fields, row[1:])))
+            for company in batch:
+                yield company + (by_company[company[id_index]],)
+    finally:
+        conn.close()
+        close = getattr(companies, 'close', None)
+        if close is not None:
+            close()
+
+def _company_details(conn, company_ids):
+    """Full company rows with description and founders (bios included), in company_ids order
+
+    Three queries for any number of ids; unknown ids are skipped.
+    """
+    ids = json.dumps(list(company_ids))
+    companies = {row['id']: dict(row) for row in conn.execute(
+        'SELECT c.* FROM json_each(?) page JOIN companies c ON c.id = page.value', (ids,)
+    )}
+    founders = [dict(founder) for founder in conn.execute('''
+        SELECT f.* FROM json_each(?) page
+        JOIN founders f ON f.company_id = page.value
+        ORDER BY f.company_id, f.id
+    ''', (ids,))]
+    
+    # Long texts live in side tables and are only loaded here
+    bios = load_founder_bios(conn, [founder['id'] for founder in founders])
+    descriptions = load_company_descriptions(conn, companies)
+    for company_id, company in companies.items():
+        company['description'] = descriptions.get(company_id)
+        company['founders'] = []
+    for founder in founders:
+        founder['bio'] = bios.get(founder['id'])
+        companies[founder['company_id']]['founders'].append(founder)
+    
+    return [companies[company_id] for company_id in dict.fromkeys(company_ids) if company_id in companies]
+
+def _parse_ids(value):
+    """Company ids from ?ids=1,2,3"""
+    try:
+        ids = [int(part) for part in value.split(',') if part.strip()]
+    except ValueError:
+        raise ValueError(f'invalid ids: {value} (use comma-separated integers)')
+    if len(ids) > MAX_DETAIL_IDS:
+        raise ValueError(f'too many ids: {len(ids)} (max {MAX_DETAIL_IDS})')
+    return ids
+
+def _company_details_response(value):
+    """Details for ?ids=, as a JSON array in the requested order"""
+    try:
+        ids = _parse_ids(value)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    conn = get_db_connection()
+    try:
+        return jsonify(_company_details(conn, ids))
+    finally:
+        conn.close()
 
 @app.route('/api/companies/<int:company_id>')
+@versioned
 def get_company(company_id):
     """Get single company details"""
     conn = get_db_connection()
-    company = conn.execute(
-        'SELECT * FROM companies WHERE id = ?', (company_id,)
-    ).fetchone()
-    
-    if company:
-        # Get founders for this company
-        founders = conn.execute(
-            'SELECT * FROM founders WHERE company_id = ?', (company_id,)
-        ).fetchall()
-        
-        result = dict(company)
-        result['founders'] = [dict(founder) for founder in founders]
+    try:
+        details = _company_details(conn, [company_id])
+    finally:
         conn.close()
-        return jsonify(result)
     
-    conn.close()
+    if details:
+        return jsonify(details[0])
     return jsonify({'error': 'Company not found'}), 404
 
-def _get_founders_data():
-    """Helper function to get founders data"""
+@app.route('/api/founders/<int:founder_id>')
+@versioned
+def get_founder(founder_id):
+    """Get single founder with bio and company display name"""
     conn = get_db_connection()
-    
+    try:
+        founder = conn.execute('''
+            SELECT f.*, c.display_name AS company_display_name
+            FROM founders f
+            LEFT JOIN companies c ON c.id = f.company_id
+            WHERE f.id = ?
+        ''', (founder_id,)).fetchone()
+        if founder is None:
+            return jsonify({'error': 'Founder not found'}), 404
+        result = dict(founder)
+        result['bio'] = load_founder_bios(conn, [founder_id]).get(founder_id)
+    finally:
+        conn.close()
+    return jsonify(result)
+
+def _get_founders_data():
+    """Helper function to get founders data (bios only with ?include=bio or fields=bio)
+
+    Returns (fields, rows, total, next_cursor).
+    """
     search = request.args.get('search', '')
     company_filter = request.args.get('company', '')
     
-    query = '''
-        SELECT f.*, c.name as company_display_name
-        FROM founders f
-        LEFT JOIN companies c ON f.company_id = c.id
-        WHERE 1=1
-    '''
+    default_fields = DEFAULT_FOUNDER_FIELDS
+    if 'bio' in request.args.get('include', '').split(','):
+        default_fields += ('bio',)
+    fields = parse_fields(request.args.get('fields'), FOUNDER_FIELDS, default_fields)
     
+    where = '1=1'
     params = []
     if search:
-        query += ' AND f.name LIKE ?'
+        where += ' AND f.name LIKE ?'
         params.append(f'%{search}%')
     
     if company_filter:
-        query += ' AND f.company_name LIKE ?'
+        where += ' AND f.company_name LIKE ?'
         params.append(f'%{company_filter}%')
     
-    query += ' ORDER BY f.company_name, f.name'
+    # Only join what the projection needs
+    from_sql = 'founders f'
+    if 'company_display_name' in fields:
+        from_sql += ' LEFT JOIN companies c ON f.company_id = c.id'
     
-    cursor = conn.execute(query, params)
-    founders = [dict(row) for row in cursor.fetchall()]
-    
-    conn.close()
-    return founders
+    conn = get_db_connection()
+    if 'bio' in fields:
+        register_text_functions(conn)
+        from_sql += ' LEFT JOIN founder_texts t ON t.founder_id = f.id'
+    return (fields, *_paged_query(
+        conn, fields, FOUNDER_FIELDS, from_sql, 'founders f', where, params,
+        ('f.company_name', 'f.name', 'f.id')
+    ))
+
+def _founders_response():
+    try:
+        fields, founders, total, next_cursor = _get_founders_data()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return _paged_response(fields, founders, total, next_cursor)
 
 @app.route('/api/members')
+@versioned
 def get_members():
     """Get all team members (deprecated - use /api/founders)"""
-    founders = _get_founders_data()
-    return jsonify(founders)
+    return _founders_response()
 
 @app.route('/api/founders')
+@versioned
 def get_founders():
-    """Get all founders"""
-    founders = _get_founders_data()
-    return jsonify(founders)
+    """Get founders (?search=&company=&include=bio&fields=&page_size=&after=)"""
+    return _founders_response()
 
 @app.route('/api/stats')
+@versioned
 def get_stats():
-    """Get statistics"""
+    """Get statistics (read from the trigger-maintained rollup)"""
     conn = get_db_connection()
+    stats = read_stats(conn)
+    conn.close()
     
-    # Total companies
-    total_companies = conn.execute(
-        'SELECT COUNT(*) FROM companies WHERE yc_url LIKE "%/companies/%" AND yc_url NOT LIKE "%?%"'
-    ).fetchone()[0]
-    
-    # Companies with founders
-    companies_with_founders = conn.execute(
-        'SELECT COUNT(DISTINCT company_name) FROM founders'
-    ).fetchone()[0]
-    
-    # Total founders
-    total_founders = conn.execute('SELECT COUNT(*) FROM founders').fetchone()[0]
-    
-    # Companies by batch
-    batch_stats = conn.execute('''
-        SELECT batch, COUNT(*) as count 
-        FROM companies 
-        WHERE batch IS NOT NULL AND batch != ''
-        GROUP BY batch
-        ORDER BY count DESC
-    ''').fetchall()
-    
-    # Top companies by founder count
-    top_companies = conn.execute('''
-        SELECT company_name, COUNT(*) as founder_count
-        FROM founders
-        GROUP BY company_name
-        ORDER BY founder_count DESC
-        LIMIT 10
-    ''').fetchall()
+    return jsonify(stats)
+
+@app.route('/api/changes')
+@versioned
+def get_changes():
+    """Get company changes since a version (?since=<version>&limit=1000)
+
+    ?limit=0 returns just the current version; other limits are clamped to 1-5000.
+    """
+    since = request.args.get('since', 0, type=int)
+    limit = request.args.get('limit', 1000, type=int)
+    if limit != 0:
+        limit = max(1, min(limit, 5000))
     
+    conn = get_db_connection()
+    changes = read_changes(conn, since=since, limit=limit)
     conn.close()
     
-    return jsonify({
-        'total_companies': total_companies,
-        'companies_with_founders': companies_with_founders,
-        'total_founders': total_founders,
-        'batch_stats': [dict(row) for row in batch_stats],
-        'top_companies': [dict(row) for row in top_companies]
-    })
+    return jsonify(changes)
+
+# /api/progress/stream polls the small scrape_progress table this often
+# (seconds), sends a keepalive comment when nothing changed for
+# PROGRESS_KEEPALIVE seconds and ends after PROGRESS_STREAM_SECONDS so a
+# client doesn't hold a worker thread for good (EventSource reconnects)
+PROGRESS_POLL_INTERVAL = 1.0
+PROGRESS_KEEPALIVE = 15
+PROGRESS_STREAM_SECONDS = 300
+PROGRESS_RETRY_MS = 2000
+
+def _progress_events():
+    """Server-sent event stream: the current runs first, then every progress update"""
+    conn = get_db_connection()
+    try:
+        yield f'retry: {PROGRESS_RETRY_MS}\n\n'
+        since = None
+        running = {}  # run_id -> last event sent, to notice killed scrapers
+        last_sent = started = time.monotonic()
+        while time.monotonic() - started < PROGRESS_STREAM_SECONDS:
+            events = read_progress(conn, since)
+            for event in events:
+                since = max(since or 0, event['updated_at'])
+            if since is None:
+                since = time.time()
+            
+            seen = {event['run_id'] for event in events}
+            for run_id, event in list(running.items()):
+                if run_id not in seen and not pid_alive(event['pid']):
+                    events.append(dict(event, status='stopped', eta_seconds=None))
+            
+            for event in events:
+                if event['status'] == 'running':
+                    running[event['run_id']] = event
+                else:
+                    running.pop(event['run_id'], None)
+                yield f"event: progress\ndata: {dumps(event).decode('utf-8')}\n\n"
+            
+            now = time.monotonic()
+            if events:
+                last_sent = now
+            elif now - last_sent >= PROGRESS_KEEPALIVE:
+                yield ': keepalive\n\n'
+                last_sent = now
+            time.sleep(PROGRESS_POLL_INTERVAL)
+    finally:
+        conn.close()
+
+@app.route('/api/progress/stream')
+def progress_stream():
+    """Scrape progress as server-sent events (companies done, items found, rate, ETA, errors)
+
+    Reads only the scrape_progress table the scrapers keep up to date, never
+    the main tables. Not cached, compressed or versioned; /metrics times it
+    until the headers are sent rather than for the life of the stream.
+    """
+    request.environ['metrics.stream'] = True
+    response = Response(_progress_events(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # don't let a proxy buffer the events
+    return response
+
+@app.route('/api/cache')
+def get_cache_stats():
+    """Response cache counters (hits, misses, evictions, invalidations, size)"""
+    return jsonify(response_cache.stats())
+
+@app.route('/service-worker.js')
+def service_worker():
+    """Service worker for the table page, served from the root so its scope is the whole site"""
+    built = assets.built('js/service_worker.js')
+    if built:
+        response = send_from_directory(assets.dist_folder, built)
+    else:
+        response = send_from_directory(os.path.join(app.static_folder, 'js'), 'service_worker.js')
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.route('/static/dist/<path:filename>')
+def dist_asset(filename):
+    """Built assets: precompressed (br/gzip) and cached for good, since their names carry a content hash"""
+    return assets.send(filename)
+
+@app.route('/metrics')
+def get_metrics():
+    """Request metrics in Prometheus text format (all workers)"""
+    return Response(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
 
 @app.route('/companies')
 def companies_page():
@@ -183,14 +717,51 @@ def members_page():
     """Team members listing page"""
     return render_template('members.html')
 
+def _compress_response(response):
+    """gzip/deflate JSON responses the client accepts, streaming ones chunk by chunk"""
+    if (response.status_code != 200 or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in ('application/json', 'application/x-ndjson')):
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = negotiate_encoding(request.headers.get('Accept-Encoding'))
+    if encoding is None:
+        return response
+    
+    if response.is_streamed:
+        response.response = iter_compressed(response.response, encoding)
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < COMPRESS_MIN_BYTES:
+            return response
+        response.set_data(compress_bytes(data, encoding))
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+@app.before_request
+def before_request():
+    # Metrics are labelled with the URL rule, not the raw path
+    request.environ['metrics.route'] = request.url_rule.rule if request.url_rule else 'unmatched'
+    g.request_start = time.perf_counter()
+
 @app.after_request
 def after_request(response):
     """Add headers to prevent caching issues"""
+    response = _compress_response(response)
+    # Time until the headers are ready; streamed bodies keep running after this
+    app_ms = (time.perf_counter() - g.get('request_start', time.perf_counter())) * 1000
+    response.headers['Server-Timing'] = f'sql;dur={request_sql_time() * 1000:.1f}, app;dur={app_ms:.1f}'
+    if 'X-Cache' in response.headers:
+        response.headers.add('Server-Timing', f'cache;desc={response.headers["X-Cache"]}')
     response.headers.add('Access-Control-Allow-Origin', '*')
     response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
     response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
+    response.headers.add('Access-Control-Expose-Headers', 'X-Total-Count,X-Next-Cursor,Link')
+    response.headers['Timing-Allow-Origin'] = '*'
     return response
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5001)  # Changed from 5000
+    # Development server; use `python3 start_server.py --production` (gunicorn) to serve for real
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=5001)  # Changed from 5000
 
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON serialization per endpoint
+Serves each list endpoint as objects (?format=json) and as per-column arrays
+(?format=columns) with the stdlib encoder and with orjson, reporting the
+median response time and the plain/gzip body sizes
+"""
+
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ENDPOINTS = ('/api/companies', '/api/companies/with-founders', '/api/founders', '/api/stats')
+FORMATS = ('json', 'columns')
+ENCODERS = ('stdlib', 'orjson')
+
+
+def run_encoder(db_dir, repeat):
+    """Time every endpoint/format in this process and print the results as JSON"""
+    os.chdir(db_dir)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import app as app_module
+
+    client = app_module.app.test_client()
+    client.get('/api/stats')  # schema checks happen outside the measurement
+    results = []
+    for endpoint in ENDPOINTS:
+        for output in FORMATS:
+            if endpoint == '/api/stats' and output != 'json':
+                continue
+            url = f'{endpoint}?format={output}'
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                body = client.get(url).get_data()
+                timings.append((time.perf_counter() - start) * 1000)
+            gzipped = client.get(url, headers={'Accept-Encoding': 'gzip'}).get_data()
+            results.append({
+                'url': url,
+                'ms': statistics.median(timings),
+                'bytes': len(body),
+                'gzip_bytes': len(gzipped),
+            })
+    print(json.dumps(results))
+
+
+def run_benchmark(companies=5000, repeat=5):
+    from benchmark_text_storage import build_database
+
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Building synthetic database with {companies} companies...")
+        build_database(os.path.join(tmp, 'yc_companies.db'), companies)
+
+        results = {}
+        for encoder in ENCODERS:
+            # The response cache would turn every repeat into a cache hit
+            env = dict(os.environ, JSON_ENCODER=encoder, RESPONSE_CACHE_SIZE='0')
+            output = subprocess.run([sys.executable, __file__, '--encoder', tmp, str(repeat)],
+                                    env=env, check=True, capture_output=True, text=True).stdout
+            results[encoder] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"\n{'endpoint':<45} {'stdlib ms':>10} {'orjson ms':>10} {'KB':>8} {'gzip KB':>8}")
+    for stdlib, fast in zip(results['stdlib'], results['orjson']):
+        print(f"{stdlib['url']:<45} {stdlib['ms']:>10.1f} {fast['ms']:>10.1f} "
+              f"{stdlib['bytes'] / 1024:>8.0f} {stdlib['gzip_bytes'] / 1024:>8.0f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--encoder':
+        run_encoder(sys.argv[2], int(sys.argv[3]))
+    else:
+        run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Load test: Flask dev server vs gunicorn (gunicorn.conf.py)
+Starts both servers on a synthetic database, drives the same request mix at
+each from several client processes and reports throughput and latency
+Usage: python3 benchmark_serving.py [seconds] [clients] [--cache]
+"""
+
+import multiprocessing
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import requests
+
+REPO = os.path.dirname(os.path.abspath(__file__))
+COMPANIES = 5000
+
+# The request mix of a dashboard + table page view
+URLS = (
+    '/api/stats',
+    '/api/companies?page_size=50',
+    '/api/companies/with-founders?page_size=50&sort=-founders',
+    '/api/founders?page_size=50',
+    '/api/companies/{id}',
+)
+
+
+def _client(base_url, seconds, threads, results):
+    """One client process: `threads` keep-alive sessions issuing requests until time is up"""
+    import threading
+
+    latencies, errors = [], []
+
+    def run():
+        session = requests.Session()
+        rng = random.Random()
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            url = base_url + rng.choice(URLS).format(id=rng.randint(1, COMPANIES))
+            start = time.perf_counter()
+            try:
+                response = session.get(url, headers={'Accept-Encoding': 'gzip'}, timeout=30)
+                response.content
+                if response.status_code != 200:
+                    errors.append(response.status_code)
+            except requests.RequestException as e:
+                errors.append(str(e))
+                continue
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    results.put((latencies, len(errors)))
+
+
+def load_test(base_url, seconds, clients):
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=_client, args=(base_url, seconds, 4, results))
+                 for _ in range(clients)]
+    for process in processes:
+        process.start()
+    latencies, errors = [], 0
+    for _ in processes:
+        process_latencies, process_errors = results.get()
+        latencies += process_latencies
+        errors += process_errors
+    for process in processes:
+        process.join()
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'rps': len(latencies) / seconds,
+        'p50': statistics.median(latencies) if latencies else 0,
+        'p95': latencies[int(len(latencies) * 0.95)] if latencies else 0,
+        'errors': errors,
+    }
+
+
+def _wait_until_up(base_url, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(base_url + '/api/stats', timeout=2).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f'server at {base_url} did not start')
+
+
+def _serve(name, command, env, cwd, base_url, seconds, clients):
+    server = subprocess.Popen(command, env=env, cwd=cwd,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        _wait_until_up(base_url)
+        print(f"Load testing {name} for {seconds}s...")
+        return load_test(base_url, seconds, clients)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def run_benchmark(seconds=10, clients=4, cache=False):
+    from benchmark_text_storage import build_database
+
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Building synthetic database with {COMPANIES} companies...")
+        build_database(os.path.join(tmp, 'yc_companies.db'), COMPANIES)
+
+        env = dict(os.environ, PYTHONPATH=REPO, GUNICORN_PIDFILE=os.path.join(tmp, 'gunicorn.pid'))
+        if not cache:
+            env['RESPONSE_CACHE_SIZE'] = '0'
+
+        results = {
+            'flask dev server': _serve(
+                'flask dev server',
+                [sys.executable, '-c', 'from app import app; app.run(port=5091, threaded=True)'],
+                env, tmp, 'http://127.0.0.1:5091', seconds, clients
+            ),
+            'gunicorn': _serve(
+                'gunicorn',
+                [sys.executable, '-m', 'gunicorn', '-c', os.path.join(REPO, 'gunicorn.conf.py'), 'app:app'],
+                dict(env, BIND='127.0.0.1:5092'), tmp, 'http://127.0.0.1:5092', seconds, clients
+            ),
+        }
+
+    print(f"\n{'':<18} {'requests':>9} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'errors':>7}")
+    for name, result in results.items():
+        print(f"{name:<18} {result['requests']:>9} {result['rps']:>8.0f} "
+              f"{result['p50']:>8.1f} {result['p95']:>8.1f} {result['errors']:>7}")
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    run_benchmark(
+        seconds=int(args[0]) if args else 10,
+        clients=int(args[1]) if len(args) > 1 else 4,
+        cache='--cache' in sys.argv
+    )
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark buffered vs streamed /api/founders responses
+Builds a synthetic database (~100k founders by default), then serves the full
+founders list once per mode in a fresh process and reports time to first
+byte, total time and peak RSS
+"""
+
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+MODES = ('buffered', 'streamed', 'streamed+gzip')
+
+
+def _peak_rss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _buffered(app, client):
+    """The previous implementation: fetchall() into dicts, then jsonify"""
+    from app import get_db_connection
+    from flask import jsonify
+
+    start = time.perf_counter()
+    with app.test_request_context('/api/founders'):
+        conn = get_db_connection()
+        rows = conn.execute('''
+            SELECT f.*, c.display_name as company_display_name
+            FROM founders f
+            LEFT JOIN companies c ON f.company_id = c.id
+            ORDER BY f.company_name, f.name
+        ''').fetchall()
+        body = jsonify([dict(row) for row in rows]).get_data()
+        conn.close()
+    elapsed = time.perf_counter() - start
+    # Nothing can be sent before the whole body exists
+    return elapsed, elapsed, len(body)
+
+
+def _streamed(app, client, headers=None):
+    start = time.perf_counter()
+    response = client.get('/api/founders', headers=headers or {}, buffered=False)
+    chunks = iter(response.response)
+    first = next(chunks)
+    ttfb = time.perf_counter() - start
+    size = len(first) + sum(len(chunk) for chunk in chunks)
+    response.close()
+    return ttfb, time.perf_counter() - start, size
+
+
+def run_mode(mode, db_dir):
+    """Serve the founders list once in this process and print the measurements as JSON"""
+    os.chdir(db_dir)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import app as app_module
+
+    app_module.get_db_connection().close()  # schema checks happen outside the measurement
+    client = app_module.app.test_client()
+    baseline = _peak_rss_kb()
+
+    if mode == 'buffered':
+        ttfb, total, size = _buffered(app_module.app, client)
+    elif mode == 'streamed':
+        ttfb, total, size = _streamed(app_module.app, client)
+    else:
+        ttfb, total, size = _streamed(app_module.app, client, {'Accept-Encoding': 'gzip'})
+
+    print(json.dumps({
+        'ttfb_ms': ttfb * 1000,
+        'total_ms': total * 1000,
+        'bytes': size,
+        'peak_rss_mb': _peak_rss_kb() / 1024,
+        'rss_growth_mb': (_peak_rss_kb() - baseline) / 1024,
+    }))
+
+
+def run_benchmark(founders=100000):
+    from benchmark_text_storage import build_database
+
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'yc_companies.db')
+        print(f"Building synthetic database with ~{founders} founders...")
+        build_database(db_path, founders // 2)
+
+        # Run the app's one-off schema setup (rollups, side tables) up front
+        subprocess.run([sys.executable, __file__, '--mode', 'streamed', tmp],
+                       check=True, capture_output=True)
+
+        results = {}
+        for mode in MODES:
+            output = subprocess.run([sys.executable, __file__, '--mode', mode, tmp],
+                                    check=True, capture_output=True, text=True).stdout
+            results[mode] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"\n{'':<15} {'TTFB (ms)':>10} {'total (ms)':>11} {'body (MB)':>10} {'peak RSS (MB)':>14} {'RSS growth':>11}")
+    for mode, result in results.items():
+        print(f"{mode:<15} {result['ttfb_ms']:>10.1f} {result['total_ms']:>11.1f} "
+              f"{result['bytes'] / 1e6:>10.1f} {result['peak_rss_mb']:>14.1f} {result['rss_growth_mb']:>11.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--mode':
+        run_mode(sys.argv[2], sys.argv[3])
+    else:
+        run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
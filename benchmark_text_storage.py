@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark inline vs side-table storage of description/bio
+Builds a synthetic database with long texts, measures file size and the
+latency of the list queries, then offloads the texts and measures again
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+from company_names import display_name_columns
+from text_storage import offload_texts
+
+LIST_QUERIES = {
+    '/api/companies': '''
+        SELECT id, display_name AS name, batch, location, industry, website, yc_url, is_hiring
+        FROM companies
+        WHERE yc_url LIKE "%/companies/%" AND yc_url NOT LIKE "%?%"
+        ORDER BY sort_name
+    ''',
+    '/api/founders': '''
+        SELECT f.id, f.company_id, f.company_name, f.name, f.role, c.display_name
+        FROM founders f
+        LEFT JOIN companies c ON f.company_id = c.id
+        ORDER BY f.company_name, f.name
+    ''',
+    'count by batch': 'SELECT batch, COUNT(*) FROM companies GROUP BY batch',
+}
+
+WORDS = ('platform', 'developers', 'AI', 'infrastructure', 'customers', 'data', 'teams',
+         'automate', 'workflow', 'payments', 'healthcare', 'open-source', 'fast', 'secure')
+
+
+def _text(words):
+    return ' '.join(random.choice(WORDS) for _ in range(words))
+
+
+def build_database(db_path, companies):
+    """Create a database with inline descriptions and bios, like scrapes before the side tables"""
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+        CREATE TABLE companies (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL, batch TEXT, description TEXT, website TEXT, location TEXT,
+            industry TEXT, is_hiring BOOLEAN DEFAULT 1, yc_url TEXT,
+            display_name TEXT, sort_name TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(name, batch)
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE founders (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            company_id INTEGER, company_name TEXT, name TEXT NOT NULL, role TEXT,
+            previous_company TEXT, linkedin_url TEXT, twitter_url TEXT, yc_profile_url TEXT,
+            bio TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(company_name, name)
+        )
+    ''')
+    conn.execute('CREATE INDEX idx_companies_sort_name ON companies(sort_name)')
+    for i in range(companies):
+        name = f'Company {i}'
+        cursor = conn.execute('''
+            INSERT INTO companies (name, batch, description, website, location, industry,
+                                   is_hiring, yc_url, display_name, sort_name)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (name, random.choice(['W24', 'S24', 'W25', 'S25']), _text(random.randint(40, 300)),
+              f'https://company{i}.com', 'San Francisco, CA, USA', 'B2B', i % 2,
+              f'https://www.ycombinator.com/companies/company-{i}', *display_name_columns(name)))
+        for j in range(random.randint(1, 3)):
+            conn.execute('''
+                INSERT INTO founders (company_id, company_name, name, role, bio)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (cursor.lastrowid, name, f'Founder {i}-{j}', 'Founder', _text(random.randint(20, 150))))
+    conn.commit()
+    conn.close()
+
+
+def measure(db_path, repeat):
+    """File size and best-of-N latency (ms) for each list query on a cold connection"""
+    results = {'size': os.path.getsize(db_path)}
+    for label, query in LIST_QUERIES.items():
+        best = None
+        for _ in range(repeat):
+            conn = sqlite3.connect(db_path)
+            start = time.perf_counter()
+            conn.execute(query).fetchall()
+            elapsed = (time.perf_counter() - start) * 1000
+            conn.close()
+            best = elapsed if best is None else min(best, elapsed)
+        results[label] = best
+    return results
+
+
+def run_benchmark(companies=5000, repeat=5):
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        print(f"Building synthetic database with {companies} companies...")
+        build_database(db_path, companies)
+
+        conn = sqlite3.connect(db_path)
+        conn.execute('VACUUM')
+        conn.close()
+        before = measure(db_path, repeat)
+
+        conn = sqlite3.connect(db_path)
+        offload_texts(conn, vacuum=True)
+        conn.close()
+        after = measure(db_path, repeat)
+
+    print(f"\n{'':<18} {'inline':>12} {'side tables':>12}")
+    print(f"{'DB size (KB)':<18} {before['size'] / 1024:>12.0f} {after['size'] / 1024:>12.0f}")
+    for label in LIST_QUERIES:
+        print(f"{label + ' (ms)':<18} {before[label]:>12.2f} {after[label]:>12.2f}")
+
+
+if __name__ == "__main__":
+    companies = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    run_benchmark(companies)
@@ -0,0 +1,105 @@
+"""
+Fixtures for the benchmark suite: synthetic databases (synthetic_db.py) at
+the sizes given with --db-size, prepared the way the app prepares a real one
+
+    python3 -m pytest benchmarks --db-size=10k,100k
+    python3 -m pytest benchmarks --benchmark-autosave
+    python3 -m pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:15%
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+import pytest
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+# Routes are measured uncached; test_routes.py switches a cache back on where it measures hits
+os.environ['RESPONSE_CACHE_SIZE'] = '0'
+
+import synthetic_db
+
+# Rounds per benchmark: plenty on small databases, a few on the large ones
+ROUND_BUDGET = 200_000
+MIN_ROUNDS = 3
+MAX_ROUNDS = 50
+
+
+def pytest_addoption(parser):
+    parser.addoption('--db-size', default='10k',
+                     help='comma-separated synthetic database sizes (companies): 10k, 100k, 1m or a number')
+    parser.addoption('--db-dir', default=os.environ.get('SYNTHETIC_DB_DIR',
+                                                        os.path.join(tempfile.gettempdir(), 'yc-synthetic-dbs')),
+                     help='where generated databases are kept between runs')
+
+
+def pytest_generate_tests(metafunc):
+    if 'db_size' in metafunc.fixturenames:
+        sizes = [size.strip() for size in metafunc.config.getoption('--db-size').split(',') if size.strip()]
+        metafunc.parametrize('db_size', sizes, scope='session')
+
+
+def prepared_database(raw_path):
+    """A copy of a generated database with the app's schema setup already run (cached next to it)"""
+    import app as app_module
+
+    prepared_path = raw_path.replace('.db', '-prepared.db')
+    if not os.path.exists(prepared_path):
+        tmp_path = f'{prepared_path}.{os.getpid()}.tmp'
+        shutil.copyfile(raw_path, tmp_path)
+        app_module.app.config['DATABASE'] = tmp_path
+        app_module.prepare_database()
+        conn = sqlite3.connect(tmp_path)
+        conn.execute('ANALYZE')
+        conn.close()
+        os.replace(tmp_path, prepared_path)
+    return prepared_path
+
+
+@pytest.fixture(scope='session')
+def raw_db(db_size, request):
+    """Generated database as a scraper would leave it"""
+    companies = synthetic_db.parse_size(db_size)
+    return synthetic_db.cached_database(companies, request.config.getoption('--db-dir'))
+
+
+@pytest.fixture(scope='session')
+def db_path(raw_db):
+    """Generated database with display names, rollups, side tables and triggers in place"""
+    return prepared_database(raw_db)
+
+
+@pytest.fixture
+def rounds(db_size):
+    companies = synthetic_db.parse_size(db_size)
+    return max(MIN_ROUNDS, min(MAX_ROUNDS, ROUND_BUDGET // companies))
+
+
+@pytest.fixture
+def app_module(db_path):
+    """The app pointed at the prepared database"""
+    import app as app_module
+
+    app_module.app.config['DATABASE'] = db_path
+    app_module._schema_ready = True
+    app_module.response_cache.clear()
+    return app_module
+
+
+@pytest.fixture
+def client(app_module):
+    return app_module.app.test_client()
+
+
+@pytest.fixture
+def db_copy(db_path, tmp_path):
+    """Returns a function making a fresh copy of the prepared database (for benchmarks that write)"""
+    def make_copy():
+        path = os.path.join(tmp_path, 'yc_companies.db')
+        shutil.copyfile(db_path, path)
+        return path
+    return make_copy
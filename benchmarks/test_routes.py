@@ -0,0 +1,124 @@
+"""
+Benchmarks for every app.py route against the synthetic databases
+Each request reads its whole body, so streamed lists are measured to the
+last byte. JSON routes run with the response cache off (see conftest.py);
+test_cached_hit measures the cached path separately.
+"""
+
+import os
+from urllib.parse import urlencode
+
+import pytest
+
+import build_assets
+from response_cache import ResponseCache
+from static_assets import StaticAssets
+
+# (URL rule, URL) for each benchmarked request; test_every_route_is_benchmarked
+# fails when a route is added to app.py without a benchmark here
+ROUTES = [
+    ('/', '/'),
+    ('/companies', '/companies'),
+    ('/members', '/members'),
+    ('/api/companies', '/api/companies'),
+    ('/api/companies', '/api/companies?page_size=100'),
+    ('/api/companies', '/api/companies?page_size=100&sort=-founders'),
+    ('/api/companies', '/api/companies?search=Labs&page_size=100'),
+    ('/api/companies', '/api/companies?' + urlencode([('batch', 'Winter 2025'), ('batch', 'Summer 2025'),
+                                                      ('industry', 'B2B'), ('is_hiring', '1')])),
+    ('/api/companies', '/api/companies?format=ndjson'),
+    ('/api/companies', '/api/companies?format=columns'),
+    ('/api/companies', '/api/companies?ids=' + ','.join(str(i) for i in range(1, 101))),
+    ('/api/companies/with-founders', '/api/companies/with-founders'),
+    ('/api/companies/with-founders', '/api/companies/with-founders?founders=full&page_size=500'),
+    ('/api/companies/with-founders', '/api/companies/with-founders?format=ndjson'),
+    ('/api/companies/facets', '/api/companies/facets'),
+    ('/api/companies/facets', '/api/companies/facets?' + urlencode([('batch', 'Winter 2025'), ('industry', 'Fintech')])),
+    ('/api/companies/<int:company_id>', '/api/companies/1'),
+    ('/api/founders/<int:founder_id>', '/api/founders/1'),
+    ('/api/founders', '/api/founders'),
+    ('/api/founders', '/api/founders?page_size=500&include=bio'),
+    ('/api/founders', '/api/founders?search=Patel'),
+    ('/api/members', '/api/members'),
+    ('/api/stats', '/api/stats'),
+    ('/api/changes', '/api/changes?since=0'),
+    ('/api/cache', '/api/cache'),
+    ('/metrics', '/metrics'),
+    ('/service-worker.js', '/service-worker.js'),
+    ('/static/<path:filename>', '/static/js/table.js'),
+]
+
+# Benchmarked by their own tests below
+SPECIAL_RULES = {'/static/dist/<path:filename>', '/api/progress/stream'}
+
+GZIP = {'Accept-Encoding': 'gzip'}
+
+
+def _get(client, url, headers=None):
+    response = client.get(url, headers=headers)
+    body = response.get_data()
+    assert response.status_code == 200, (url, response.status_code, body[:200])
+    return len(body)
+
+
+def test_every_route_is_benchmarked(app_module):
+    rules = {rule.rule for rule in app_module.app.url_map.iter_rules()}
+    covered = {rule for rule, _ in ROUTES} | SPECIAL_RULES
+    assert rules - covered == set()
+
+
+@pytest.mark.benchmark(group='routes')
+@pytest.mark.parametrize('rule,url', ROUTES, ids=[url if len(url) < 80 else url[:70] + '...' for _, url in ROUTES])
+def test_route(benchmark, client, rounds, rule, url):
+    benchmark.pedantic(_get, args=(client, url), rounds=rounds, warmup_rounds=1)
+
+
+@pytest.mark.benchmark(group='routes-gzip')
+@pytest.mark.parametrize('url', ['/api/companies', '/api/founders', '/api/companies/with-founders'])
+def test_route_gzip(benchmark, client, rounds, url):
+    benchmark.pedantic(_get, args=(client, url, GZIP), rounds=rounds, warmup_rounds=1)
+
+
+@pytest.mark.benchmark(group='routes-cached')
+@pytest.mark.parametrize('url', ['/api/companies', '/api/companies/with-founders', '/api/stats'])
+def test_cached_hit(benchmark, app_module, client, rounds, monkeypatch, url):
+    monkeypatch.setattr(app_module, 'response_cache', ResponseCache())
+    _get(client, url, GZIP)
+    benchmark.pedantic(_get, args=(client, url, GZIP), rounds=rounds, warmup_rounds=1)
+
+
+@pytest.mark.benchmark(group='routes-cached')
+def test_not_modified(benchmark, client, rounds):
+    etag = client.get('/api/companies').headers['ETag']
+
+    def revalidate():
+        response = client.get('/api/companies', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+
+    benchmark.pedantic(revalidate, rounds=rounds, warmup_rounds=1)
+
+
+@pytest.mark.benchmark(group='routes')
+def test_dist_asset(benchmark, app_module, client, rounds, monkeypatch, tmp_path):
+    """A built, precompressed asset (built into a temp folder, so the tree is left alone)"""
+    monkeypatch.setattr(build_assets, 'DIST_PATH', os.path.join(tmp_path, 'dist'))
+    with open(os.path.join(build_assets.STATIC_DIR, 'js', 'table.js')) as f:
+        content = build_assets.minify_js(f.read()).encode('utf-8')
+    built = build_assets.fingerprint('js/table.js', content)
+    build_assets.write_dist(built, content)
+    monkeypatch.setattr(app_module, 'assets', StaticAssets(str(tmp_path)))
+
+    benchmark.pedantic(_get, args=(client, f'/static/dist/{built}', GZIP), rounds=rounds, warmup_rounds=1)
+
+
+@pytest.mark.benchmark(group='routes')
+def test_progress_stream(benchmark, client, rounds):
+    """Time to open the progress stream and receive its first chunk"""
+    def open_stream():
+        response = client.get('/api/progress/stream', buffered=False)
+        assert response.status_code == 200
+        first = next(iter(response.response))
+        response.close()
+        return first
+
+    assert benchmark.pedantic(open_stream, rounds=rounds, warmup_rounds=1).startswith(b'retry:')
@@ -0,0 +1,37 @@
+"""
+Benchmarks for the command-line reports and maintenance scripts
+"""
+
+import contextlib
+import io
+
+import pytest
+
+import monitor_progress
+import summary
+from remove_duplicates import remove_duplicates
+
+
+@pytest.mark.benchmark(group='scripts')
+def test_get_summary(benchmark, db_path, rounds):
+    result = benchmark.pedantic(summary.get_summary, args=(db_path,), rounds=rounds, warmup_rounds=1)
+    assert result['total'] > 0
+
+
+@pytest.mark.benchmark(group='scripts')
+def test_monitor_get_stats(benchmark, db_path, rounds):
+    result = benchmark.pedantic(monitor_progress.get_stats, args=(db_path,), rounds=rounds, warmup_rounds=1)
+    assert result['total_founders'] > 0
+
+
+@pytest.mark.benchmark(group='scripts')
+def test_remove_duplicates(benchmark, db_copy, rounds):
+    """Dedupe a fresh copy of the database each round (the copy isn't timed)"""
+    def setup():
+        return (db_copy(),), {}
+
+    def run(path):
+        with contextlib.redirect_stdout(io.StringIO()):
+            remove_duplicates(path)
+
+    benchmark.pedantic(run, setup=setup, rounds=min(rounds, 5))
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Build the static assets for production
+Minifies static/js/*.js and static/css/*.css, names each copy after a hash
+of its content and writes it to static/dist with .gz and .br (if brotli is
+installed) siblings, plus manifest.json for static_assets.py. References
+between assets ('/static/js/table_worker.js' in table.js, the service
+worker's shell list, font URLs in the CSS) are rewritten to the hashed names.
+
+--fetch-fonts downloads the Latin subset of Geist from Google Fonts into
+static/fonts once; the build then prepends its @font-face rules to
+style.css so pages stop loading fonts from a third-party origin.
+--clean removes dist files earlier builds left behind (keep them while
+pages or service workers that still reference them may be around).
+
+Usage: python3 build_assets.py [--fetch-fonts] [--clean]
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+
+try:
+    import brotli
+except ImportError:  # optional; only .gz siblings are written without it
+    brotli = None
+
+from static_assets import DIST_DIR, MANIFEST_NAME
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+DIST_PATH = os.path.join(STATIC_DIR, DIST_DIR)
+FONTS_DIR = 'fonts'
+FONT_CSS = 'fonts/fonts.css'  # @font-face rules written by --fetch-fonts
+
+FONT_FAMILY_URL = 'https://fonts.googleapis.com/css2?family=Geist:wght@300..700&display=swap'
+FONT_SUBSET = 'latin'
+# Google Fonts picks the font format by user agent; this one gets woff2
+FONT_USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                   '(KHTML, like Gecko) Chrome/120.0 Safari/537.36')
+
+HASH_LENGTH = 10
+COMPRESSIBLE = ('.js', '.css', '.json', '.svg')
+
+# A `/` after one of these (or these keywords) starts a regex literal, not a division
+REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw'}
+# Whitespace next to these can go without joining two tokens into one
+JS_TIGHT = set('{}()[];,:=<>?!&|')
+# Newlines after these can go without changing how automatic semicolons apply
+JS_LINE_JOINERS = set('{;,([')
+
+
+def _is_word(char):
+    return char.isalnum() or char in '_$'
+
+
+def minify_js(source):
+    """Drop comments and spare whitespace, leaving strings, templates and regexes alone"""
+    out = []
+    stack = []  # open template literals: brace depth of their current ${...}
+    depth = 0
+    pending = ''  # whitespace seen since the last token: '', ' ' or '\n'
+    i, n = 0, len(source)
+
+    def last():
+        return out[-1][-1] if out else ''
+
+    def emit(token):
+        nonlocal pending
+        if pending and out:
+            before, after = last(), token[0]
+            if pending == '\n' and before not in JS_LINE_JOINERS and after not in '}).]':
+                out.append('\n')
+            elif not (before in JS_TIGHT or after in JS_TIGHT or pending == '\n'):
+                out.append(' ')
+            elif _is_word(before) and _is_word(after):
+                out.append(' ')
+        pending = ''
+        out.append(token)
+
+    def scan_template(start):
+        # From just after a backtick to the closing backtick or a `${`
+        j = start
+        while j < n:
+            if source[j] == '\\':
+                j += 2
+            elif source[j] == '`':
+                return j + 1, False
+            elif source.startswith('${', j):
+                return j + 2, True
+            else:
+                j += 1
+        raise ValueError('unterminated template literal')
+
+    while i < n:
+        char = source[i]
+        if char in ' \t\r\n':
+            if char == '\n' or pending == '\n':
+                pending = '\n'
+            elif not pending:
+                pending = ' '
+            i += 1
+        elif source.startswith('//', i):
+            end = source.find('\n', i)
+            i = n if end < 0 else end
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            if end < 0:
+                raise ValueError('unterminated comment')
+            if not pending:
+                pending = ' '
+            i = end + 2
+        elif char in '\'"':
+            j = i + 1
+            while j < n and source[j] != char:
+                if source[j] == '\n':
+                    raise ValueError('unterminated string')
+                j += 2 if source[j] == '\\' else 1
+            emit(source[i:j + 1])
+            i = j + 1
+        elif char == '`' or (char == '}' and stack and depth == stack[-1]):
+            if char == '}':
+                stack.pop()
+            j, opened = scan_template(i + 1)
+            emit(source[i:j])
+            if opened:
+                stack.append(depth)
+            i = j
+        elif char == '/':
+            word = re.search(r'[\w$]+$', ''.join(out[-3:]))
+            if not out or last() in REGEX_PRECEDERS or (word and word.group() in REGEX_KEYWORDS):
+                j, in_class = i + 1, False
+                while j < n and (in_class or source[j] != '/'):
+                    if source[j] == '\n':
+                        raise ValueError('unterminated regex')
+                    if source[j] == '\\':
+                        j += 1
+                    elif source[j] in '[]':
+                        in_class = source[j] == '['
+                    j += 1
+                j += 1
+                while j < n and source[j].isalpha():
+                    j += 1
+                emit(source[i:j])
+                i = j
+            else:
+                emit(char)
+                i += 1
+        else:
+            if char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+            j = i + 1
+            if _is_word(char):
+                while j < n and _is_word(source[j]):
+                    j += 1
+            emit(source[i:j])
+            i = j
+    if stack:
+        raise ValueError('unterminated template literal')
+    return ''.join(out) + '\n'
+
+
+def minify_css(source):
+    """Drop comments and spare whitespace, leaving strings alone"""
+    # Strings first so nothing inside them is touched, then comments
+    parts = re.split(r'("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')', source)
+    out = []
+    for index, part in enumerate(parts):
+        if index % 2:
+            out.append(part)
+            continue
+        part = re.sub(r'/\*.*?\*/', '', part, flags=re.S)
+        part = re.sub(r'\s+', ' ', part)
+        # Not around ':' in general: `a :hover` and `a:hover` are different selectors
+        part = re.sub(r' ?([{};,>]) ?', r'\1', part)
+        part = re.sub(r': ', ':', part)
+        part = part.replace(';}', '}')
+        out.append(part)
+    return ''.join(out).strip() + '\n'
+
+
+def fingerprint(path, content):
+    """'js/table.js' -> 'js/table.3f2a1b9c0d.js'"""
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    stem, extension = os.path.splitext(path)
+    return f'{stem}.{digest}{extension}'
+
+
+def write_dist(path, content):
+    """Write one built file and, for text formats, its precompressed siblings"""
+    target = os.path.join(DIST_PATH, path)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    written = [target]
+    with open(target, 'wb') as f:
+        f.write(content)
+    if path.endswith(COMPRESSIBLE):
+        with open(target + '.gz', 'wb') as f:
+            f.write(gzip.compress(content, compresslevel=9, mtime=0))
+        written.append(target + '.gz')
+        if brotli is not None:
+            with open(target + '.br', 'wb') as f:
+                f.write(brotli.compress(content, quality=11))
+            written.append(target + '.br')
+    return written
+
+
+def _references(text, pending):
+    return {path for path in pending if f'/static/{path}' in text}
+
+
+def build():
+    """Build every asset and write the manifest; returns (manifest, files written)"""
+    sources = {}
+    for folder, extension in (('js', '.js'), ('css', '.css'), (FONTS_DIR, '.woff2')):
+        directory = os.path.join(STATIC_DIR, folder)
+        if not os.path.isdir(directory):
+            continue
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(extension):
+                with open(os.path.join(directory, name), 'rb') as f:
+                    sources[f'{folder}/{name}'] = f.read()
+
+    font_css = os.path.join(STATIC_DIR, FONT_CSS)
+    if os.path.isfile(font_css):
+        with open(font_css, 'rb') as f:
+            sources['css/style.css'] = f.read() + b'\n' + sources['css/style.css']
+
+    for path, content in sources.items():
+        if path.endswith('.js'):
+            sources[path] = minify_js(content.decode('utf-8')).encode('utf-8')
+        elif path.endswith('.css'):
+            sources[path] = minify_css(content.decode('utf-8')).encode('utf-8')
+
+    # Build assets after the ones they reference, so the hashes they embed are final
+    manifest, written = {}, []
+    pending = dict(sources)
+    while pending:
+        ready = [path for path, content in pending.items()
+                 if not _references(content.decode('utf-8', 'replace'), set(pending) - {path})]
+        if not ready:
+            raise ValueError(f'circular references between {sorted(pending)}')
+        for path in ready:
+            content = pending.pop(path)
+            if not path.endswith('.woff2'):
+                text = content.decode('utf-8')
+                for source_path, built_path in manifest.items():
+                    text = text.replace(f'/static/{source_path}', f'/static/{DIST_DIR}/{built_path}')
+                content = text.encode('utf-8')
+            manifest[path] = fingerprint(path, content)
+            written += write_dist(manifest[path], content)
+
+    manifest_path = os.path.join(DIST_PATH, MANIFEST_NAME)
+    with open(manifest_path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(manifest_path + '.tmp', manifest_path)
+    return manifest, written + [manifest_path]
+
+
+def clean(keep):
+    """Remove dist files not written by the current build"""
+    removed = 0
+    for root, _, names in os.walk(DIST_PATH):
+        for name in names:
+            path = os.path.join(root, name)
+            if path not in keep:
+                os.remove(path)
+                removed += 1
+    return removed
+
+
+def fetch_fonts():
+    """Download the Geist Latin subset into static/fonts and write its @font-face rules"""
+    import requests
+
+    response = requests.get(FONT_FAMILY_URL, headers={'User-Agent': FONT_USER_AGENT}, timeout=30)
+    response.raise_for_status()
+    # The CSS has one @font-face block per subset, each preceded by a /* subset */ comment
+    blocks = re.findall(r'/\* ([\w-]+) \*/\s*(@font-face\s*{[^}]*})', response.text)
+    rules = []
+    for subset, block in blocks:
+        if subset != FONT_SUBSET:
+            continue
+        url = re.search(r'url\((https://[^)]+\.woff2)\)', block).group(1)
+        font = requests.get(url, timeout=30)
+        font.raise_for_status()
+        name = f'geist-{subset}-{len(rules)}.woff2' if rules else f'geist-{subset}.woff2'
+        with open(os.path.join(STATIC_DIR, FONTS_DIR, name), 'wb') as f:
+            f.write(font.content)
+        rules.append(block.replace(url, f'/static/{FONTS_DIR}/{name}'))
+        print(f"   {name}: {len(font.content):,} bytes")
+    if not rules:
+        raise ValueError(f'no {FONT_SUBSET} @font-face rules in {FONT_FAMILY_URL}')
+    with open(os.path.join(STATIC_DIR, FONT_CSS), 'w', encoding='utf-8') as f:
+        f.write('/* Geist, Latin subset, self-hosted (written by build_assets.py --fetch-fonts) */\n')
+        f.write('\n'.join(rules) + '\n')
+
+
+if __name__ == "__main__":
+    if '--fetch-fonts' in sys.argv:
+        print("🔤 Fetching fonts...")
+        os.makedirs(os.path.join(STATIC_DIR, FONTS_DIR), exist_ok=True)
+        fetch_fonts()
+
+    print("📦 Building static assets...")
+    manifest, written = build()
+    for path, built in sorted(manifest.items()):
+        size = os.path.getsize(os.path.join(DIST_PATH, built))
+        gz = os.path.join(DIST_PATH, built + '.gz')
+        compressed = f", {os.path.getsize(gz):,} gzipped" if os.path.exists(gz) else ''
+        print(f"   {path:<28} -> {built} ({size:,} bytes{compressed})")
+    if brotli is None:
+        print("⚠️  brotli not installed: only .gz variants written")
+    if '--clean' in sys.argv:
+        print(f"🧹 Removed {clean(set(written))} stale files")
+    print(f"✅ {len(manifest)} assets written to {DIST_PATH}")
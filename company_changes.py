@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Company change history for incremental consumers
+Triggers on the companies table append field-level diffs to company_changes,
+each with a monotonically increasing version, so consumers can ask for
+"everything since version N" instead of re-reading the whole table.
+Founder edits are logged against their company too.
+"""
+
+import json
+import sqlite3
+import sys
+
+# Columns whose changes are recorded (derived counters like founder_count are not)
+# description lives in company_texts (see text_storage.py) and isn't logged
+TRACKED_FIELDS = ('name', 'display_name', 'batch', 'website',
+                  'location', 'industry', 'is_hiring', 'yc_url')
+
+
+def _changed_fields_json(old, new):
+    """SQL expression building a JSON object of the fields that differ between two rows"""
+    parts = ' UNION ALL '.join(
+        f"SELECT '{field}' AS field, {new}.{field} AS value WHERE {old}.{field} IS NOT {new}.{field}"
+        for field in TRACKED_FIELDS
+    )
+    return f"(SELECT json_group_object(field, value) FROM ({parts}))"
+
+
+def _row_json(row):
+    """SQL expression building a JSON object of every tracked field of a row"""
+    return 'json_object(' + ', '.join(f"'{field}', {row}.{field}" for field in TRACKED_FIELDS) + ')'
+
+
+# Writers upsert with ON CONFLICT ... DO UPDATE ... WHERE <values differ>, so an
+# unchanged re-scrape writes nothing. INSERT OR REPLACE must not be used on
+# companies: its implicit delete fires no trigger and the company changes id.
+TRIGGERS = {
+    'changes_companies_after_insert': f"""
+        CREATE TRIGGER changes_companies_after_insert AFTER INSERT ON companies
+        BEGIN
+            INSERT INTO company_changes (company_id, op, changes)
+            VALUES (NEW.id, 'insert', {_row_json('NEW')});
+        END
+    """,
+    'changes_companies_after_update': f"""
+        CREATE TRIGGER changes_companies_after_update AFTER UPDATE OF {', '.join(TRACKED_FIELDS)} ON companies
+        WHEN {' OR '.join(f'OLD.{field} IS NOT NEW.{field}' for field in TRACKED_FIELDS)}
+        BEGIN
+            INSERT INTO company_changes (company_id, op, changes)
+            VALUES (NEW.id, 'update', {_changed_fields_json('OLD', 'NEW')});
+        END
+    """,
+    'changes_companies_after_delete': """
+        CREATE TRIGGER changes_companies_after_delete AFTER DELETE ON companies
+        BEGIN
+            INSERT INTO company_changes (company_id, op, changes)
+            VALUES (OLD.id, 'delete', '{}');
+        END
+    """,
+}
+
+# Dropped from existing databases by setup_company_changes()
+OBSOLETE_TRIGGERS = ('changes_companies_before_insert',)
+
+
+# Founder edits are logged against their company as an update of the pseudo-field
+# "founders" (value null): consumers refetch that company's founders
+FOUNDER_FIELDS = ('company_id', 'name', 'role', 'previous_company',
+                  'linkedin_url', 'twitter_url', 'yc_profile_url')
+
+FOUNDER_TRIGGERS = {
+    'changes_founders_after_insert': """
+        CREATE TRIGGER changes_founders_after_insert AFTER INSERT ON founders
+        WHEN NEW.company_id IS NOT NULL
+        BEGIN
+            INSERT INTO company_changes (company_id, op, changes)
+            VALUES (NEW.company_id, 'update', json_object('founders', NULL));
+        END
+    """,
+    'changes_founders_after_update': f"""
+        CREATE TRIGGER changes_founders_after_update AFTER UPDATE ON founders
+        WHEN NEW.company_id IS NOT NULL
+            AND ({' OR '.join(f'OLD.{field} IS NOT NEW.{field}' for field in FOUNDER_FIELDS)})
+        BEGIN
+            INSERT INTO company_changes (company_id, op, changes)
+            VALUES (NEW.company_id, 'update', json_object('founders', NULL));
+        END
+    """,
+    'changes_founders_after_delete': """
+        CREATE TRIGGER changes_founders_after_delete AFTER DELETE ON founders
+        WHEN OLD.company_id IS NOT NULL
+        BEGIN
+            INSERT INTO company_changes (company_id, op, changes)
+            VALUES (OLD.company_id, 'update', json_object('founders', NULL));
+        END
+    """,
+}
+
+
+def setup_company_changes(conn):
+    """Create the change log tables and triggers if missing"""
+    existing = dict(conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type IN ('table', 'trigger')"
+    ).fetchall())
+    triggers = dict(TRIGGERS)
+    # scraper.py's databases have no founders table
+    if 'founders' in existing:
+        triggers.update(FOUNDER_TRIGGERS)
+    # Triggers are recreated whenever their definition in this file changes
+    if ('company_changes' in existing and not any(name in existing for name in OBSOLETE_TRIGGERS)
+            and all(existing.get(name) == sql.strip() for name, sql in triggers.items())):
+        return False
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS company_changes (
+            version INTEGER PRIMARY KEY AUTOINCREMENT,
+            company_id INTEGER NOT NULL,
+            op TEXT NOT NULL,
+            changes TEXT NOT NULL,
+            changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_company_changes_company ON company_changes(company_id, version)')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS company_changes_meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        )
+    ''')
+    for name in OBSOLETE_TRIGGERS:
+        conn.execute(f'DROP TRIGGER IF EXISTS {name}')
+    for name, sql in triggers.items():
+        conn.execute(f'DROP TRIGGER IF EXISTS {name}')
+        conn.execute(sql)
+    conn.commit()
+    return True
+
+
+def current_version(conn):
+    """Latest version handed out (0 if nothing was ever logged)"""
+    row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'company_changes'").fetchone()
+    return row[0] if row else 0
+
+
+def pruned_through(conn):
+    """Highest version dropped by compaction; consumers behind it must do a full resync"""
+    row = conn.execute("SELECT value FROM company_changes_meta WHERE key = 'pruned_through'").fetchone()
+    return row[0] if row else 0
+
+
+def read_changes(conn, since=0, limit=1000):
+    """Changes with version > since, oldest first
+
+    Apply 'insert' and 'update' entries as upserts of the listed fields: after
+    compaction an entry can carry changes the consumer has already seen.
+    limit=0 (or less) only reads the current version.
+    """
+    if limit <= 0:
+        rows, has_more = [], False
+    else:
+        rows = conn.execute('''
+            SELECT version, company_id, op, changes, changed_at
+            FROM company_changes
+            WHERE version > ?
+            ORDER BY version
+            LIMIT ?
+        ''', (since, limit + 1)).fetchall()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+    return {
+        'version': current_version(conn),
+        'since': since,
+        'resync': since < pruned_through(conn),
+        'has_more': has_more,
+        'next_since': rows[-1][0] if rows else since,
+        'changes': [
+            {
+                'version': version,
+                'company_id': company_id,
+                'op': op,
+                'changes': json.loads(changes),
+                'changed_at': changed_at
+            }
+            for version, company_id, op, changes, changed_at in rows
+        ]
+    }
+
+
+def _merge(entries):
+    """Collapse a company's ordered (op, changes) entries into a single entry"""
+    op, merged = None, {}
+    for entry_op, changes in entries:
+        if entry_op == 'delete':
+            op, merged = 'delete', {}
+        elif entry_op == 'insert' or op in (None, 'delete'):
+            op, merged = entry_op, dict(changes)
+        else:
+            merged.update(changes)
+    return op, merged
+
+
+def compact_changes(conn, keep_days=30, tombstone_days=180):
+    """Merge old history down to one entry per company and drop old tombstones
+
+    Entries newer than keep_days are left untouched. Older entries for the same
+    company are merged into one entry at the newest of their versions, so the
+    log stays proportional to the number of companies plus recent activity.
+    Delete entries older than tombstone_days are removed and the pruned
+    version recorded, so lagging consumers know to resync.
+
+    Returns (rows_merged_away, tombstones_dropped).
+    """
+    old_rows = conn.execute('''
+        SELECT version, company_id, op, changes
+        FROM company_changes
+        WHERE changed_at < datetime('now', ?)
+        ORDER BY company_id, version
+    ''', (f'-{keep_days} days',)).fetchall()
+
+    by_company = {}
+    for version, company_id, op, changes in old_rows:
+        by_company.setdefault(company_id, []).append((version, op, json.loads(changes)))
+
+    merged_away = 0
+    for company_id, entries in by_company.items():
+        if len(entries) < 2:
+            continue
+        op, changes = _merge((op, changes) for _, op, changes in entries)
+        versions = [version for version, _, _ in entries]
+        placeholders = ','.join(['?'] * len(versions))
+        changed_at = conn.execute(
+            'SELECT changed_at FROM company_changes WHERE version = ?', (versions[-1],)
+        ).fetchone()[0]
+        conn.execute(f'DELETE FROM company_changes WHERE version IN ({placeholders})', versions)
+        conn.execute('''
+            INSERT INTO company_changes (version, company_id, op, changes, changed_at)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (versions[-1], company_id, op, json.dumps(changes), changed_at))
+        merged_away += len(versions) - 1
+
+    horizon = conn.execute('''
+        SELECT MAX(version) FROM company_changes
+        WHERE op = 'delete' AND changed_at < datetime('now', ?)
+    ''', (f'-{tombstone_days} days',)).fetchone()[0]
+    dropped = 0
+    if horizon is not None:
+        dropped = conn.execute('''
+            DELETE FROM company_changes
+            WHERE op = 'delete' AND version <= ?
+        ''', (horizon,)).rowcount
+        conn.execute('''
+            INSERT INTO company_changes_meta (key, value) VALUES ('pruned_through', ?)
+            ON CONFLICT(key) DO UPDATE SET value = MAX(value, excluded.value)
+        ''', (horizon,))
+
+    conn.commit()
+    return merged_away, dropped
+
+
+if __name__ == "__main__":
+    db_path = sys.argv[1] if len(sys.argv) > 1 else 'yc_companies.db'
+    keep_days = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+
+    conn = sqlite3.connect(db_path)
+    setup_company_changes(conn)
+    merged_away, dropped = compact_changes(conn, keep_days=keep_days)
+    version = current_version(conn)
+    conn.close()
+
+    print(f"✅ Compacted company change log (current version: {version})")
+    print(f"   Merged away: {merged_away} entries older than {keep_days} days")
+    print(f"   Dropped: {dropped} old delete tombstones")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Faceted filtering for the company list
+Multi-value filters on batch/industry/location/is_hiring plus per-dimension
+counts, served from a partial covering index over the listed companies so a
+filter change never has to touch (or ship) the whole table
+"""
+
+import sqlite3
+import sys
+
+# Companies shown in the UI: real company pages, not listing/filter URLs.
+# Queries must use this exact text for SQLite to pick the partial index.
+LISTED_COMPANY = ("yc_url LIKE '%/companies/%' AND yc_url NOT LIKE '%?%' "
+                  "AND yc_url NOT LIKE '%industry=%' AND yc_url NOT LIKE '%batch=%'")
+
+FACETS = ('batch', 'industry', 'location', 'is_hiring')
+
+DEFAULT_FACET_LIMIT = 100
+
+# Filter value selecting companies with no value for a facet (NULL or '');
+# the counts report those as value null
+NONE_VALUE = '__none__'
+
+
+def setup_company_facets(conn):
+    """Create the covering index the facet counts are read from"""
+    conn.execute(f'''
+        CREATE INDEX IF NOT EXISTS idx_companies_listed_facets
+        ON companies(batch, industry, location, is_hiring, display_name)
+        WHERE {LISTED_COMPANY}
+    ''')
+    conn.commit()
+
+
+def _parse_is_hiring(value):
+    value = value.strip().lower()
+    if value in ('1', 'true', 'yes'):
+        return 1
+    if value in ('0', 'false', 'no'):
+        return 0
+    raise ValueError(f'invalid is_hiring value: {value} (use 1 or 0)')
+
+
+def parse_facet_filters(args):
+    """{facet: [values]} from query args; repeat a parameter to select several values
+
+    `args` is a werkzeug MultiDict (request.args). Values are not split on
+    commas because locations contain them ("San Francisco, CA, USA").
+    NONE_VALUE selects the companies without a value and becomes None.
+    """
+    filters = {}
+    for facet in FACETS:
+        values = [value for value in args.getlist(facet) if value != '']
+        if facet == 'is_hiring':
+            values = [None if value == NONE_VALUE else _parse_is_hiring(value) for value in values]
+        else:
+            values = [None if value == NONE_VALUE else value for value in values]
+        if values:
+            filters[facet] = list(dict.fromkeys(values))
+    return filters
+
+
+def facet_condition(filters, exclude=None):
+    """(sql, params) ANDing the filters of every facet except `exclude`"""
+    clauses, params = [], []
+    for facet, values in filters.items():
+        if facet == exclude:
+            continue
+        present = [value for value in values if value is not None]
+        alternatives = []
+        if present:
+            alternatives.append(f"{facet} IN ({','.join(['?'] * len(present))})")
+            params += present
+        if None in values:
+            alternatives.append(f"{facet} IS NULL OR {facet} = ''")
+        clauses.append(alternatives[0] if len(alternatives) == 1 else f"({' OR '.join(alternatives)})")
+    return ' AND '.join(clauses), params
+
+
+def facet_counts(conn, filters, where='', params=(), limit=DEFAULT_FACET_LIMIT):
+    """Counts per value for every facet, most common first
+
+    Each dimension's counts apply the filters of the other dimensions but not
+    its own, so the UI can show how many results picking another value adds.
+    `where`/`params` add further conditions (e.g. the name search).
+    """
+    counts = {}
+    for facet in FACETS:
+        condition, condition_params = facet_condition(filters, exclude=facet)
+        sql = f'SELECT {facet}, COUNT(*) AS count FROM companies WHERE {LISTED_COMPANY}'
+        for extra in (condition, where):
+            if extra:
+                sql += f' AND {extra}'
+        sql += f' GROUP BY {facet} ORDER BY count DESC, {facet} LIMIT ?'
+        rows = conn.execute(sql, [*condition_params, *params, limit]).fetchall()
+        # NULL and '' are both "no value" (NONE_VALUE), so they are reported together
+        merged = {}
+        for value, count in rows:
+            key = None if value == '' else value
+            merged[key] = merged.get(key, 0) + count
+        counts[facet] = [{'value': value, 'count': count}
+                         for value, count in sorted(merged.items(), key=lambda item: -item[1])]
+    return counts
+
+
+if __name__ == "__main__":
+    db_path = sys.argv[1] if len(sys.argv) > 1 else 'yc_companies.db'
+
+    conn = sqlite3.connect(db_path)
+    setup_company_facets(conn)
+    counts = facet_counts(conn, {}, limit=10)
+    conn.close()
+
+    for facet, values in counts.items():
+        print(f"{facet}:")
+        for entry in values:
+            print(f"   {entry['value']!s:<40} {entry['count']}")
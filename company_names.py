@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Company name normalization
+Computes the clean display_name (and its sort key) once at write time so
+readers and the frontend never have to clean names per row
+"""
+
+import re
+import sqlite3
+import sys
+
+# Scraped names sometimes have the location glued on, e.g. "AcmeSanFrancisco, CA, USA"
+GLUED_LOCATION = re.compile(r'[A-Z][a-z]+[A-Z][a-z]+,?\s+[A-Z]{2},?\s+[A-Z]{2,}')
+
+US_STATE_SUFFIX = re.compile(r', [A-Z]{2}, USA$')
+
+COUNTRIES = (
+    r'United States|USA|United Kingdom|UK|Canada|Germany|France|Spain|Italy|Netherlands|Belgium|'
+    r'Switzerland|Austria|Sweden|Norway|Denmark|Finland|Poland|Czech Republic|Hungary|Romania|Bulgaria|'
+    r'Greece|Portugal|Ireland|Croatia|Slovenia|Slovakia|Lithuania|Latvia|Estonia|Luxembourg|Malta|Cyprus|'
+    r'Iceland|Liechtenstein|Monaco|San Marino|Vatican City|Andorra|Gibraltar|Australia|New Zealand|Japan|'
+    r'South Korea|China|India|Singapore|Hong Kong|Taiwan|Thailand|Malaysia|Indonesia|Philippines|Vietnam|'
+    r'Cambodia|Laos|Myanmar|Bangladesh|Sri Lanka|Pakistan|Nepal|Bhutan|Maldives|Afghanistan|Iran|Iraq|'
+    r'Saudi Arabia|UAE|Qatar|Kuwait|Bahrain|Oman|Yemen|Jordan|Lebanon|Syria|Israel|Palestine|Turkey|'
+    r'Georgia|Armenia|Azerbaijan|Kazakhstan|Uzbekistan|Turkmenistan|Tajikistan|Kyrgyzstan|Mongolia|'
+    r'North Korea|Russia|Belarus|Ukraine|Moldova|Serbia|Montenegro|Bosnia and Herzegovina|North Macedonia|'
+    r'Albania|Kosovo'
+)
+
+COUNTRY_SUFFIX = re.compile(rf', ({COUNTRIES})$', re.IGNORECASE)
+
+CITIES = (
+    r'San Francisco|New York|Los Angeles|Boston|Seattle|Austin|Chicago|Denver|Miami|Portland|Remote|'
+    r'Berlin|London|Toronto|Vancouver|Tel Aviv|Bangalore|Singapore|Tokyo|Sydney|Melbourne|Paris|Amsterdam|'
+    r'Stockholm|Copenhagen|Zurich|Dublin|Madrid|Barcelona|Milan|Rome|Vienna|Prague|Warsaw|Helsinki|Oslo|'
+    r'Brussels|Lisbon|Athens|Dubai|Hong Kong|Shanghai|Beijing|Mumbai|Delhi|Hyderabad|Chennai|Pune|Kolkata|'
+    r'Jakarta|Manila|Bangkok|Hanoi|Seoul|Taipei|Kuala Lumpur|Mexico City|São Paulo|Rio de Janeiro|'
+    r'Buenos Aires|Santiago|Lima|Bogotá|Caracas|Montevideo|Lagos|Nairobi|Cairo|Johannesburg|Cape Town|'
+    r'Casablanca|Tunis|Algiers|Accra|Addis Ababa|Dakar|Kampala|Dar es Salaam|Kigali|Khartoum|Kinshasa|'
+    r'Luanda|Maputo|Harare|Lusaka|Windhoek|Gaborone|Abidjan|Kingston|Santo Domingo|Havana|San Juan|'
+    r'Nassau|Bridgetown|Hamilton|George Town'
+)
+
+# A city is only a location when the data's location shape is there: a
+# ", City" tail, or the city followed by ", ST, Country" / ", Country",
+# either glued on CamelCase ("AcmeSanFrancisco, CA, USA") or after a space.
+# Case-sensitive, so real names like "Salima", "BuildRemote" or "Pineapple
+# Rome" are left alone.
+_GLUED_CITIES = CITIES.replace(' ', ' ?')
+CITY_WITH_REGION = re.compile(
+    rf'(?:(?<=[a-z0-9])|\s*,\s*|\s+)({_GLUED_CITIES})(?:,\s*[A-Z]{{2}})?,\s*({COUNTRIES})$'
+)
+CITY_SUFFIX = re.compile(rf'\s*,\s*({CITIES})$')
+
+
+def clean_company_name(name):
+    """Return the display name for a raw scraped company name
+
+    Keeps the first line only and strips a location that was concatenated
+    onto the name. A suffix is only stripped if something is left over, so a
+    company actually called "Remote" or "Victoria" keeps its name.
+    """
+    if not name:
+        return ''
+    name = GLUED_LOCATION.sub('', name)
+    name = name.split('\n')[0].strip()
+    for pattern in (CITY_WITH_REGION, US_STATE_SUFFIX, COUNTRY_SUFFIX, CITY_SUFFIX):
+        stripped = pattern.sub('', name).strip()
+        if stripped:
+            name = stripped
+    return name
+
+
+def company_sort_key(display_name):
+    """Case-insensitive sort key stored alongside display_name"""
+    return (display_name or '').casefold()
+
+
+def display_name_columns(name):
+    """(display_name, sort_name) pair for a raw name, ready to bind into SQL"""
+    display_name = clean_company_name(name)
+    return display_name, company_sort_key(display_name)
+
+
+# Bump when clean_company_name() changes: setup_display_names() then recomputes every row
+NAME_RULES_VERSION = 2
+
+# Writers should bind display_name_columns(). For rows written without them
+# (or a renamed company) the triggers fill in the first line of the name in
+# SQL, so no row is left without a display name. The location suffixes need
+# the regexes above and are only stripped by display_name_columns() or a
+# `python3 company_names.py` recompute.
+FIRST_LINE = "trim(substr({0}, 1, instr({0} || char(10), char(10)) - 1), ' ' || char(9) || char(13))"
+
+TRIGGERS = {
+    'display_names_after_insert': f"""
+        CREATE TRIGGER display_names_after_insert AFTER INSERT ON companies
+        WHEN NEW.display_name IS NULL
+        BEGIN
+            UPDATE companies SET display_name = {FIRST_LINE.format('NEW.name')},
+                                 sort_name = lower({FIRST_LINE.format('NEW.name')})
+            WHERE id = NEW.id;
+        END
+    """,
+    'display_names_after_update': f"""
+        CREATE TRIGGER display_names_after_update AFTER UPDATE OF name ON companies
+        WHEN NEW.name IS NOT OLD.name AND NEW.display_name IS OLD.display_name
+        BEGIN
+            UPDATE companies SET display_name = {FIRST_LINE.format('NEW.name')},
+                                 sort_name = lower({FIRST_LINE.format('NEW.name')})
+            WHERE id = NEW.id;
+        END
+    """,
+}
+
+
+def setup_display_names(conn):
+    """Add the display_name/sort_name columns, indexes and triggers, then backfill missing rows"""
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(companies)')}
+    if 'display_name' not in columns:
+        conn.execute('ALTER TABLE companies ADD COLUMN display_name TEXT')
+    if 'sort_name' not in columns:
+        conn.execute('ALTER TABLE companies ADD COLUMN sort_name TEXT')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_companies_display_name ON companies(display_name)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_companies_sort_name ON companies(sort_name)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_companies_batch_sort_name ON companies(batch, sort_name)')
+    existing = dict(conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger'").fetchall())
+    # Triggers are recreated whenever their definition in this file changes
+    for name, sql in TRIGGERS.items():
+        if existing.get(name) != sql.strip():
+            conn.execute(f'DROP TRIGGER IF EXISTS {name}')
+            conn.execute(sql)
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS display_name_rules (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL
+        )
+    ''')
+    row = conn.execute('SELECT version FROM display_name_rules WHERE id = 1').fetchone()
+    conn.execute('''
+        INSERT INTO display_name_rules (id, version) VALUES (1, ?)
+        ON CONFLICT(id) DO UPDATE SET version = excluded.version
+    ''', (NAME_RULES_VERSION,))
+    # Names computed by older rules are recomputed once
+    return backfill_display_names(conn, rebuild=row is None or row[0] != NAME_RULES_VERSION)
+
+
+def backfill_display_names(conn, rebuild=False):
+    """Fill display_name/sort_name for rows that don't have one yet (or all rows)"""
+    query = 'SELECT id, name FROM companies'
+    if not rebuild:
+        query += ' WHERE display_name IS NULL'
+    rows = conn.execute(query).fetchall()
+    # Rows whose names come out the same aren't rewritten
+    conn.executemany(
+        'UPDATE companies SET display_name = ?1, sort_name = ?2 '
+        'WHERE id = ?3 AND (display_name IS NOT ?1 OR sort_name IS NOT ?2)',
+        [(*display_name_columns(name), company_id) for company_id, name in rows]
+    )
+    conn.commit()
+    return len(rows)
+
+
+if __name__ == "__main__":
+    db_path = sys.argv[1] if len(sys.argv) > 1 else 'yc_companies.db'
+
+    conn = sqlite3.connect(db_path)
+    setup_display_names(conn)
+    updated = backfill_display_names(conn, rebuild=True)
+    conn.close()
+
+    print(f"✅ Recomputed display names for {updated} companies")
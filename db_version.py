@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Database write counter
+Triggers bump a single counter on every write to the tables the web app
+serves, so readers can tell "nothing changed since version N" with one
+primary-key lookup (used for ETags and response caching)
+"""
+
+import sqlite3
+import sys
+
+# Tables whose writes change what the API returns (derived tables like
+# stats_rollup and company_changes are only written alongside these)
+VERSIONED_TABLES = ('companies', 'founders', 'company_texts', 'founder_texts')
+
+
+def _triggers(tables):
+    triggers = {}
+    for table in tables:
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            name = f'version_{table}_after_{event.lower()}'
+            triggers[name] = f"""
+        CREATE TRIGGER {name} AFTER {event} ON {table}
+        BEGIN
+            UPDATE db_version SET version = version + 1 WHERE id = 1;
+        END
+    """
+    return triggers
+
+
+def setup_db_version(conn):
+    """Create the counter row and the triggers for the versioned tables that exist"""
+    existing = dict(conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type IN ('table', 'trigger')"
+    ).fetchall())
+    triggers = _triggers(table for table in VERSIONED_TABLES if table in existing)
+    # Triggers are recreated whenever their definition in this file changes
+    if 'db_version' in existing and all(existing.get(name) == sql.strip() for name, sql in triggers.items()):
+        return False
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS db_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL
+        )
+    ''')
+    conn.execute('INSERT OR IGNORE INTO db_version (id, version) VALUES (1, 0)')
+    for name, sql in triggers.items():
+        conn.execute(f'DROP TRIGGER IF EXISTS {name}')
+        conn.execute(sql)
+    conn.commit()
+    return True
+
+
+def read_db_version(conn):
+    """Current write counter (0 before setup_db_version has run)"""
+    try:
+        row = conn.execute('SELECT version FROM db_version WHERE id = 1').fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return row[0] if row else 0
+
+
+if __name__ == "__main__":
+    db_path = sys.argv[1] if len(sys.argv) > 1 else 'yc_companies.db'
+
+    conn = sqlite3.connect(db_path)
+    setup_db_version(conn)
+    version = read_db_version(conn)
+    conn.close()
+
+    print(f"✅ Database write version: {version}")
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Write-behind database writer shared by the scrapers
+One background thread owns the SQLite connection and commits queued
+statements in batches, so fetch workers never wait on a per-company fsync
+"""
+
+import atexit
+import queue
+import sqlite3
+import threading
+import time
+
+from text_storage import founder_bio_statement
+
+# bio is stored in founder_texts, see text_storage.py. An unchanged founder
+# leaves the row alone, so re-scrapes don't show up in the change log
+FOUNDER_UPSERT_SQL = '''
+    INSERT INTO founders
+    (company_id, company_name, name, role, previous_company, linkedin_url, twitter_url, yc_profile_url)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(company_name, name) DO UPDATE SET
+        company_id = excluded.company_id, role = excluded.role,
+        previous_company = excluded.previous_company, linkedin_url = excluded.linkedin_url,
+        twitter_url = excluded.twitter_url, yc_profile_url = excluded.yc_profile_url
+    WHERE (company_id, role, previous_company, linkedin_url, twitter_url, yc_profile_url)
+        IS NOT (excluded.company_id, excluded.role, excluded.previous_company,
+                excluded.linkedin_url, excluded.twitter_url, excluded.yc_profile_url)
+'''
+
+_STOP = object()
+
+# How often a blocked producer checks that the writer thread is still alive
+LIVENESS_INTERVAL = 0.5
+
+
+class DBWriter:
+    """Queue SQL writes from any number of threads and commit them in batches
+
+    Records are committed every `batch_size` statements or `flush_interval`
+    seconds, whichever comes first. At most `max_pending` records may be
+    queued; `write()` blocks beyond that so fast fetchers can't outrun the disk.
+    If the writer thread fails (can't open the database, commit raises), its
+    error is re-raised from the next `write()`, `flush()` or `close()`.
+    """
+
+    def __init__(self, db_path='yc_companies.db', batch_size=200, flush_interval=0.5, max_pending=1000):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.queue = None
+        self.written = 0
+        self.errors = 0
+        self._thread = None
+        self._error = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def start(self):
+        """Start the writer thread (called automatically on first write)"""
+        with self._lock:
+            if self._thread is None:
+                self.queue = queue.Queue(maxsize=self.max_pending)
+                self._thread = threading.Thread(target=self._run, args=(self.queue,), name='db-writer', daemon=True)
+                self._thread.start()
+                # Only a running writer has anything to commit at exit; close() unregisters it
+                atexit.register(self.close)
+
+    def write(self, sql, params=(), label=None):
+        """Queue one statement; blocks while the queue is full (backpressure)"""
+        if self._thread is None:
+            self.start()
+        self._put(self._thread, self.queue, (sql, params, label))
+
+    def _put(self, thread, pending, item):
+        """Queue an item, raising instead of blocking forever if the writer thread has died"""
+        while True:
+            self._raise_error()
+            if not thread.is_alive():
+                raise RuntimeError('database writer thread is not running')
+            try:
+                pending.put(item, timeout=LIVENESS_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def write_founders(self, company_id, company_name, founders):
+        """Queue an upsert for each founder dict, returns the number queued"""
+        queued = 0
+        for founder in founders:
+            if not founder.get('name'):
+                print(f"  Skipping founder without a name for {company_name or 'company'}")
+                continue
+            self.write(FOUNDER_UPSERT_SQL, (
+                company_id,
+                company_name,
+                founder.get('name'),
+                founder.get('role'),
+                founder.get('previous_company'),
+                founder.get('linkedin_url'),
+                founder.get('twitter_url'),
+                founder.get('yc_profile_url')
+            ), label=f"founder {founder.get('name')}")
+            if founder.get('bio'):
+                sql, params = founder_bio_statement(company_name, founder.get('name'), founder.get('bio'))
+                self.write(sql, params, label=f"bio for {founder.get('name')}")
+            queued += 1
+        return queued
+
+    def flush(self, timeout=None):
+        """Block until everything queued so far has been committed
+
+        Returns False if `timeout` seconds pass first.
+        """
+        thread = self._thread
+        if thread is None:
+            self._raise_error()
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        done = threading.Event()
+        self._put(thread, self.queue, done)
+        while True:
+            wait = LIVENESS_INTERVAL if deadline is None else min(LIVENESS_INTERVAL, deadline - time.monotonic())
+            if done.wait(max(0, wait)) or not thread.is_alive():
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+        self._raise_error()
+        return done.is_set()
+
+    def close(self):
+        """Commit all pending records durably and stop the writer thread
+
+        Call once the fetch workers are done; a later write() starts a new thread.
+        """
+        with self._lock:
+            thread, pending = self._thread, self.queue
+            self._thread = None
+        if thread is not None:
+            atexit.unregister(self.close)
+            while thread.is_alive():
+                try:
+                    pending.put(_STOP, timeout=LIVENESS_INTERVAL)
+                    break
+                except queue.Full:
+                    continue
+            thread.join()
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        # WAL lets the web app keep reading while a batch is being written;
+        # synchronous=NORMAL skips the fsync on every batch commit
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def _commit(self, conn, batch):
+        if not batch:
+            return
+        cursor = conn.cursor()
+        for sql, params, label in batch:
+            try:
+                cursor.execute(sql, params)
+                self.written += 1
+            except Exception as e:
+                self.errors += 1
+                print(f"  Error saving {label or 'record'}: {e}")
+        conn.commit()
+        batch.clear()
+
+    def _run(self, pending):
+        conn = None
+        batch = []
+        try:
+            conn = self._connect()
+            self._loop(conn, pending, batch)
+            # Final commit is fully synced and checkpointed so nothing is lost on exit
+            conn.execute('PRAGMA synchronous=FULL')
+            self._commit(conn, batch)
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        except Exception as e:
+            # Saved for the producers: write(), flush() and close() re-raise it
+            self._error = e
+            print(f"  ❌ Database writer stopped: {e}")
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def _loop(self, conn, pending, batch):
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0, deadline - time.monotonic())
+            try:
+                item = pending.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                break
+            if isinstance(item, threading.Event):
+                self._commit(conn, batch)
+                deadline = None
+                item.set()
+                continue
+            if item is not None:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if len(batch) >= self.batch_size or (deadline is not None and time.monotonic() >= deadline):
+                self._commit(conn, batch)
+                deadline = None
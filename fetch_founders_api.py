@@ -8,29 +8,37 @@ import requests
 import sqlite3
 import json
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 
+from db_writer import DBWriter
+from scrape_profile import ScrapeProfiler
+from scrape_telemetry import ScrapeRun, set_method, stage, timed, wait
+from server_control import reload_server
+
 class FounderApiFetcher:
     def __init__(self, db_path='yc_companies.db'):
         self.db_path = db_path
+        self.writer = DBWriter(db_path)
         
     def get_company_page_json(self, company_slug: str) -> Optional[Dict]:
         """Get JSON data from a company page"""
         url = f"https://www.ycombinator.com/companies/{company_slug}"
         
         try:
-            response = requests.get(url, headers={
+            response = timed('fetch', requests.get, url, headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
             })
             response.raise_for_status()
             
             # Extract __NEXT_DATA__ JSON
-            match = re.search(r'window\.__NEXT_DATA__\s*=\s*({.+?});', response.text, re.DOTALL)
-            if match:
-                return json.loads(match.group(1))
+            with stage('parse'):
+                match = re.search(r'window\.__NEXT_DATA__\s*=\s*({.+?});', response.text, re.DOTALL)
+                if match:
+                    return json.loads(match.group(1))
         except Exception as e:
             print(f"    Error fetching {company_slug}: {e}")
+            raise
         
         return None
     
@@ -104,45 +112,25 @@ class FounderApiFetcher:
             return 0
         
         # Extract founders
-        founders = self.extract_founders_from_json(json_data)
+        with stage('parse'):
+            founders = self.extract_founders_from_json(json_data)
         
         if not founders:
             return 0
         
-        # Save founders
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        saved = 0
-        for founder in founders:
-            try:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO founders 
-                    (company_id, company_name, name, role, previous_company, 
-                     linkedin_url, twitter_url, yc_profile_url, bio)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    company_id,
-                    company_name,
-                    founder['name'],
-                    founder['role'],
-                    founder['previous_company'],
-                    founder['linkedin_url'],
-                    founder['twitter_url'],
-                    founder['yc_profile_url'],
-                    founder['bio']
-                ))
-                saved += 1
-            except Exception as e:
-                print(f"    Error saving founder {founder['name']}: {e}")
-        
-        conn.commit()
-        conn.close()
-        
-        return saved
+        # Queue founders for the background writer
+        set_method('next_data_json')
+        with stage('db'):
+            return self.writer.write_founders(company_id, company_name, founders)
     
-    def fetch_all_founders(self, limit: Optional[int] = None, delay: float = 0.5):
-        """Fetch founders for all companies"""
+    def fetch_all_founders(self, limit: Optional[int] = None, delay: float = 0.5, workers: int = 1):
+        """Fetch founders for all companies
+        
+        Args:
+            limit: Maximum number of companies to process
+            delay: Seconds each worker waits between requests
+            workers: Number of concurrent fetch workers (writes still go through one DB writer)
+        """
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
@@ -169,32 +157,46 @@ class FounderApiFetcher:
             print("All companies already have founders!")
             return
         
-        total_founders = 0
-        
-        for i, (company_id, company_name, yc_url) in enumerate(companies, 1):
+        def fetch_one(args):
+            i, (company_id, company_name, yc_url) = args
             clean_name = company_name.split('\n')[0] if company_name else 'Unknown'
-            print(f"[{i}/{len(companies)}] Fetching founders for {clean_name}...")
-            
-            count = self.fetch_founders_for_company(company_id, clean_name, yc_url)
-            
-            if count > 0:
-                total_founders += count
-                print(f"  ✅ Found {count} founder(s)")
-            else:
-                print(f"  ⚠️  No founders found")
-            
-            if i < len(companies):
-                time.sleep(delay)
+            with run.company(company_id, clean_name) as event:
+                try:
+                    count = self.fetch_founders_for_company(company_id, clean_name, yc_url)
+                except Exception as e:
+                    event.fail(e)
+                    count = 0
+                event.found(count)
+                
+                if count > 0:
+                    print(f"[{i}/{len(companies)}] {clean_name}: ✅ Found {count} founder(s)")
+                else:
+                    print(f"[{i}/{len(companies)}] {clean_name}: ⚠️  No founders found")
+                
+                if i < len(companies):
+                    wait(delay)
+            return count
+        
+        try:
+            with ScrapeRun('fetch_founders_api', total=len(companies), db_path=self.db_path, writer=self.writer) as run:
+                with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+                    total_founders = sum(pool.map(fetch_one, enumerate(companies, 1)))
+        finally:
+            self.writer.close()
         
         print(f"\n✅ Done! Fetched {total_founders} total founders")
 
 if __name__ == "__main__":
     import sys
     
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
     limit = None
-    if len(sys.argv) > 1:
-        limit = int(sys.argv[1])
+    if args:
+        limit = int(args[0])
+    workers = int(args[1]) if len(args) > 1 else 1
     
     fetcher = FounderApiFetcher()
-    fetcher.fetch_all_founders(limit=limit, delay=0.5)
+    with ScrapeProfiler.from_argv('fetch_founders_api'):
+        fetcher.fetch_all_founders(limit=limit, delay=0.5, workers=workers)
+    reload_server()
 
@@ -0,0 +1,59 @@
+"""
+Gunicorn configuration for serving the dashboard in production
+Run with `python3 start_server.py --production` or `gunicorn app:app` from this
+directory (gunicorn picks this file up automatically)
+"""
+
+import multiprocessing
+import os
+import tempfile
+
+bind = os.environ.get('BIND', '0.0.0.0:5001')
+
+# Requests are short SQLite reads plus JSON encoding (CPU bound, GIL held), so
+# scale with processes; a few threads per worker cover time spent in sqlite/IO
+# and keep slow streaming clients from blocking a whole worker.
+workers = int(os.environ.get('WEB_WORKERS', min(multiprocessing.cpu_count() * 2 + 1, 9)))
+threads = int(os.environ.get('WEB_THREADS', 4))
+worker_class = 'gthread'
+
+# Import the app once in the master (schema setup happens there, with write
+# access) and fork workers from it
+preload_app = True
+raw_env = ['DB_READ_ONLY=1']
+
+timeout = 30
+graceful_timeout = 30
+keepalive = 5
+
+# Scrapers signal this master (SIGHUP) through server_control.reload_server()
+pidfile = os.environ.get('GUNICORN_PIDFILE', 'gunicorn.pid')
+
+# Workers flush their request metrics here; /metrics sums all of them
+os.environ.setdefault('METRICS_DIR', os.path.join(tempfile.gettempdir(), f'yc-metrics-{os.getpid()}'))
+
+accesslog = '-'
+errorlog = '-'
+loglevel = 'info'
+
+
+def when_ready(server):
+    from app import metrics, prepare_database
+
+    prepare_database()
+    # Counters start from zero with every master; old worker files would be summed in
+    metrics.clear_directory()
+    server.log.info("Database schema ready; workers use read-only connections")
+
+
+def post_fork(server, worker):
+    # Each worker starts with its own empty response cache
+    from app import response_cache
+
+    response_cache.clear()
+
+
+def on_exit(server):
+    from app import metrics
+
+    metrics.clear_directory()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Streaming JSON/NDJSON encoding and response compression
+Large lists are serialized row by row straight from the database cursor, so
+memory stays flat and the first bytes go out before the last row is read
+"""
+
+import json
+import os
+import zlib
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used instead
+    orjson = None
+
+# JSON_ENCODER=stdlib forces the stdlib encoder even when orjson is installed
+if os.environ.get('JSON_ENCODER') == 'stdlib':
+    orjson = None
+
+# Rows are encoded (and yielded) this many at a time
+ROWS_PER_BATCH = 500
+
+# Bodies smaller than this aren't worth compressing
+COMPRESS_MIN_BYTES = 1024
+
+# wbits for zlib.compressobj: gzip container vs zlib ("deflate" in HTTP terms)
+_WBITS = {'gzip': 31, 'deflate': 15}
+
+
+def dumps(obj):
+    """Serialize to compact UTF-8 JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _batches(rows):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= ROWS_PER_BATCH:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def iter_json_array(columns, rows):
+    """Yield a JSON array of objects for tuple rows as byte chunks"""
+    yield b'['
+    separator = b''
+    for batch in _batches(rows):
+        # Encode a whole batch at once and drop its brackets
+        yield separator + dumps([dict(zip(columns, row)) for row in batch])[1:-1]
+        separator = b','
+    yield b']\n'
+
+
+def iter_ndjson(columns, rows):
+    """Yield newline-delimited JSON (one object per row) as byte chunks"""
+    for batch in _batches(rows):
+        yield b'\n'.join(dumps(dict(zip(columns, row))) for row in batch) + b'\n'
+
+
+def columnar_json(columns, rows):
+    """Encode tuple rows as one array per column: {"id": [...], "name": [...]}
+
+    Column names are sent once instead of once per row. Needs the whole list in
+    memory, so it is meant for pages and moderately sized lists.
+    """
+    values = list(zip(*rows)) or [()] * len(columns)
+    return dumps({column: list(column_values) for column, column_values in zip(columns, values)})
+
+
+def negotiate_encoding(accept_encoding, encodings=('gzip', 'deflate')):
+    """Pick the first of `encodings` an Accept-Encoding header allows, or None"""
+    offered = {}
+    for part in (accept_encoding or '').split(','):
+        name, _, params = part.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        offered[name.strip().lower()] = quality
+    for encoding in encodings:
+        if offered.get(encoding, offered.get('*', 0)) > 0:
+            return encoding
+    return None
+
+
+def compress_bytes(data, encoding, level=6):
+    """Compress a whole body"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _WBITS[encoding])
+    return compressor.compress(data) + compressor.flush()
+
+
+def iter_compressed(chunks, encoding, level=6):
+    """Compress a stream of byte chunks, flushing after each so clients see progress"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _WBITS[encoding])
+    try:
+        for chunk in chunks:
+            data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            if data:
+                yield data
+        yield compressor.flush()
+    finally:
+        # Close the source so its database cursor is released on client disconnect
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Request metrics for the web app
+Per-route request counts, latency/response size/SQL time histograms, a
+Server-Timing header and Prometheus text exposition. With several worker
+processes (gunicorn) each worker flushes its totals to METRICS_DIR and
+/metrics sums the files of all workers.
+"""
+
+import glob
+import json
+import os
+import sqlite3
+import threading
+import time
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# How often a worker writes its totals to METRICS_DIR (seconds)
+FLUSH_INTERVAL = 1.0
+
+# SQL time of the request being handled by this thread
+_current = threading.local()
+
+
+class TimedCursor(sqlite3.Cursor):
+    """Cursor adding the time spent in execute/fetch calls to the current request"""
+
+    def execute(self, *args):
+        start = time.perf_counter()
+        try:
+            return super().execute(*args)
+        finally:
+            add_sql_time(time.perf_counter() - start)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        try:
+            return super().fetchone()
+        finally:
+            add_sql_time(time.perf_counter() - start)
+
+    def fetchmany(self, *args):
+        start = time.perf_counter()
+        try:
+            return super().fetchmany(*args)
+        finally:
+            add_sql_time(time.perf_counter() - start)
+
+    def fetchall(self):
+        start = time.perf_counter()
+        try:
+            return super().fetchall()
+        finally:
+            add_sql_time(time.perf_counter() - start)
+
+
+class TimedConnection(sqlite3.Connection):
+    """sqlite3.connect(..., factory=TimedConnection) to count SQL time per request
+
+    Rows read by iterating a cursor (streamed lists) are not timed one by one;
+    their cost shows up in the request latency instead.
+    """
+
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, *args):
+        return self.cursor().execute(*args)
+
+
+def add_sql_time(seconds):
+    if getattr(_current, 'active', False):
+        _current.sql += seconds
+
+
+def start_request():
+    _current.active = True
+    _current.sql = 0.0
+
+
+def request_sql_time():
+    return getattr(_current, 'sql', 0.0)
+
+
+def end_request():
+    _current.active = False
+    return request_sql_time()
+
+
+class _Histogram:
+    __slots__ = ('counts', 'sum', 'count')
+
+    def __init__(self, buckets):
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, buckets, value):
+        for i, bound in enumerate(buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.sum += value
+        self.count += 1
+
+
+class Metrics:
+    """Totals for one process, optionally flushed to a shared directory"""
+
+    def __init__(self, directory=None):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.requests = {}   # (route, method, status) -> count
+        self.latency = {}    # (route, method) -> _Histogram
+        self.sizes = {}      # route -> _Histogram
+        self.sql = {}        # route -> _Histogram
+        self._pid = os.getpid()
+        self._dirty = False
+        self._flusher = None
+
+    def record(self, route, method, status, seconds, size, sql_seconds):
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked after requests were recorded: start this worker's own totals
+                self._reset()
+            key = (route, method, str(status))
+            self.requests[key] = self.requests.get(key, 0) + 1
+            self.latency.setdefault((route, method), _Histogram(LATENCY_BUCKETS)).observe(LATENCY_BUCKETS, seconds)
+            self.sizes.setdefault(route, _Histogram(SIZE_BUCKETS)).observe(SIZE_BUCKETS, size)
+            self.sql.setdefault(route, _Histogram(LATENCY_BUCKETS)).observe(LATENCY_BUCKETS, sql_seconds)
+            self._dirty = True
+            if self.directory and self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+                self._flusher.start()
+
+    def snapshot(self):
+        """This process's totals as plain JSON-able lists"""
+        with self._lock:
+            if self._pid != os.getpid():
+                self._reset()
+            return {
+                'requests': [[*key, count] for key, count in self.requests.items()],
+                'latency': [[*key, h.counts, h.sum, h.count] for key, h in self.latency.items()],
+                'sizes': [[key, h.counts, h.sum, h.count] for key, h in self.sizes.items()],
+                'sql': [[key, h.counts, h.sum, h.count] for key, h in self.sql.items()],
+            }
+
+    def flush(self):
+        """Write this process's totals to METRICS_DIR (atomic replace)"""
+        if not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f'worker-{os.getpid()}.json')
+        tmp_path = f'{path}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.snapshot(), f)
+        os.replace(tmp_path, path)
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(FLUSH_INTERVAL)
+            if self._dirty:
+                self._dirty = False
+                self.flush()
+
+    def collect(self):
+        """Totals of every worker (or just this process without a directory)"""
+        if not self.directory:
+            return [self.snapshot()]
+        self.flush()
+        snapshots = []
+        for path in glob.glob(os.path.join(self.directory, 'worker-*.json')):
+            try:
+                with open(path) as f:
+                    snapshots.append(json.load(f))
+            except (OSError, ValueError):
+                continue  # being replaced right now; picked up next scrape
+        return snapshots
+
+    def render(self):
+        """Prometheus text exposition format (version 0.0.4)"""
+        requests, latency, sizes, sql = {}, {}, {}, {}
+        for snapshot in self.collect():
+            for *key, count in snapshot['requests']:
+                requests[tuple(key)] = requests.get(tuple(key), 0) + count
+            for target, rows, width in ((latency, snapshot['latency'], 2),
+                                        (sizes, snapshot['sizes'], 1),
+                                        (sql, snapshot['sql'], 1)):
+                for row in rows:
+                    key, (counts, total, count) = tuple(row[:width]), row[width:]
+                    merged = target.setdefault(key, [[0] * len(counts), 0.0, 0])
+                    merged[0] = [a + b for a, b in zip(merged[0], counts)]
+                    merged[1] += total
+                    merged[2] += count
+
+        lines = [
+            '# HELP http_requests_total Requests handled, by route, method and status.',
+            '# TYPE http_requests_total counter',
+        ]
+        for (route, method, status), count in sorted(requests.items()):
+            lines.append(f'http_requests_total{{route="{_escape(route)}",method="{method}",'
+                         f'status="{status}"}} {count}')
+        lines += _histogram_lines(
+            'http_request_duration_seconds', 'Time until the whole response body was sent.',
+            latency, ('route', 'method'), LATENCY_BUCKETS
+        )
+        lines += _histogram_lines(
+            'http_response_size_bytes', 'Response body size as sent (after compression).',
+            sizes, ('route',), SIZE_BUCKETS
+        )
+        lines += _histogram_lines(
+            'http_request_sql_seconds', 'Time spent in SQLite execute/fetch calls per request.',
+            sql, ('route',), LATENCY_BUCKETS
+        )
+        return '\n'.join(lines) + '\n'
+
+    def clear_directory(self):
+        """Drop the files of previous workers (call once in the master at startup)"""
+        if self.directory:
+            for path in glob.glob(os.path.join(self.directory, 'worker-*.json*')):
+                os.remove(path)
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _histogram_lines(name, help_text, histograms, label_names, buckets):
+    lines = [f'# HELP {name} {help_text}', f'# TYPE {name} histogram']
+    for key, (counts, total, count) in sorted(histograms.items()):
+        labels = ','.join(f'{label}="{_escape(value)}"' for label, value in zip(label_names, key))
+        cumulative = 0
+        for bound, bucket_count in zip(buckets, counts):
+            cumulative += bucket_count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {count}')
+        lines.append(f'{name}_sum{{{labels}}} {total}')
+        lines.append(f'{name}_count{{{labels}}} {count}')
+    return lines
+
+
+class MetricsMiddleware:
+    """WSGI middleware timing each request until its last body chunk is sent
+
+    The route label is the matched URL rule (e.g. /api/companies/<int:company_id>),
+    set by the app in `environ['metrics.route']`; unmatched paths count as "unmatched".
+    Views that set `environ['metrics.stream']` are timed until their headers only.
+    """
+
+    def __init__(self, wsgi_app, metrics):
+        self.wsgi_app = wsgi_app
+        self.metrics = metrics
+
+    def __call__(self, environ, start_response):
+        start = time.perf_counter()
+        start_request()
+        status = ['500']
+        content_length = [0]
+
+        def _start_response(status_line, headers, exc_info=None):
+            status[0] = status_line.split(' ', 1)[0]
+            for name, value in headers:
+                if name.lower() == 'content-length':
+                    content_length[0] = int(value)
+            return start_response(status_line, headers, exc_info)
+
+        try:
+            body = self.wsgi_app(environ, _start_response)
+        except Exception:
+            self._record(environ, status[0], start, 0)
+            raise
+        file_wrapper = environ.get('wsgi.file_wrapper')
+        if isinstance(file_wrapper, type) and isinstance(body, file_wrapper):
+            # Leave static files to the server's sendfile path
+            self._record(environ, status[0], start, content_length[0])
+            return body
+        if environ.get('metrics.stream'):
+            # Long-lived streams (server-sent events): time them until the
+            # headers are ready, their lifetime would swamp the histograms
+            self._record(environ, status[0], start, 0)
+            return body
+        return _CountingBody(body, lambda size: self._record(environ, status[0], start, size))
+
+    def _record(self, environ, status, start, size):
+        sql_seconds = end_request()
+        self.metrics.record(environ.get('metrics.route', 'unmatched'), environ.get('REQUEST_METHOD', ''),
+                            status, time.perf_counter() - start, size, sql_seconds)
+
+
+class _CountingBody:
+    """Response iterable counting bytes sent; reports once the server closes it"""
+
+    def __init__(self, body, on_close):
+        self._body = body
+        self._on_close = on_close
+        self._size = 0
+
+    def __iter__(self):
+        for chunk in self._body:
+            self._size += len(chunk)
+            yield chunk
+
+    def close(self):
+        try:
+            close = getattr(self._body, 'close', None)
+            if close is not None:
+                close()
+        finally:
+            self._on_close(self._size)
@@ -1,16 +1,26 @@
 #!/usr/bin/env python3
 """
 Real-time progress monitor for the founder scraper
+Reads the scrape_runs/scrape_events telemetry written by the scrapers (see
+scrape_telemetry.py) for throughput, ETA, per-stage timings and error rates.
+
+Usage: python monitor_progress.py [--once]
 """
 
 import sqlite3
+import sys
 import time
 import os
 import subprocess
 
-def get_stats():
+from scrape_telemetry import ERROR, STAGES, pid_alive
+
+# Throughput and the stage breakdown cover the last N seconds of events
+TELEMETRY_WINDOW = 300
+
+def get_stats(db_path='yc_companies.db'):
     """Get current database statistics"""
-    conn = sqlite3.connect('yc_companies.db')
+    conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     
     # Total founders
@@ -62,6 +72,154 @@ def get_stats():
         'recent_founders': recent_founders
     }
 
+def get_run_stats(db_path='yc_companies.db', window=TELEMETRY_WINDOW):
+    """Telemetry for the running (or most recent) scrape run, or None if there is none"""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute('''
+            SELECT COUNT(*) FROM sqlite_master
+            WHERE type = 'table' AND name IN ('scrape_runs', 'scrape_events')
+        ''')
+        if cursor.fetchone()[0] < 2:
+            return None
+    
+        # Prefer a run whose process is alive; a killed scraper leaves its row 'running'
+        cursor.execute("SELECT * FROM scrape_runs WHERE status = 'running' ORDER BY id DESC")
+        run = next((row for row in cursor.fetchall() if pid_alive(row['pid'])), None)
+        live = run is not None
+        if run is None:
+            cursor.execute('SELECT * FROM scrape_runs ORDER BY id DESC LIMIT 1')
+            run = cursor.fetchone()
+        if run is None:
+            return None
+    
+        cursor.execute('''
+            SELECT COUNT(*) AS done, SUM(items) AS items, MAX(finished_at) AS last_finished
+            FROM scrape_events
+            WHERE run_id = ?
+        ''', (run['id'],))
+        totals = cursor.fetchone()
+    
+        cursor.execute('''
+            SELECT outcome, COUNT(*) FROM scrape_events
+            WHERE run_id = ?
+            GROUP BY outcome
+        ''', (run['id'],))
+        outcomes = dict(cursor.fetchall())
+    
+        cursor.execute('''
+            SELECT COALESCE(method, 'unknown'), COUNT(*) FROM scrape_events
+            WHERE run_id = ? AND outcome != ?
+            GROUP BY 1
+            ORDER BY 2 DESC
+            LIMIT 8
+        ''', (run['id'], ERROR))
+        methods = cursor.fetchall()
+    
+        # Rolling window: ends now for a live run, at its last event otherwise
+        if live:
+            window_end = time.time()
+        else:
+            window_end = totals['last_finished'] or run['finished_at'] or run['started_at']
+        window_start = max(window_end - window, run['started_at'])
+        averages = ', '.join(f'AVG({name}_ms) AS {name}_ms' for name in STAGES)
+        cursor.execute(f'''
+            SELECT COUNT(*) AS events, SUM(outcome = ?) AS errors, {averages}
+            FROM scrape_events
+            WHERE run_id = ? AND finished_at > ? AND finished_at <= ?
+        ''', (ERROR, run['id'], window_start, window_end))
+        recent = cursor.fetchone()
+    finally:
+        conn.close()
+    
+    done = totals['done']
+    span = window_end - window_start
+    rate = recent['events'] / span if span > 0 else 0.0  # companies per second
+    remaining = max(run['total'] - done, 0) if run['total'] is not None else None
+    eta = remaining / rate if live and remaining is not None and rate > 0 else None
+    
+    stage_ms = {name: recent[f'{name}_ms'] or 0.0 for name in STAGES}
+    stage_total = sum(stage_ms.values())
+    
+    if live:
+        status = 'running'
+    elif run['status'] == 'running':
+        status = 'stopped'  # process gone without finishing the run
+    else:
+        status = run['status']
+    
+    return {
+        'id': run['id'],
+        'scraper': run['scraper'],
+        'pid': run['pid'],
+        'live': live,
+        'status': status,
+        'started_at': run['started_at'],
+        'finished_at': run['finished_at'],
+        'total': run['total'],
+        'done': done,
+        'remaining': remaining,
+        'items': totals['items'] or 0,
+        'outcomes': outcomes,
+        'error_rate': outcomes.get(ERROR, 0) / done if done else 0.0,
+        'methods': methods,
+        'window': span,
+        'window_events': recent['events'],
+        'window_error_rate': (recent['errors'] or 0) / recent['events'] if recent['events'] else 0.0,
+        'rate_per_min': rate * 60,
+        'eta_seconds': eta,
+        'stage_ms': stage_ms,
+        'stage_share': {name: ms / stage_total if stage_total else 0.0 for name, ms in stage_ms.items()}
+    }
+
+def format_duration(seconds):
+    """Format seconds as e.g. '1h 05m', '4m 12s' or '9s'"""
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds}s"
+
+def print_run_stats(run):
+    """Print throughput, ETA, stage breakdown and error rates for a run"""
+    end = time.time() if run['live'] else (run['finished_at'] or time.time())
+    print(f"🏃 Run #{run['id']}: {run['scraper']} (pid {run['pid']}) - {run['status']}, "
+          f"{format_duration(end - run['started_at'])} elapsed")
+    
+    total = run['total'] if run['total'] is not None else '?'
+    print(f"   • Companies processed: {run['done']}/{total} ({run['items']} items found)")
+    if run['live']:
+        eta = format_duration(run['eta_seconds']) if run['eta_seconds'] is not None else 'unknown'
+        print(f"   • Throughput: {run['rate_per_min']:.1f} companies/min "
+              f"(last {format_duration(run['window'])}) | ETA: {eta}")
+    else:
+        print(f"   • Throughput: {run['rate_per_min']:.1f} companies/min "
+              f"(final {format_duration(run['window'])})")
+    
+    outcomes = ', '.join(f"{outcome}: {count}" for outcome, count in sorted(run['outcomes'].items()))
+    print(f"   • Outcomes: {outcomes or 'none yet'}")
+    print(f"   • Error rate: {run['error_rate'] * 100:.1f}% overall, "
+          f"{run['window_error_rate'] * 100:.1f}% recent")
+    print()
+    
+    if run['window_events']:
+        print(f"⏱️  Time per company (avg of last {run['window_events']}):")
+        for name in STAGES:
+            share = run['stage_share'][name]
+            bar = "█" * round(share * 20)
+            print(f"   {name:<6} {run['stage_ms'][name]:>8.0f} ms  {share * 100:5.1f}%  {bar}")
+        print()
+    
+    if run['methods']:
+        print("🔎 Extraction methods:")
+        for method, count in run['methods']:
+            print(f"   • {method}: {count}")
+        print()
+
 def get_scraper_log_tail(n=10):
     """Get last N lines from scraper log"""
     try:
@@ -74,7 +232,7 @@ def get_scraper_log_tail(n=10):
     return []
 
 def is_scraper_running():
-    """Check if scraper process is running"""
+    """Check if scraper process is running (used when there is no run telemetry yet)"""
     try:
         result = subprocess.run(
             ['pgrep', '-f', 'scrape_founders_simple.py'],
@@ -85,19 +243,24 @@ def is_scraper_running():
     except:
         return False
 
-def main():
-    print("\033[2J\033[H")  # Clear screen
+def main(db_path='yc_companies.db', clear=True):
+    if clear:
+        print("\033[2J\033[H")  # Clear screen
     print("=" * 80)
     print("YC FOUNDER SCRAPER - PROGRESS MONITOR")
     print("=" * 80)
     print()
     
-    running = is_scraper_running()
+    run = get_run_stats(db_path)
+    running = run['live'] if run else is_scraper_running()
     status = "🟢 RUNNING" if running else "🔴 STOPPED"
     print(f"Scraper Status: {status}")
     print()
     
-    stats = get_stats()
+    if run:
+        print_run_stats(run)
+    
+    stats = get_stats(db_path)
     
     # Progress bar
     progress_pct = (stats['companies_with_founders'] / stats['total_companies'] * 100) if stats['total_companies'] > 0 else 0
@@ -128,6 +291,9 @@ def main():
             print(f"   • {name} @ {company_clean}{social_str}")
         print()
     
+    if not clear:
+        return
+    
     # Recent log activity
     log_lines = get_scraper_log_tail(5)
     if log_lines:
@@ -145,10 +311,13 @@ def main():
     print("=" * 80)
 
 if __name__ == "__main__":
+    if '--once' in sys.argv[1:]:
+        main(clear=False)
+        sys.exit(0)
+    
     try:
         while True:
             main()
             time.sleep(3)
     except KeyboardInterrupt:
         print("\n\nMonitoring stopped.")
-
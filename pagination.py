@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Keyset pagination helpers for the list endpoints
+A page is fetched with WHERE (sort key) > (last key seen) ... LIMIT n, so every
+page costs the same index range scan no matter how deep the client pages.
+The last key is handed to the client as an opaque cursor token.
+"""
+
+import base64
+import json
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def encode_cursor(values):
+    """Opaque, URL-safe token for a sort key tuple"""
+    raw = json.dumps(list(values), separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token, size):
+    """Inverse of encode_cursor; raises ValueError for malformed or mismatched tokens"""
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f'invalid cursor: {e}')
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError('invalid cursor: wrong number of sort keys')
+    return values
+
+
+def keyset_condition(columns, values, descending=False):
+    """(sql, params) selecting rows that sort after `values` on `columns`
+
+    Uses a row-value comparison so SQLite can seek the index. Only the first
+    column may be NULL (SQLite sorts NULLs first ascending, last descending);
+    the rest must be NOT NULL.
+    """
+    op = '<' if descending else '>'
+    first, rest = columns[0], ', '.join(columns[1:])
+    placeholders = ', '.join(['?'] * len(columns))
+    rest_placeholders = ', '.join(['?'] * (len(columns) - 1))
+    if values[0] is None:
+        if descending:
+            return f'({first} IS NULL AND ({rest}) < ({rest_placeholders}))', list(values[1:])
+        return (f'({first} IS NOT NULL OR ({first} IS NULL AND ({rest}) > ({rest_placeholders})))',
+                list(values[1:]))
+    condition = f'({", ".join(columns)}) {op} ({placeholders})'
+    if descending:
+        condition += f' OR {first} IS NULL'
+    return f'({condition})', list(values)
+
+
+def parse_sort(value, available, default):
+    """Parse sort=<key> or sort=-<key> (descending), returns (key, descending)
+
+    Raises ValueError for keys that aren't in `available`.
+    """
+    value = value or default
+    descending = value.startswith('-')
+    key = value.lstrip('-')
+    if key not in available:
+        raise ValueError(f"unknown sort: {key} (available: {', '.join(available)})")
+    return key, descending
+
+
+def parse_page_size(value, default=None):
+    """Clamp a requested page size to 1..MAX_PAGE_SIZE (None means no paging)"""
+    if value is None:
+        return default
+    return max(1, min(value, MAX_PAGE_SIZE))
+
+
+def parse_fields(value, available, default):
+    """Validate a comma-separated fields= list against the available projections
+
+    Returns the field names in request order; raises ValueError on unknown names.
+    """
+    if not value:
+        return list(default)
+    fields = [field.strip() for field in value.split(',') if field.strip()]
+    unknown = [field for field in fields if field not in available]
+    if unknown:
+        raise ValueError(f"unknown fields: {', '.join(unknown)} (available: {', '.join(available)})")
+    return list(dict.fromkeys(fields))
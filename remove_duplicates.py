@@ -6,9 +6,12 @@ Keeps the most complete entry (most non-null fields)
 
 import sqlite3
 
+from text_storage import setup_text_storage
+
 def remove_duplicates(db_path='yc_companies.db'):
     """Remove duplicate companies, keeping the best entry for each"""
     conn = sqlite3.connect(db_path)
+    setup_text_storage(conn)
     cursor = conn.cursor()
     
     removed_count = 0
@@ -32,8 +35,10 @@ def remove_duplicates(db_path='yc_companies.db'):
         for yc_url, count in url_duplicates:
             # Get all entries for this URL
             cursor.execute('''
-                SELECT id, name, batch, description, website, location, industry, 
-                       is_hiring, yc_url, created_at
+                SELECT id, name, batch,
+                       COALESCE(description, (SELECT t.description FROM company_texts t
+                                              WHERE t.company_id = companies.id)),
+                       website, location, industry, is_hiring, yc_url, created_at
                 FROM companies 
                 WHERE yc_url = ?
                 ORDER BY created_at DESC
@@ -106,8 +111,10 @@ def remove_duplicates(db_path='yc_companies.db'):
         for company_name, count in name_duplicates:
             # Get all entries for this company
             cursor.execute('''
-                SELECT id, name, batch, description, website, location, industry, 
-                       is_hiring, yc_url, created_at
+                SELECT id, name, batch,
+                       COALESCE(description, (SELECT t.description FROM company_texts t
+                                              WHERE t.company_id = companies.id)),
+                       website, location, industry, is_hiring, yc_url, created_at
                 FROM companies 
                 WHERE name = ?
                 ORDER BY created_at DESC
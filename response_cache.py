@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+In-process cache of serialized API responses
+Entries are tagged with the database write version they were built from; as
+soon as a newer version is seen every older entry is dropped, so a scrape is
+visible on the next request. Size is bounded by entry count and total bytes
+(least recently used goes first) and entries also expire after a TTL.
+"""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+CacheEntry = namedtuple('CacheEntry', ['version', 'body', 'headers', 'status', 'stored_at'])
+
+
+class ResponseCache:
+    """Thread-safe LRU/TTL cache of response bodies keyed by (route, args, encoding)"""
+
+    def __init__(self, max_entries=256, max_bytes=64 * 1024 * 1024, ttl=300,
+                 max_entry_bytes=8 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_entry_bytes = max_entry_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._version = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.max_entries > 0
+
+    def get(self, key, version):
+        """Return the entry for key if it was built at this version and hasn't expired"""
+        with self._lock:
+            self._observe_version(version)
+            entry = self._entries.get(key)
+            if entry is not None and (entry.version != version or time.monotonic() - entry.stored_at > self.ttl):
+                self._remove(key)
+                self.invalidations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, version, body, headers, status=200):
+        """Store a response body; oversized bodies and stale versions are ignored"""
+        if not self.enabled or len(body) > self.max_entry_bytes:
+            return False
+        with self._lock:
+            # A slow request may finish after a newer version was seen; its body is stale
+            if version != self._version:
+                return False
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = CacheEntry(version, body, headers, status, time.monotonic())
+            self._bytes += len(body)
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+            return True
+
+    def tee(self, key, version, chunks, headers, status=200):
+        """Pass a streamed body through, storing it once it has been sent completely
+
+        Stops collecting (but keeps streaming) once the body exceeds
+        max_entry_bytes; nothing is stored if the client disconnects.
+        """
+        collected, size = [], 0
+        try:
+            for chunk in chunks:
+                if collected is not None:
+                    size += len(chunk)
+                    if size > self.max_entry_bytes:
+                        collected = None
+                    else:
+                        collected.append(chunk)
+                yield chunk
+            if collected is not None:
+                self.put(key, version, b''.join(collected), headers, status)
+        finally:
+            close = getattr(chunks, 'close', None)
+            if close is not None:
+                close()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'version': self._version,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
+
+    def _observe_version(self, version):
+        """Drop everything built from another database version (newer, or a replaced file)"""
+        if version != self._version:
+            if self._entries:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+            self._version = version
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.body)
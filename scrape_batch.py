@@ -3,7 +3,6 @@
 Scrape batch information from YC company pages
 """
 
-import time
 import sqlite3
 import re
 import json
@@ -11,9 +10,15 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 
+from db_writer import DBWriter
+from scrape_profile import ScrapeProfiler
+from scrape_telemetry import ScrapeRun, record_error, timed, wait
+from server_control import reload_server
+
 class BatchScraper:
     def __init__(self, db_path='yc_companies.db'):
         self.db_path = db_path
+        self.writer = DBWriter(db_path)
         
     def setup_driver(self):
         chrome_options = Options()
@@ -27,8 +32,8 @@ class BatchScraper:
         """Extract batch information from company page (assumes page is already loaded if company_url is None)"""
         try:
             if company_url:
-                driver.get(company_url)
-                time.sleep(3)
+                timed('fetch', driver.get, company_url)
+                wait(3)
             
             page_text = driver.find_element(By.TAG_NAME, 'body').text
             
@@ -66,14 +71,15 @@ class BatchScraper:
             if 'invalid session id' in error_msg.lower() or 'session deleted' in error_msg.lower():
                 raise RuntimeError("Browser session crashed - need to restart driver")
             print(f"    Error extracting batch: {e}")
+            record_error(e)
             return None
     
     def extract_location(self, driver, company_url=None):
         """Extract location information from company page (assumes page is already loaded if company_url is None)"""
         try:
             if company_url:
-                driver.get(company_url)
-                time.sleep(3)
+                timed('fetch', driver.get, company_url)
+                wait(3)
             
             # Common false positives to filter out
             false_positives = {
@@ -277,6 +283,7 @@ class BatchScraper:
             if 'invalid session id' in error_msg.lower() or 'session deleted' in error_msg.lower():
                 raise RuntimeError("Browser session crashed - need to restart driver")
             print(f"    Error extracting location: {e}")
+            record_error(e)
             return None
     
     def scrape_all(self):
@@ -285,7 +292,7 @@ class BatchScraper:
         
         # Get companies without batch data or location
         cursor.execute('''
-            SELECT id, name, yc_url 
+            SELECT id, name, yc_url, batch, location 
             FROM companies
             WHERE yc_url LIKE "%/companies/%" 
             AND yc_url NOT LIKE "%?%" 
@@ -307,105 +314,103 @@ class BatchScraper:
         updated_count = 0
         
         try:
-            for i, (company_id, company_name, yc_url) in enumerate(companies, 1):
-                clean_name = company_name.split('\n')[0]
-                print(f"[{i}/{len(companies)}] {clean_name}")
-                
-                batch = None
-                location = None
-                
-                try:
-                    batch = self.extract_batch(driver, yc_url)
-                except RuntimeError as e:
-                    if "Browser session crashed" in str(e):
-                        print(f"  ⚠️  Browser session crashed, restarting driver...")
-                        try:
-                            driver.quit()
-                        except:
-                            pass
-                        driver = self.setup_driver()
-                        print(f"  ✓ Driver restarted, retrying...")
+            with ScrapeRun('scrape_batch', total=len(companies), db_path=self.db_path, writer=self.writer) as run:
+                for i, (company_id, company_name, yc_url, existing_batch, existing_location) in enumerate(companies, 1):
+                    clean_name = company_name.split('\n')[0]
+                    print(f"[{i}/{len(companies)}] {clean_name}")
+                    
+                    with run.company(company_id, clean_name) as event:
+                        batch = None
+                        location = None
+                        
                         try:
                             batch = self.extract_batch(driver, yc_url)
-                        except Exception as retry_e:
-                            print(f"    Error on retry: {retry_e}")
-                            batch = None
-                    else:
-                        raise
-                
-                # Extract location (reuse the same page load - pass None to skip reloading)
-                location = None
-                try:
-                    if batch is not None:
-                        # Page already loaded, reuse it
-                        location = self.extract_location(driver, None)
-                    else:
-                        # Batch extraction failed, try location extraction with fresh page load
-                        location = self.extract_location(driver, yc_url)
-                except RuntimeError as e:
-                    if "Browser session crashed" in str(e):
-                        print(f"  ⚠️  Browser session crashed during location extraction, restarting driver...")
-                        try:
-                            driver.quit()
-                        except:
-                            pass
-                        driver = self.setup_driver()
-                        print(f"  ✓ Driver restarted, retrying location...")
+                        except RuntimeError as e:
+                            if "Browser session crashed" in str(e):
+                                print(f"  ⚠️  Browser session crashed, restarting driver...")
+                                try:
+                                    driver.quit()
+                                except:
+                                    pass
+                                driver = self.setup_driver()
+                                print(f"  ✓ Driver restarted, retrying...")
+                                try:
+                                    batch = self.extract_batch(driver, yc_url)
+                                except Exception as retry_e:
+                                    print(f"    Error on retry: {retry_e}")
+                                    batch = None
+                            else:
+                                raise
+                        
+                        # Extract location (reuse the same page load - pass None to skip reloading)
+                        location = None
                         try:
-                            location = self.extract_location(driver, yc_url)
-                        except Exception as retry_e:
-                            print(f"    Error on retry: {retry_e}")
-                            location = None
-                    else:
-                        raise
-                
-                # Update database with batch and/or location
-                if batch or location:
-                    conn = sqlite3.connect(self.db_path)
-                    cursor = conn.cursor()
-                    
-                    # Check what needs updating
-                    cursor.execute('SELECT batch, location FROM companies WHERE id = ?', (company_id,))
-                    existing = cursor.fetchone()
-                    existing_batch, existing_location = existing if existing else (None, None)
-                    
-                    # Only update if we have new data
-                    if batch and batch != existing_batch:
-                        cursor.execute('''
-                            UPDATE companies 
-                            SET batch = ? 
-                            WHERE id = ?
-                        ''', (batch, company_id))
-                        print(f"  ✅ Batch: {batch}")
-                        updated_count += 1
-                    
-                    if location and location != existing_location:
-                        cursor.execute('''
-                            UPDATE companies 
-                            SET location = ? 
-                            WHERE id = ?
-                        ''', (location, company_id))
-                        print(f"  ✅ Location: {location}")
-                        if not batch:
-                            updated_count += 1
-                    elif not location:
-                        print(f"  ⚠️  No location found")
-                    
-                    conn.commit()
-                    conn.close()
-                else:
-                    print(f"  ⚠️  No batch or location found")
-                
-                time.sleep(2)  # Be respectful
+                            if batch is not None:
+                                # Page already loaded, reuse it
+                                location = self.extract_location(driver, None)
+                            else:
+                                # Batch extraction failed, try location extraction with fresh page load
+                                location = self.extract_location(driver, yc_url)
+                        except RuntimeError as e:
+                            if "Browser session crashed" in str(e):
+                                print(f"  ⚠️  Browser session crashed during location extraction, restarting driver...")
+                                try:
+                                    driver.quit()
+                                except:
+                                    pass
+                                driver = self.setup_driver()
+                                print(f"  ✓ Driver restarted, retrying location...")
+                                try:
+                                    location = self.extract_location(driver, yc_url)
+                                except Exception as retry_e:
+                                    print(f"    Error on retry: {retry_e}")
+                                    location = None
+                            else:
+                                raise
+                        
+                        found = [field for field, value in (('batch', batch), ('location', location)) if value]
+                        event.found(len(found), method='+'.join(found) or None)
+                        
+                        # Update database with batch and/or location
+                        with event.stage('db'):
+                            if batch or location:
+                                # Only update if we have new data
+                                if batch and batch != existing_batch:
+                                    self.writer.write('''
+                                        UPDATE companies 
+                                        SET batch = ? 
+                                        WHERE id = ?
+                                    ''', (batch, company_id), label=f"batch for {clean_name}")
+                                    print(f"  ✅ Batch: {batch}")
+                                    updated_count += 1
+                                
+                                if location and location != existing_location:
+                                    self.writer.write('''
+                                        UPDATE companies 
+                                        SET location = ? 
+                                        WHERE id = ?
+                                    ''', (location, company_id), label=f"location for {clean_name}")
+                                    print(f"  ✅ Location: {location}")
+                                    if not batch:
+                                        updated_count += 1
+                                elif not location:
+                                    print(f"  ⚠️  No location found")
+                            else:
+                                print(f"  ⚠️  No batch or location found")
+                        
+                        wait(2)  # Be respectful
         finally:
             try:
                 driver.quit()
             except:
                 pass
+            self.writer.close()
         
         print(f"\n✅ Done! Updated {updated_count}/{len(companies)} companies with batch and/or location data")
 
 if __name__ == "__main__":
     scraper = BatchScraper()
-    scraper.scrape_all()
+    with ScrapeProfiler.from_argv('scrape_batch'):
+        scraper.scrape_all()
+    reload_server()
 
@@ -4,7 +4,6 @@ Scrape Active Founders from YC company pages
 Specifically targets the "Active Founders" section on each company page
 """
 
-import time
 import sqlite3
 import re
 from selenium import webdriver
@@ -15,9 +14,15 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import json
 
+from db_writer import DBWriter
+from scrape_profile import ScrapeProfiler
+from scrape_telemetry import ScrapeRun, extraction_step, record_error, timed, wait
+from server_control import reload_server
+
 class FounderScraper:
     def __init__(self, db_path='yc_companies.db'):
         self.db_path = db_path
+        self.writer = DBWriter(db_path)
         self.setup_database()
         
     def setup_database(self):
@@ -69,15 +74,16 @@ class FounderScraper:
         founders = []
         
         try:
-            driver.get(company_url)
-            time.sleep(5)  # Wait for page to load
+            timed('fetch', driver.get, company_url)
+            wait(5)  # Wait for page to load
             
             # Scroll to load any lazy-loaded content
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            wait(2)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
+            wait(1)
             
+            extraction_step('active_founders', len(founders))
             # Method 1: Look for "Active Founders" section
             try:
                 # Try to find section with "Active Founders" text
@@ -108,6 +114,7 @@ class FounderScraper:
             except Exception as e:
                 print(f"  Note: Could not find Active Founders section: {e}")
             
+            extraction_step('next_data_json', len(founders))
             # Method 2: Extract from JSON data (most reliable)
             try:
                 json_data = driver.execute_script("""
@@ -128,6 +135,7 @@ class FounderScraper:
             except Exception as e:
                 print(f"  Note: JSON parsing error: {e}")
             
+            extraction_step('people_links', len(founders))
             # Method 2.5: Look for ALL people links and check context more carefully
             try:
                 people_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/people/']")
@@ -231,6 +239,7 @@ class FounderScraper:
             except Exception as e:
                 print(f"  Note: People links method error: {e}")
             
+            extraction_step('text_patterns', len(founders))
             # Method 3: Extract founders from text patterns (e.g., "We're X and Y, founders")
             try:
                 page_text = driver.find_element(By.TAG_NAME, "body").text
@@ -281,6 +290,7 @@ class FounderScraper:
             except Exception as e:
                 pass
             
+            extraction_step('founder_cards', len(founders))
             # Method 4: Look for founder cards by structure
             try:
                 # Look for elements that contain name + role + company info
@@ -306,6 +316,7 @@ class FounderScraper:
             
         except Exception as e:
             print(f"Error extracting founders from {company_url}: {e}")
+            record_error(e)
             return []
     
     def _extract_founder_from_element(self, element, company_name):
@@ -469,68 +480,53 @@ class FounderScraper:
         
         try:
             driver = self.setup_driver()
-            for i, (company_id, company_name, yc_url) in enumerate(companies, 1):
-                # Clean company name
-                clean_company_name = company_name.split('\n')[0] if company_name else 'Unknown'
-                
-                print(f"[{i}/{len(companies)}] Scraping {clean_company_name}...")
-                
-                founders = self.extract_founders_from_page(driver, yc_url, clean_company_name)
-                
-                if founders:
-                    self.save_founders(company_id, clean_company_name, founders)
-                    total_founders += len(founders)
-                    founder_names = ', '.join([f['name'] for f in founders])
-                    print(f"  ✓ Found {len(founders)} founder(s): {founder_names}")
-                else:
-                    print(f"  - No founders found")
-                
-                # Delay between requests to avoid rate limiting
-                if i < len(companies):
-                    time.sleep(delay)
+            with ScrapeRun('scrape_founders', total=len(companies), db_path=self.db_path, writer=self.writer) as run:
+                for i, (company_id, company_name, yc_url) in enumerate(companies, 1):
+                    # Clean company name
+                    clean_company_name = company_name.split('\n')[0] if company_name else 'Unknown'
+                    
+                    print(f"[{i}/{len(companies)}] Scraping {clean_company_name}...")
                     
+                    with run.company(company_id, clean_company_name) as event:
+                        founders = self.extract_founders_from_page(driver, yc_url, clean_company_name)
+                        
+                        event.found(len(founders))
+                        
+                        if founders:
+                            with event.stage('db'):
+                                self.save_founders(company_id, clean_company_name, founders)
+                            total_founders += len(founders)
+                            founder_names = ', '.join([f['name'] for f in founders])
+                            print(f"  ✓ Found {len(founders)} founder(s): {founder_names}")
+                        else:
+                            print(f"  - No founders found")
+                        
+                        # Delay between requests to avoid rate limiting
+                        if i < len(companies):
+                            wait(delay)
+
         finally:
             driver.quit()
+            self.writer.close()
         
         print(f"\n{'='*80}")
         print(f"Scraping complete! Found {total_founders} total founders")
         print(f"{'='*80}")
     
     def save_founders(self, company_id, company_name, founders):
-        """Save founders to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        for founder in founders:
-            try:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO founders 
-                    (company_id, company_name, name, role, previous_company, linkedin_url, twitter_url, yc_profile_url, bio)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    company_id,
-                    company_name,
-                    founder.get('name'),
-                    founder.get('role'),
-                    founder.get('previous_company'),
-                    founder.get('linkedin_url'),
-                    founder.get('twitter_url'),
-                    founder.get('yc_profile_url'),
-                    founder.get('bio')
-                ))
-            except Exception as e:
-                print(f"  Error saving founder {founder.get('name')}: {e}")
-        
-        conn.commit()
-        conn.close()
+        """Queue founders for the background DB writer"""
+        self.writer.write_founders(company_id, company_name, founders)
 
 if __name__ == "__main__":
     import sys
     
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
     limit = None
-    if len(sys.argv) > 1:
-        limit = int(sys.argv[1])
+    if args:
+        limit = int(args[0])
     
     scraper = FounderScraper()
-    scraper.scrape_all_companies(limit=limit, delay=2)
+    with ScrapeProfiler.from_argv('scrape_founders'):
+        scraper.scrape_all_companies(limit=limit, delay=2)
+    reload_server()
 
@@ -3,7 +3,6 @@
 Browser-based founder scraper - manually visits each page and extracts founders
 """
 
-import time
 import sqlite3
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -12,9 +11,15 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import re
 
+from db_writer import DBWriter
+from scrape_profile import ScrapeProfiler
+from scrape_telemetry import ScrapeRun, extraction_step, record_error, timed, wait
+from server_control import reload_server
+
 class BrowserFounderScraper:
     def __init__(self, db_path='yc_companies.db'):
         self.db_path = db_path
+        self.writer = DBWriter(db_path)
         self.setup_database()
         
     def setup_database(self):
@@ -66,14 +71,14 @@ class BrowserFounderScraper:
         
         try:
             print(f"  Visiting: {company_url}")
-            driver.get(company_url)
-            time.sleep(5)  # Wait for page to load
+            timed('fetch', driver.get, company_url)
+            wait(5)  # Wait for page to load
             
             # Scroll to load all content
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            wait(2)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
+            wait(1)
             
             page_text = driver.find_element(By.TAG_NAME, "body").text
             page_text_lower = page_text.lower()
@@ -83,6 +88,7 @@ class BrowserFounderScraper:
                           'jessica livingston', 'trevor blackwell', 'robert morris',
                           'pete koomen'}
             
+            extraction_step('active_founders', len(founders))
             # METHOD 1: Find "Active Founders" section and extract names
             try:
                 active_founders_headings = driver.find_elements(By.XPATH, "//*[contains(text(), 'Active Founders')]")
@@ -191,6 +197,7 @@ class BrowserFounderScraper:
             except Exception as e:
                 pass
             
+            extraction_step('text_patterns', len(founders))
             # METHOD 2: Extract from text patterns if no founders found
             if len(founders) == 0:
                 # Look for patterns like "we're X and Y" or "@X and @Y"
@@ -229,12 +236,13 @@ class BrowserFounderScraper:
                                             'bio': None
                                         })
             
+            extraction_step('people_page', len(founders))
             # METHOD 3: Visit /people/ page if no founders found
             if len(founders) == 0:
                 try:
                     people_url = company_url.rstrip('/') + '/people'
-                    driver.get(people_url)
-                    time.sleep(4)
+                    timed('fetch', driver.get, people_url)
+                    wait(4)
                     
                     # Get all /people/ links
                     people_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/people/']")
@@ -249,8 +257,8 @@ class BrowserFounderScraper:
                                 name.lower() not in yc_partners):
                                 
                                 # Visit profile
-                                driver.get(href)
-                                time.sleep(2)
+                                timed('fetch', driver.get, href)
+                                wait(2)
                                 
                                 profile_text = driver.find_element(By.TAG_NAME, "body").text.lower()
                                 
@@ -270,14 +278,14 @@ class BrowserFounderScraper:
                                         })
                                 
                                 # Go back to people page
-                                driver.get(people_url)
-                                time.sleep(1)
+                                timed('fetch', driver.get, people_url)
+                                wait(1)
                         except:
                             continue
                     
                     # Go back to company page
-                    driver.get(company_url)
-                    time.sleep(2)
+                    timed('fetch', driver.get, company_url)
+                    wait(2)
                 except:
                     pass
             
@@ -285,6 +293,7 @@ class BrowserFounderScraper:
             
         except Exception as e:
             print(f"  Error extracting founders: {e}")
+            record_error(e)
             return []
     
     def _find_social_links(self, driver):
@@ -336,66 +345,51 @@ class BrowserFounderScraper:
         total_founders = 0
         
         try:
-            for i, (company_id, company_name, yc_url) in enumerate(companies, 1):
-                clean_company_name = company_name.split('\n')[0] if company_name else 'Unknown'
-                
-                print(f"[{i}/{len(companies)}] Processing {clean_company_name}...")
-                
-                founders = self.extract_founders_from_page(driver, yc_url, clean_company_name)
-                
-                if founders:
-                    self.save_founders(company_id, clean_company_name, founders)
-                    total_founders += len(founders)
-                    founder_names = ', '.join([f['name'] for f in founders])
-                    print(f"  ✅ Found {len(founders)} founder(s): {founder_names}")
-                else:
-                    print(f"  ⚠️  No founders found")
-                
-                if i < len(companies):
-                    time.sleep(delay)
+            with ScrapeRun('scrape_founders_browser', total=len(companies), db_path=self.db_path, writer=self.writer) as run:
+                for i, (company_id, company_name, yc_url) in enumerate(companies, 1):
+                    clean_company_name = company_name.split('\n')[0] if company_name else 'Unknown'
+                    
+                    print(f"[{i}/{len(companies)}] Processing {clean_company_name}...")
                     
+                    with run.company(company_id, clean_company_name) as event:
+                        founders = self.extract_founders_from_page(driver, yc_url, clean_company_name)
+                        
+                        event.found(len(founders))
+                        
+                        if founders:
+                            with event.stage('db'):
+                                self.save_founders(company_id, clean_company_name, founders)
+                            total_founders += len(founders)
+                            founder_names = ', '.join([f['name'] for f in founders])
+                            print(f"  ✅ Found {len(founders)} founder(s): {founder_names}")
+                        else:
+                            print(f"  ⚠️  No founders found")
+                        
+                        if i < len(companies):
+                            wait(delay)
+
         finally:
             driver.quit()
+            self.writer.close()
         
         print(f"\n{'='*80}")
         print(f"Scraping complete! Found {total_founders} total founders")
         print(f"{'='*80}")
     
     def save_founders(self, company_id, company_name, founders):
-        """Save founders to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        for founder in founders:
-            try:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO founders 
-                    (company_id, company_name, name, role, previous_company, linkedin_url, twitter_url, yc_profile_url, bio)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    company_id,
-                    company_name,
-                    founder.get('name'),
-                    founder.get('role'),
-                    founder.get('previous_company'),
-                    founder.get('linkedin_url'),
-                    founder.get('twitter_url'),
-                    founder.get('yc_profile_url'),
-                    founder.get('bio')
-                ))
-            except Exception as e:
-                print(f"  Error saving founder {founder.get('name')}: {e}")
-        
-        conn.commit()
-        conn.close()
+        """Queue founders for the background DB writer"""
+        self.writer.write_founders(company_id, company_name, founders)
 
 if __name__ == "__main__":
     import sys
     
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
     limit = None
-    if len(sys.argv) > 1:
-        limit = int(sys.argv[1])
+    if args:
+        limit = int(args[0])
     
     scraper = BrowserFounderScraper()
-    scraper.scrape_all_companies(limit=limit, delay=3)
+    with ScrapeProfiler.from_argv('scrape_founders_browser'):
+        scraper.scrape_all_companies(limit=limit, delay=3)
+    reload_server()
 
@@ -4,7 +4,6 @@ Final, comprehensive Founder Scraper
 Extracts founders using multiple methods including Twitter handles, JSON, and DOM structure
 """
 
-import time
 import sqlite3
 import re
 from selenium import webdriver
@@ -12,9 +11,15 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 import json
 
+from db_writer import DBWriter
+from scrape_profile import ScrapeProfiler
+from scrape_telemetry import ScrapeRun, extraction_step, record_error, timed, wait
+from server_control import reload_server
+
 class FinalFounderScraper:
     def __init__(self, db_path='yc_companies.db'):
         self.db_path = db_path
+        self.writer = DBWriter(db_path)
         self.setup_database()
         
     def setup_database(self):
@@ -64,14 +69,14 @@ class FinalFounderScraper:
         founders = []
         
         try:
-            driver.get(company_url)
-            time.sleep(6)  # Wait for page to fully load
+            timed('fetch', driver.get, company_url)
+            wait(6)  # Wait for page to fully load
             
             # Scroll to ensure all content loads
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            wait(2)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
+            wait(1)
             
             page_text = driver.find_element(By.TAG_NAME, "body").text
             page_text_lower = page_text.lower()
@@ -80,6 +85,7 @@ class FinalFounderScraper:
                           'harj taggar', 'aaron epstein', 'david lieb', 'paul graham',
                           'jessica livingston', 'trevor blackwell', 'robert morris'}
             
+            extraction_step('active_founders', len(founders))
             # METHOD 0: Look for "Active Founders" section explicitly - AGGRESSIVE VERSION
             try:
                 active_founders_heading = driver.find_elements(By.XPATH, "//*[contains(text(), 'Active Founders')]")
@@ -222,6 +228,7 @@ class FinalFounderScraper:
             except Exception as e:
                 pass
             
+            extraction_step('next_data_json', len(founders))
             # METHOD 1: Extract from JSON (most reliable)
             try:
                 json_data = driver.execute_script("""
@@ -241,6 +248,7 @@ class FinalFounderScraper:
             except Exception as e:
                 pass
             
+            extraction_step('people_links', len(founders))
             # METHOD 2: Find ALL /people/ links and check context thoroughly
             # Also visit each profile to check if they're founders
             try:
@@ -265,8 +273,8 @@ class FinalFounderScraper:
                         twitter_url = None
                         
                         try:
-                            driver.get(href)
-                            time.sleep(2)
+                            timed('fetch', driver.get, href)
+                            wait(2)
                             profile_text = driver.find_element(By.TAG_NAME, "body").text.lower()
                             
                             # Check if this person is a founder
@@ -301,12 +309,12 @@ class FinalFounderScraper:
                                             twitter_url = l_href
                             
                             # Go back to company page
-                            driver.get(company_url)
-                            time.sleep(2)
+                            timed('fetch', driver.get, company_url)
+                            wait(2)
                         except:
                             # If profile visit fails, check context on main page
-                            driver.get(company_url)
-                            time.sleep(2)
+                            timed('fetch', driver.get, company_url)
+                            wait(2)
                             
                             # Check if name appears near "founder" in page text
                             name_pos = page_text_lower.find(name.lower())
@@ -333,14 +341,15 @@ class FinalFounderScraper:
                     except Exception as e:
                         # Make sure we're back on company page
                         try:
-                            driver.get(company_url)
-                            time.sleep(1)
+                            timed('fetch', driver.get, company_url)
+                            wait(1)
                         except:
                             pass
                         continue
             except Exception as e:
                 pass
             
+            extraction_step('text_patterns', len(founders))
             # METHOD 3: Extract from text patterns (including Twitter handles) and find their social links
             try:
                 patterns = [
@@ -514,6 +523,7 @@ class FinalFounderScraper:
             except Exception as e:
                 pass
             
+            extraction_step('founder_cards', len(founders))
             # METHOD 4: Look for founder cards/sections by class names
             try:
                 # Look for elements with founder-related classes
@@ -561,18 +571,20 @@ class FinalFounderScraper:
             except Exception as e:
                 pass
             
+            extraction_step('aggressive_search', len(founders))
             # FALLBACK: If no founders found, try more aggressive methods
             if len(founders) == 0:
                 print(f"  ⚠️  No founders found with standard methods, trying aggressive fallback...")
                 founders = self._aggressive_founder_search(driver, company_url, company_name, page_text)
             
+            extraction_step('people_page', len(founders))
             # FINAL FALLBACK: If STILL no founders, visit /people/ page and check ALL people
             if len(founders) == 0:
                 print(f"  ⚠️  Still no founders, checking /people/ page for ALL people...")
                 try:
                     people_url = company_url.rstrip('/') + '/people'
-                    driver.get(people_url)
-                    time.sleep(4)
+                    timed('fetch', driver.get, people_url)
+                    wait(4)
                     
                     people_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/people/']")
                     print(f"    Found {len(people_links)} people links on /people/ page")
@@ -588,8 +600,8 @@ class FinalFounderScraper:
                                 
                                 # Visit profile to confirm
                                 try:
-                                    driver.get(href)
-                                    time.sleep(2)
+                                    timed('fetch', driver.get, href)
+                                    wait(2)
                                     profile_text = driver.find_element(By.TAG_NAME, "body").text.lower()
                                     
                                     # If profile mentions company name or founder, include them
@@ -619,18 +631,18 @@ class FinalFounderScraper:
                                             'bio': None
                                         })
                                 
-                                driver.get(people_url)
-                                time.sleep(1)
+                                timed('fetch', driver.get, people_url)
+                                wait(1)
                         except:
                             continue
                     
-                    driver.get(company_url)
-                    time.sleep(2)
+                    timed('fetch', driver.get, company_url)
+                    wait(2)
                 except Exception as e:
                     print(f"    Error checking /people/ page: {e}")
                     try:
-                        driver.get(company_url)
-                        time.sleep(2)
+                        timed('fetch', driver.get, company_url)
+                        wait(2)
                     except:
                         pass
             
@@ -642,6 +654,7 @@ class FinalFounderScraper:
             if 'invalid session id' in error_msg.lower() or 'session deleted' in error_msg.lower():
                 raise RuntimeError("Browser session crashed - need to restart driver")
             print(f"Error extracting founders: {e}")
+            record_error(e)
             return []
     
     def _aggressive_founder_search(self, driver, company_url, company_name, page_text):
@@ -655,8 +668,8 @@ class FinalFounderScraper:
             # FALLBACK 1: Try visiting /people/ page if it exists
             try:
                 people_url = company_url.rstrip('/') + '/people'
-                driver.get(people_url)
-                time.sleep(4)
+                timed('fetch', driver.get, people_url)
+                wait(4)
                 
                 # Look for all /people/ links on the people page
                 people_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/people/']")
@@ -670,8 +683,8 @@ class FinalFounderScraper:
                             
                             # Check if this person is a founder by looking at their profile page
                             try:
-                                driver.get(href)
-                                time.sleep(3)
+                                timed('fetch', driver.get, href)
+                                wait(3)
                                 profile_text = driver.find_element(By.TAG_NAME, "body").text.lower()
                                 
                                 if 'founder' in profile_text or 'co-founder' in profile_text:
@@ -692,22 +705,22 @@ class FinalFounderScraper:
                                 pass
                             
                             # Go back to people page
-                            driver.get(people_url)
-                            time.sleep(2)
+                            timed('fetch', driver.get, people_url)
+                            wait(2)
                     except:
                         continue
                 
                 # Go back to company page
-                driver.get(company_url)
-                time.sleep(3)
+                timed('fetch', driver.get, company_url)
+                wait(3)
             except Exception as e:
                 pass
             
             # FALLBACK 2: Extract ALL names from /people/ links and check context more carefully
             if len(founders) == 0:
                 try:
-                    driver.get(company_url)
-                    time.sleep(4)
+                    timed('fetch', driver.get, company_url)
+                    wait(4)
                     
                     all_people_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/people/']")
                     for link in all_people_links:
@@ -840,6 +853,7 @@ class FinalFounderScraper:
             
         except Exception as e:
             print(f"  Error in aggressive search: {e}")
+            record_error(e)
             return []
     
     def _find_social_links_for_name(self, name, driver):
@@ -975,87 +989,72 @@ class FinalFounderScraper:
         total_founders = 0
         
         try:
-            for i, (company_id, company_name, yc_url) in enumerate(companies, 1):
-                clean_company_name = company_name.split('\n')[0] if company_name else 'Unknown'
-                
-                print(f"[{i}/{len(companies)}] Scraping {clean_company_name}...")
-                
-                try:
-                    founders = self.extract_founders_from_page(driver, yc_url, clean_company_name)
-                except RuntimeError as e:
-                    if "Browser session crashed" in str(e):
-                        print(f"  ⚠️  Browser session crashed, restarting driver...")
-                        try:
-                            driver.quit()
-                        except:
-                            pass
-                        driver = self.setup_driver()
-                        print(f"  ✓ Driver restarted, retrying...")
+            with ScrapeRun('scrape_founders_final', total=len(companies), db_path=self.db_path, writer=self.writer) as run:
+                for i, (company_id, company_name, yc_url) in enumerate(companies, 1):
+                    clean_company_name = company_name.split('\n')[0] if company_name else 'Unknown'
+                    
+                    print(f"[{i}/{len(companies)}] Scraping {clean_company_name}...")
+                    
+                    with run.company(company_id, clean_company_name) as event:
                         try:
                             founders = self.extract_founders_from_page(driver, yc_url, clean_company_name)
-                        except Exception as retry_e:
-                            print(f"    Error on retry: {retry_e}")
-                            founders = []
-                    else:
-                        raise
-                
-                if founders:
-                    self.save_founders(company_id, clean_company_name, founders)
-                    total_founders += len(founders)
-                    founder_names = ', '.join([f['name'] for f in founders])
-                    print(f"  ✓ Found {len(founders)} founder(s): {founder_names}")
-                else:
-                    print(f"  ❌ WARNING: No founders found for {clean_company_name}")
-                    print(f"     This is unusual - all companies should have founders. Check manually if needed.")
-                
-                if i < len(companies):
-                    time.sleep(delay)
-                    
+                        except RuntimeError as e:
+                            if "Browser session crashed" in str(e):
+                                print(f"  ⚠️  Browser session crashed, restarting driver...")
+                                try:
+                                    driver.quit()
+                                except:
+                                    pass
+                                driver = self.setup_driver()
+                                print(f"  ✓ Driver restarted, retrying...")
+                                try:
+                                    founders = self.extract_founders_from_page(driver, yc_url, clean_company_name)
+                                except Exception as retry_e:
+                                    print(f"    Error on retry: {retry_e}")
+                                    founders = []
+                            else:
+                                raise
+                        
+                        event.found(len(founders))
+                        
+                        if founders:
+                            with event.stage('db'):
+                                self.save_founders(company_id, clean_company_name, founders)
+                            total_founders += len(founders)
+                            founder_names = ', '.join([f['name'] for f in founders])
+                            print(f"  ✓ Found {len(founders)} founder(s): {founder_names}")
+                        else:
+                            print(f"  ❌ WARNING: No founders found for {clean_company_name}")
+                            print(f"     This is unusual - all companies should have founders. Check manually if needed.")
+                        
+                        if i < len(companies):
+                            wait(delay)
+
         finally:
             try:
                 driver.quit()
             except:
                 pass
+            self.writer.close()
         
         print(f"\n{'='*80}")
         print(f"Scraping complete! Found {total_founders} total founders")
         print(f"{'='*80}")
     
     def save_founders(self, company_id, company_name, founders):
-        """Save founders to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        for founder in founders:
-            try:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO founders 
-                    (company_id, company_name, name, role, previous_company, linkedin_url, twitter_url, yc_profile_url, bio)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    company_id,
-                    company_name,
-                    founder.get('name'),
-                    founder.get('role'),
-                    founder.get('previous_company'),
-                    founder.get('linkedin_url'),
-                    founder.get('twitter_url'),
-                    founder.get('yc_profile_url'),
-                    founder.get('bio')
-                ))
-            except Exception as e:
-                print(f"  Error saving founder {founder.get('name')}: {e}")
-        
-        conn.commit()
-        conn.close()
+        """Queue founders for the background DB writer"""
+        self.writer.write_founders(company_id, company_name, founders)
 
 if __name__ == "__main__":
     import sys
     
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
     limit = None
-    if len(sys.argv) > 1:
-        limit = int(sys.argv[1])
+    if args:
+        limit = int(args[0])
     
     scraper = FinalFounderScraper()
-    scraper.scrape_all_companies(limit=limit, delay=2)
+    with ScrapeProfiler.from_argv('scrape_founders_final'):
+        scraper.scrape_all_companies(limit=limit, delay=2)
+    reload_server()
 
@@ -3,7 +3,6 @@
 Fixed Founder Scraper - More reliable extraction
 """
 
-import time
 import sqlite3
 import re
 from selenium import webdriver
@@ -11,9 +10,15 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 import json
 
+from db_writer import DBWriter
+from scrape_profile import ScrapeProfiler
+from scrape_telemetry import ScrapeRun, extraction_step, record_error, timed, wait
+from server_control import reload_server
+
 class FixedFounderScraper:
     def __init__(self, db_path='yc_companies.db'):
         self.db_path = db_path
+        self.writer = DBWriter(db_path)
         self.setup_database()
         
     def setup_database(self):
@@ -63,14 +68,14 @@ class FixedFounderScraper:
         founders = []
         
         try:
-            driver.get(company_url)
-            time.sleep(6)  # Wait for page to fully load
+            timed('fetch', driver.get, company_url)
+            wait(6)  # Wait for page to fully load
             
             # Scroll to ensure all content is loaded
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            wait(2)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
+            wait(1)
             
             page_text = driver.find_element(By.TAG_NAME, "body").text.lower()
             
@@ -79,6 +84,7 @@ class FixedFounderScraper:
                           'harj taggar', 'aaron epstein', 'david lieb', 'paul graham',
                           'jessica livingston', 'trevor blackwell', 'robert morris'}
             
+            extraction_step('people_links', len(founders))
             # METHOD 1: Find ALL /people/ links and check context
             try:
                 all_people_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/people/']")
@@ -167,6 +173,7 @@ class FixedFounderScraper:
             except Exception as e:
                 print(f"  Note: People links method error: {e}")
             
+            extraction_step('next_data_json', len(founders))
             # METHOD 2: Extract from JSON data
             try:
                 json_data = driver.execute_script("""
@@ -186,6 +193,7 @@ class FixedFounderScraper:
             except Exception as e:
                 pass
             
+            extraction_step('text_patterns', len(founders))
             # METHOD 3: Text pattern matching
             try:
                 patterns = [
@@ -232,6 +240,7 @@ class FixedFounderScraper:
             
         except Exception as e:
             print(f"Error extracting founders: {e}")
+            record_error(e)
             return []
     
     def _parse_founders_from_json(self, data, company_name):
@@ -316,66 +325,51 @@ class FixedFounderScraper:
         total_founders = 0
         
         try:
-            for i, (company_id, company_name, yc_url) in enumerate(companies, 1):
-                clean_company_name = company_name.split('\n')[0] if company_name else 'Unknown'
-                
-                print(f"[{i}/{len(companies)}] Scraping {clean_company_name}...")
-                
-                founders = self.extract_founders_from_page(driver, yc_url, clean_company_name)
-                
-                if founders:
-                    self.save_founders(company_id, clean_company_name, founders)
-                    total_founders += len(founders)
-                    founder_names = ', '.join([f['name'] for f in founders])
-                    print(f"  ✓ Found {len(founders)} founder(s): {founder_names}")
-                else:
-                    print(f"  - No founders found")
-                
-                if i < len(companies):
-                    time.sleep(delay)
+            with ScrapeRun('scrape_founders_fixed', total=len(companies), db_path=self.db_path, writer=self.writer) as run:
+                for i, (company_id, company_name, yc_url) in enumerate(companies, 1):
+                    clean_company_name = company_name.split('\n')[0] if company_name else 'Unknown'
                     
+                    print(f"[{i}/{len(companies)}] Scraping {clean_company_name}...")
+                    
+                    with run.company(company_id, clean_company_name) as event:
+                        founders = self.extract_founders_from_page(driver, yc_url, clean_company_name)
+                        
+                        event.found(len(founders))
+                        
+                        if founders:
+                            with event.stage('db'):
+                                self.save_founders(company_id, clean_company_name, founders)
+                            total_founders += len(founders)
+                            founder_names = ', '.join([f['name'] for f in founders])
+                            print(f"  ✓ Found {len(founders)} founder(s): {founder_names}")
+                        else:
+                            print(f"  - No founders found")
+                        
+                        if i < len(companies):
+                            wait(delay)
+
         finally:
             driver.quit()
+            self.writer.close()
         
         print(f"\n{'='*80}")
         print(f"Scraping complete! Found {total_founders} total founders")
         print(f"{'='*80}")
     
     def save_founders(self, company_id, company_name, founders):
-        """Save founders to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        for founder in founders:
-            try:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO founders 
-                    (company_id, company_name, name, role, previous_company, linkedin_url, twitter_url, yc_profile_url, bio)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    company_id,
-                    company_name,
-                    founder.get('name'),
-                    founder.get('role'),
-                    founder.get('previous_company'),
-                    founder.get('linkedin_url'),
-                    founder.get('twitter_url'),
-                    founder.get('yc_profile_url'),
-                    founder.get('bio')
-                ))
-            except Exception as e:
-                print(f"  Error saving founder {founder.get('name')}: {e}")
-        
-        conn.commit()
-        conn.close()
+        """Queue founders for the background DB writer"""
+        self.writer.write_founders(company_id, company_name, founders)
 
 if __name__ == "__main__":
     import sys
     
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
     limit = None
-    if len(sys.argv) > 1:
-        limit = int(sys.argv[1])
+    if args:
+        limit = int(args[0])
     
     scraper = FixedFounderScraper()
-    scraper.scrape_all_companies(limit=limit, delay=2)
+    with ScrapeProfiler.from_argv('scrape_founders_fixed'):
+        scraper.scrape_all_companies(limit=limit, delay=2)
+    reload_server()
 
@@ -12,6 +12,11 @@ import re
 import json
 import os
 
+from db_writer import DBWriter
+from scrape_profile import ScrapeProfiler
+from scrape_telemetry import ScrapeRun, timed, wait
+from server_control import reload_server
+
 # Debug logging setup
 DEBUG_LOG_PATH = '/Users/vc/yc scraper/.cursor/debug.log'
 
@@ -35,6 +40,7 @@ def debug_log(session_id, run_id, hypothesis_id, location, message, data):
 class SimpleFounderScraper:
     def __init__(self, db_path='yc_companies.db'):
         self.db_path = db_path
+        self.writer = DBWriter(db_path)
         self.setup_database()
         
     def setup_database(self):
@@ -78,8 +84,8 @@ class SimpleFounderScraper:
         # #endregion
         
         try:
-            driver.get(company_url)
-            time.sleep(5)
+            timed('fetch', driver.get, company_url)
+            wait(5)
             
             # #region agent log
             debug_log(session_id, run_id, 'A', 'extract_founders_simple:after_load', 'Page loaded', {'url': company_url})
@@ -381,64 +387,52 @@ class SimpleFounderScraper:
         total = 0
         
         try:
-            for i, (company_id, company_name, yc_url) in enumerate(companies, 1):
-                clean_name = company_name.split('\n')[0]
-                print(f"[{i}/{len(companies)}] {clean_name}")
-                
-                founders = self.extract_founders_simple(driver, yc_url, clean_name)
-                
-                # #region agent log
-                debug_log('debug-session', 'run1', 'G', f'scrape_all:company_{i}', 'Processing company', {'company_id': company_id, 'company_name': clean_name, 'founder_count': len(founders), 'founder_names': [f['name'] for f in founders]})
-                # #endregion
-                
-                if founders:
-                    self.save_founders(company_id, clean_name, founders)
-                    # #region agent log
-                    debug_log('debug-session', 'run1', 'G', f'scrape_all:saved_{i}', 'Saved founders', {'company_id': company_id, 'saved_count': len(founders)})
-                    # #endregion
-                    total += len(founders)
-                    names = ', '.join([f['name'] for f in founders])
-                    print(f"  ✅ Found {len(founders)}: {names}", flush=True)
-                else:
-                    print(f"  ⚠️  No founders", flush=True)
-                
-                time.sleep(2)
+            with ScrapeRun('scrape_founders_simple', total=len(companies), db_path=self.db_path, writer=self.writer) as run:
+                for i, (company_id, company_name, yc_url) in enumerate(companies, 1):
+                    clean_name = company_name.split('\n')[0]
+                    print(f"[{i}/{len(companies)}] {clean_name}")
+                    
+                    with run.company(company_id, clean_name) as event:
+                        founders = self.extract_founders_simple(driver, yc_url, clean_name)
+                        
+                        # #region agent log
+                        debug_log('debug-session', 'run1', 'G', f'scrape_all:company_{i}', 'Processing company', {'company_id': company_id, 'company_name': clean_name, 'founder_count': len(founders), 'founder_names': [f['name'] for f in founders]})
+                        # #endregion
+                        
+                        event.found(len(founders), method='active_founders')
+                        
+                        if founders:
+                            with event.stage('db'):
+                                self.save_founders(company_id, clean_name, founders)
+                            # #region agent log
+                            debug_log('debug-session', 'run1', 'G', f'scrape_all:saved_{i}', 'Saved founders', {'company_id': company_id, 'saved_count': len(founders)})
+                            # #endregion
+                            total += len(founders)
+                            names = ', '.join([f['name'] for f in founders])
+                            print(f"  ✅ Found {len(founders)}: {names}", flush=True)
+                        else:
+                            print(f"  ⚠️  No founders", flush=True)
+                        
+                        wait(2)
         finally:
             driver.quit()
+            self.writer.close()
         
         print(f"\n✅ Done! Found {total} founders total", flush=True)
     
     def save_founders(self, company_id, company_name, founders):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        saved_count = 0
-        for f in founders:
-            try:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO founders 
-                    (company_id, company_name, name, role, linkedin_url, twitter_url, yc_profile_url, bio)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (company_id, company_name, f['name'], f['role'], 
-                      f.get('linkedin_url'), f.get('twitter_url'), f.get('yc_profile_url'), None))
-                saved_count += 1
-                # #region agent log
-                debug_log('debug-session', 'run1', 'H', 'save_founders:inserted', 'Inserted founder', {'company_id': company_id, 'name': f['name'], 'has_linkedin': f.get('linkedin_url') is not None, 'has_twitter': f.get('twitter_url') is not None})
-                # #endregion
-            except Exception as e:
-                # #region agent log
-                debug_log('debug-session', 'run1', 'H', 'save_founders:error', 'Error saving founder', {'company_id': company_id, 'name': f['name'], 'error': str(e)})
-                # #endregion
-                pass
-        conn.commit()
-        conn.close()
+        queued_count = self.writer.write_founders(company_id, company_name, founders)
         
         # #region agent log
-        debug_log('debug-session', 'run1', 'H', 'save_founders:complete', 'Save complete', {'company_id': company_id, 'attempted': len(founders), 'saved': saved_count})
+        debug_log('debug-session', 'run1', 'H', 'save_founders:complete', 'Queued for writer', {'company_id': company_id, 'attempted': len(founders), 'queued': queued_count})
         # #endregion
 
 if __name__ == "__main__":
     import sys
-    limit = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    limit = int(args[0]) if args else None
     scraper = SimpleFounderScraper()
-    scraper.scrape_all(limit=limit)
+    with ScrapeProfiler.from_argv('scrape_founders_simple'):
+        scraper.scrape_all(limit=limit)
+    reload_server()
 
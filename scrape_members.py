@@ -3,7 +3,6 @@
 Scrape team members/founders from YC company pages
 """
 
-import time
 import sqlite3
 import re
 from selenium import webdriver
@@ -14,9 +13,15 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import json
 
+from db_writer import DBWriter
+from scrape_profile import ScrapeProfiler
+from scrape_telemetry import ScrapeRun, extraction_step, record_error, timed, wait
+from server_control import reload_server
+
 class MemberScraper:
     def __init__(self, db_path='yc_companies.db'):
         self.db_path = db_path
+        self.writer = DBWriter(db_path)
         self.setup_database()
         
     def setup_database(self):
@@ -68,9 +73,10 @@ class MemberScraper:
         members = []
         
         try:
-            driver.get(company_url)
-            time.sleep(3)  # Wait for page to load
+            timed('fetch', driver.get, company_url)
+            wait(3)  # Wait for page to load
             
+            extraction_step('people_links', len(members))
             # Method 1: Look for founder/team member links
             founder_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/people/'], a[href*='/founders/']")
             
@@ -101,6 +107,7 @@ class MemberScraper:
                 except:
                     continue
             
+            extraction_step('next_data_json', len(members))
             # Method 2: Extract from JSON data
             try:
                 json_data = driver.execute_script("""
@@ -121,6 +128,7 @@ class MemberScraper:
             except Exception as e:
                 pass
             
+            extraction_step('text_patterns', len(members))
             # Method 3: Look for founder mentions in text (e.g., "We're John, Jane, and Bob, co-founders")
             try:
                 page_text = driver.find_element(By.TAG_NAME, "body").text
@@ -162,6 +170,7 @@ class MemberScraper:
             except:
                 pass
             
+            extraction_step('founder_sections', len(members))
             # Method 4: Look for structured founder sections
             try:
                 # Look for elements with "founder" in class or text
@@ -199,6 +208,7 @@ class MemberScraper:
             
         except Exception as e:
             print(f"Error extracting members from {company_url}: {e}")
+            record_error(e)
             return []
     
     def _parse_members_from_json(self, data, company_name):
@@ -275,67 +285,67 @@ class MemberScraper:
         total_members = 0
         
         try:
-            for i, (company_id, company_name, yc_url) in enumerate(companies, 1):
-                # Clean company name
-                clean_company_name = company_name.split('\n')[0] if company_name else 'Unknown'
-                
-                print(f"[{i}/{len(companies)}] Scraping {clean_company_name}...")
-                
-                members = self.extract_members_from_page(driver, yc_url, clean_company_name)
-                
-                if members:
-                    self.save_members(company_id, clean_company_name, members)
-                    total_members += len(members)
-                    print(f"  ✓ Found {len(members)} member(s): {', '.join([m['name'] for m in members])}")
-                else:
-                    print(f"  - No members found")
-                
-                # Delay between requests to avoid rate limiting
-                if i < len(companies):
-                    time.sleep(delay)
+            with ScrapeRun('scrape_members', total=len(companies), db_path=self.db_path, writer=self.writer) as run:
+                for i, (company_id, company_name, yc_url) in enumerate(companies, 1):
+                    # Clean company name
+                    clean_company_name = company_name.split('\n')[0] if company_name else 'Unknown'
+                    
+                    print(f"[{i}/{len(companies)}] Scraping {clean_company_name}...")
                     
+                    with run.company(company_id, clean_company_name) as event:
+                        members = self.extract_members_from_page(driver, yc_url, clean_company_name)
+                        
+                        event.found(len(members))
+                        
+                        if members:
+                            with event.stage('db'):
+                                self.save_members(company_id, clean_company_name, members)
+                            total_members += len(members)
+                            print(f"  ✓ Found {len(members)} member(s): {', '.join([m['name'] for m in members])}")
+                        else:
+                            print(f"  - No members found")
+                        
+                        # Delay between requests to avoid rate limiting
+                        if i < len(companies):
+                            wait(delay)
+
         finally:
             driver.quit()
+            self.writer.close()
         
         print(f"\n{'='*80}")
         print(f"Scraping complete! Found {total_members} total team members")
         print(f"{'='*80}")
     
     def save_members(self, company_id, company_name, members):
-        """Save members to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        """Queue members for the background DB writer"""
         for member in members:
-            try:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO team_members 
-                    (company_id, company_name, name, role, email, linkedin_url, twitter_url, bio, yc_profile_url)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    company_id,
-                    company_name,
-                    member.get('name'),
-                    member.get('role'),
-                    member.get('email'),
-                    member.get('linkedin_url'),
-                    member.get('twitter_url'),
-                    member.get('bio'),
-                    member.get('yc_profile_url')
-                ))
-            except Exception as e:
-                print(f"  Error saving member {member.get('name')}: {e}")
-        
-        conn.commit()
-        conn.close()
+            self.writer.write('''
+                INSERT OR REPLACE INTO team_members 
+                (company_id, company_name, name, role, email, linkedin_url, twitter_url, bio, yc_profile_url)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                company_id,
+                company_name,
+                member.get('name'),
+                member.get('role'),
+                member.get('email'),
+                member.get('linkedin_url'),
+                member.get('twitter_url'),
+                member.get('bio'),
+                member.get('yc_profile_url')
+            ), label=f"member {member.get('name')}")
 
 if __name__ == "__main__":
     import sys
     
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
     limit = None
-    if len(sys.argv) > 1:
-        limit = int(sys.argv[1])
+    if args:
+        limit = int(args[0])
     
     scraper = MemberScraper()
-    scraper.scrape_all_companies(limit=limit, delay=2)
+    with ScrapeProfiler.from_argv('scrape_members'):
+        scraper.scrape_all_companies(limit=limit, delay=2)
+    reload_server()
 
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Opt-in profiling for the scrapers
+`--profile` runs cProfile over each company's work, split by the telemetry
+stages (fetch, wait, parse = extraction, db = queueing the save; see
+scrape_telemetry.py). It writes one pstats file per stage plus a combined
+one under profiles/<scraper>-<time>/ and prints the top functions of each
+stage when the run ends. `--tracemalloc=N` takes a memory snapshot every N
+companies and reports what grew since the previous one.
+
+    python3 scrape_founders_simple.py 50 --profile --profile-top=20 --tracemalloc=10
+    python3 -m pstats profiles/scrape_founders_simple-20250101-120000/parse.pstats
+
+Only code inside company events is profiled (driver start-up and the initial
+queries are not). On Python 3.12+ only one profiler can be active at a time,
+so with several fetch workers some events go unprofiled; the report says how
+many.
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+
+import scrape_telemetry
+from scrape_telemetry import STAGES
+
+PROFILE_DIR = 'profiles'
+DEFAULT_TOP = 15
+
+# Memory report: lines with the largest growth between snapshots
+MEMORY_TOP = 10
+
+
+class ScrapeProfiler:
+    """Context manager around a scraper run; does nothing unless profiling or tracemalloc is on"""
+
+    def __init__(self, scraper, profile=False, top=DEFAULT_TOP, tracemalloc_every=0, directory=PROFILE_DIR):
+        self.scraper = scraper
+        self.profile = profile
+        self.top = top
+        self.tracemalloc_every = tracemalloc_every
+        self.enabled = profile or tracemalloc_every > 0
+        self.output_dir = os.path.join(directory, f"{scraper}-{time.strftime('%Y%m%d-%H%M%S')}")
+        self.companies = 0
+        self.unprofiled = 0
+        self._profiles = {name: [] for name in STAGES}  # stage -> one Profile per thread
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._snapshot = None
+
+    @classmethod
+    def from_argv(cls, scraper, argv=None):
+        """Options from the command line: --profile, --profile-top=N, --tracemalloc=N"""
+        argv = sys.argv[1:] if argv is None else argv
+        top, every = DEFAULT_TOP, 0
+        for arg in argv:
+            if arg.startswith('--profile-top='):
+                top = int(arg.split('=', 1)[1])
+            elif arg.startswith('--tracemalloc='):
+                every = int(arg.split('=', 1)[1])
+        return cls(scraper, profile='--profile' in argv, top=top, tracemalloc_every=every)
+
+    def __enter__(self):
+        if not self.enabled:
+            return self
+        os.makedirs(self.output_dir, exist_ok=True)
+        if self.tracemalloc_every:
+            tracemalloc.start()
+            self._snapshot = self._take_snapshot()
+        scrape_telemetry.set_observer(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.enabled:
+            return False
+        scrape_telemetry.set_observer(None)
+        self._switch(None)
+        if self.tracemalloc_every:
+            if self.companies % self.tracemalloc_every:
+                self.memory_report()
+            tracemalloc.stop()
+        if self.profile:
+            self.report()
+        print(f"🔬 Profile data in {self.output_dir}/")
+        return False
+
+    # scrape_telemetry observer hooks (called from the scraping threads)
+
+    def event_started(self, event):
+        depth = getattr(self._local, 'depth', 0) + 1
+        self._local.depth = depth
+        if depth == 1:
+            self._switch('parse')  # anything not fetching, waiting or saving is extraction
+
+    def event_finished(self, event):
+        self._local.depth -= 1
+        if self._local.depth:
+            return
+        self._switch(None)
+        with self._lock:
+            self.companies += 1
+            snapshot_due = self.tracemalloc_every and self.companies % self.tracemalloc_every == 0
+        if snapshot_due:
+            self.memory_report()
+
+    def stage_started(self, name):
+        if getattr(self._local, 'depth', 0):
+            self._switch(name)
+
+    def stage_finished(self, name):
+        if getattr(self._local, 'depth', 0):
+            self._switch('parse')
+
+    def _switch(self, stage):
+        """Stop this thread's active stage profiler and start the one for `stage`"""
+        if not self.profile:
+            return
+        active = getattr(self._local, 'active', None)
+        if active is not None:
+            active.disable()
+            self._local.active = None
+        if stage is None:
+            return
+
+        profilers = getattr(self._local, 'profilers', None)
+        if profilers is None:
+            profilers = self._local.profilers = {}
+        profiler = profilers.get(stage)
+        if profiler is None:
+            profiler = profilers[stage] = cProfile.Profile()
+            with self._lock:
+                self._profiles[stage].append(profiler)
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python 3.12+: another thread's profiler is running
+            with self._lock:
+                self.unprofiled += 1
+            return
+        self._local.active = profiler
+
+    # Reports
+
+    def stage_stats(self):
+        """pstats.Stats per stage, merged across threads (stages never entered are left out)"""
+        stats = {}
+        with self._lock:
+            profiles = {name: list(profilers) for name, profilers in self._profiles.items()}
+        for name, profilers in profiles.items():
+            merged = None
+            for profiler in profilers:
+                profiler.create_stats()
+                if not profiler.stats:
+                    continue
+                if merged is None:
+                    merged = pstats.Stats(profiler)
+                else:
+                    merged.add(profiler)
+            if merged is not None:
+                stats[name] = merged
+        return stats
+
+    def report(self):
+        """Write the pstats files and print the top functions per stage"""
+        stats = self.stage_stats()
+        if not stats:
+            print("🔬 Nothing was profiled (no company events ran)")
+            return
+
+        for name, stage in stats.items():
+            stage.dump_stats(os.path.join(self.output_dir, f'{name}.pstats'))
+        combined = pstats.Stats()
+        combined.add(*stats.values())
+        combined.dump_stats(os.path.join(self.output_dir, 'all.pstats'))
+
+        total = sum(stage.total_tt for stage in stats.values())
+        lines = [f"Profile of {self.scraper}: {self.companies} companies, {total:.2f}s profiled"]
+        for name in STAGES:
+            if name not in stats:
+                continue
+            stage = stats[name]
+            share = stage.total_tt / total * 100 if total else 0
+            lines.append('')
+            lines.append(f"{name}: {stage.total_tt:.2f}s ({share:.1f}%)")
+            lines.append(f"    {'self':>8} {'cumul':>8} {'calls':>8}  function")
+            rows = sorted(stage.stats.items(), key=lambda item: item[1][2], reverse=True)
+            for (filename, line, function), (_, calls, self_time, cumulative, _) in rows[:self.top]:
+                location = f"{os.path.basename(filename)}:{line}" if line else filename
+                lines.append(f"    {self_time:>7.3f}s {cumulative:>7.3f}s {calls:>8}  {location}({function})")
+        if self.unprofiled:
+            lines.append('')
+            lines.append(f"{self.unprofiled} stage(s) ran while another thread was being profiled and are not included")
+
+        report = '\n'.join(lines)
+        with open(os.path.join(self.output_dir, 'report.txt'), 'w') as f:
+            f.write(report + '\n')
+        print(f"\n🔬 {report}\n")
+
+    def _take_snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        ))
+
+    def memory_report(self):
+        """Snapshot memory, save it and print what grew since the previous snapshot"""
+        snapshot = self._take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        with self._lock:
+            previous, self._snapshot = self._snapshot, snapshot
+            companies = self.companies
+        snapshot.dump(os.path.join(self.output_dir, f'memory-{companies}.snapshot'))
+
+        growth = snapshot.compare_to(previous, 'lineno')[:MEMORY_TOP]
+        lines = [f"Memory after {companies} companies: {current / 1e6:.1f} MB traced (peak {peak / 1e6:.1f} MB)"]
+        lines += [f"    {stat}" for stat in growth if stat.size_diff > 0]
+        with open(os.path.join(self.output_dir, 'memory.txt'), 'a') as f:
+            f.write('\n'.join(lines) + '\n\n')
+        print(f"🧠 {lines[0]}")
+        for line in lines[1:4]:
+            print(line)
@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+Per-run scrape telemetry
+Every scraper run gets a scrape_runs row and every company (or listing page)
+it works on a scrape_events row: how long went into fetching, waiting
+(politeness delays and page-load sleeps), parsing and queueing the DB
+writes, the outcome and the extraction method that found the data.
+monitor_progress.py turns these into throughput, ETA, a per-stage
+breakdown and error rates. scrape_progress keeps one small row per run
+(counters and current rate, rewritten about once a second) for watchers such
+as the web app's /api/progress/stream, so following a run never touches the
+main tables.
+
+    run = ScrapeRun('scrape_founders_simple', total=len(companies), writer=self.writer)
+    with run:
+        for company_id, name, url in companies:
+            with run.company(company_id, name) as event:
+                founders = self.extract(url)      # calls timed('fetch', ...) / wait(...)
+                with event.stage('db'):
+                    self.save_founders(company_id, name, founders)
+                event.found(len(founders))
+
+Code deeper down doesn't need the event passed in: timed(), wait(),
+set_method(), extraction_step() and record_error() apply to the event open
+in the current thread (and do nothing outside one). Parse time is whatever
+the event took beyond the other stages unless it was timed explicitly.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from db_writer import DBWriter
+
+STAGES = ('fetch', 'wait', 'parse', 'db')
+
+# scrape_events.outcome
+OK = 'ok'          # data found
+EMPTY = 'empty'    # page loaded, nothing found
+ERROR = 'error'    # fetch or extraction failed
+
+EVENT_INSERT_SQL = '''
+    INSERT INTO scrape_events
+    (run_id, company_id, target, started_at, finished_at,
+     fetch_ms, wait_ms, parse_ms, db_ms, outcome, method, items, error)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+PROGRESS_UPSERT_SQL = '''
+    INSERT OR REPLACE INTO scrape_progress
+    (run_id, scraper, pid, status, total, done, items, errors, rate, started_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# scrape_progress is rewritten at most this often (seconds) while a run is going
+PROGRESS_INTERVAL = 1.0
+
+# The progress rate counts companies finished in the last N seconds
+PROGRESS_WINDOW = 300
+
+_current = threading.local()
+
+# Gets event_started/event_finished(event) and stage_started/stage_finished(name)
+# calls from every thread while set, see scrape_profile.py
+_observer = None
+
+
+def setup_scrape_telemetry(conn):
+    """Create the telemetry tables (times are unix seconds, durations milliseconds)"""
+    conn.executescript('''
+        CREATE TABLE IF NOT EXISTS scrape_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            scraper TEXT NOT NULL,
+            pid INTEGER,
+            started_at REAL NOT NULL,
+            finished_at REAL,
+            status TEXT NOT NULL DEFAULT 'running',
+            total INTEGER
+        );
+
+        CREATE TABLE IF NOT EXISTS scrape_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id INTEGER NOT NULL REFERENCES scrape_runs(id),
+            company_id INTEGER,
+            target TEXT,
+            started_at REAL NOT NULL,
+            finished_at REAL NOT NULL,
+            fetch_ms REAL NOT NULL DEFAULT 0,
+            wait_ms REAL NOT NULL DEFAULT 0,
+            parse_ms REAL NOT NULL DEFAULT 0,
+            db_ms REAL NOT NULL DEFAULT 0,
+            outcome TEXT NOT NULL,
+            method TEXT,
+            items INTEGER NOT NULL DEFAULT 0,
+            error TEXT
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_scrape_events_run ON scrape_events(run_id, finished_at);
+        CREATE INDEX IF NOT EXISTS idx_scrape_events_finished ON scrape_events(finished_at);
+
+        -- One row per run, rate in companies per minute
+        CREATE TABLE IF NOT EXISTS scrape_progress (
+            run_id INTEGER PRIMARY KEY,
+            scraper TEXT NOT NULL,
+            pid INTEGER,
+            status TEXT NOT NULL,
+            total INTEGER,
+            done INTEGER NOT NULL DEFAULT 0,
+            items INTEGER NOT NULL DEFAULT 0,
+            errors INTEGER NOT NULL DEFAULT 0,
+            rate REAL NOT NULL DEFAULT 0,
+            started_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_scrape_progress_updated ON scrape_progress(updated_at);
+    ''')
+    conn.commit()
+
+
+def pid_alive(pid):
+    """Check whether a process id is still running (on this machine)"""
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def read_progress(conn, since=None):
+    """Progress rows updated after `since` (unix seconds), oldest update first
+
+    Without `since`: every run still marked running plus the latest one.
+    A running row whose process is gone is reported as 'stopped'.
+    """
+    table = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'scrape_progress'"
+    ).fetchone()
+    if table is None:
+        return []
+
+    columns = 'run_id, scraper, pid, status, total, done, items, errors, rate, started_at, updated_at'
+    if since is None:
+        rows = conn.execute(f'''
+            SELECT {columns} FROM scrape_progress
+            WHERE status = 'running' OR run_id = (SELECT MAX(run_id) FROM scrape_progress)
+            ORDER BY updated_at
+        ''').fetchall()
+    else:
+        rows = conn.execute(f'''
+            SELECT {columns} FROM scrape_progress
+            WHERE updated_at > ?
+            ORDER BY updated_at
+        ''', (since,)).fetchall()
+    return [progress_event(row) for row in rows]
+
+
+def progress_event(row):
+    """A scrape_progress row as a dict, with ETA and a liveness check"""
+    (run_id, scraper, pid, status, total, done, items, errors, rate, started_at, updated_at) = row
+    if status == 'running' and not pid_alive(pid):
+        status = 'stopped'  # killed without finishing the run
+    remaining = max(total - done, 0) if total is not None else None
+    return {
+        'run_id': run_id,
+        'scraper': scraper,
+        'pid': pid,
+        'status': status,
+        'total': total,
+        'done': done,
+        'items': items,
+        'errors': errors,
+        'error_rate': round(errors / done, 4) if done else 0.0,
+        'rate_per_min': round(rate, 2),
+        'eta_seconds': round(remaining * 60 / rate) if status == 'running' and remaining is not None and rate > 0 else None,
+        'started_at': started_at,
+        'updated_at': updated_at,
+    }
+
+
+class CompanyEvent:
+    """Timings and outcome for one company; recorded when the `with` block ends"""
+
+    def __init__(self, run, company_id, target):
+        self.run = run
+        self.company_id = company_id
+        self.target = target
+        self.durations = dict.fromkeys(STAGES, 0.0)
+        self.timed_parse = False
+        self.outcome = None
+        self.method = None
+        self.items = 0
+        self.error = None
+        self.steps = []  # (method, items found before it) from extraction_step()
+        self._depth = 0
+
+    def __enter__(self):
+        self._outer = getattr(_current, 'event', None)
+        _current.event = self
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        if _observer is not None:
+            _observer.event_started(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self._start
+        # After the clock stops: the observer's work (e.g. a memory snapshot) isn't the company's
+        if _observer is not None:
+            _observer.event_finished(self)
+        _current.event = self._outer
+        if exc_type is not None and self.outcome != ERROR:
+            self.fail(exc if exc is not None else exc_type.__name__)
+        if not self.timed_parse:
+            # Whatever wasn't fetching, waiting or writing went into parsing
+            self.durations['parse'] = max(0.0, elapsed - sum(self.durations.values()))
+        if self.outcome is None:
+            self.outcome = OK if self.items else EMPTY
+        if self.method is None and self.steps:
+            # The methods that added something: each step's count vs the next one's
+            after = [before for _, before in self.steps[1:]] + [self.items]
+            added = [method for (method, before), count in zip(self.steps, after) if count > before]
+            self.method = '+'.join(added) or None
+        if self.run is not None:
+            self.run.record(self, self.started_at + elapsed)
+        return False
+
+    @contextmanager
+    def stage(self, name):
+        """Time a block as one of STAGES (nested stages count only once, as the outer one)"""
+        if name not in self.durations:
+            raise ValueError(f"unknown stage {name!r}, expected one of {STAGES}")
+        self._depth += 1
+        if self._depth == 1 and _observer is not None:
+            _observer.stage_started(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self.durations[name] += time.perf_counter() - start
+                if name == 'parse':
+                    self.timed_parse = True
+                if _observer is not None:
+                    _observer.stage_finished(name)
+
+    def found(self, count, method=None):
+        """Record how many items (founders, companies) were found, and how"""
+        self.items = count or 0
+        if method:
+            self.method = method
+
+    def fail(self, error):
+        """Mark the company as failed without raising"""
+        self.outcome = ERROR
+        self.error = str(error)[:500]
+
+
+class ScrapeRun:
+    """One scraper invocation: a scrape_runs row plus its events
+
+    Events are queued on `writer` (the scraper's own DBWriter if it has one)
+    so recording them never waits on the disk. Use as a context manager, or
+    call finish() yourself.
+    """
+
+    def __init__(self, scraper, total=None, db_path='yc_companies.db', writer=None):
+        self.scraper = scraper
+        self.db_path = db_path
+        self._own_writer = writer is None
+        self.writer = writer or DBWriter(db_path)
+        self.total = total
+        self.done = 0
+        self.items = 0
+        self.errors = 0
+        self.started_at = time.time()
+        self._finished = deque()  # finish times within PROGRESS_WINDOW, for the rate
+        self._progress_at = 0.0
+        self._lock = threading.Lock()
+
+        conn = sqlite3.connect(db_path, timeout=30)
+        try:
+            setup_scrape_telemetry(conn)
+            cursor = conn.execute(
+                'INSERT INTO scrape_runs (scraper, pid, started_at, total) VALUES (?, ?, ?, ?)',
+                (scraper, os.getpid(), self.started_at, total)
+            )
+            self.id = cursor.lastrowid
+            conn.execute(PROGRESS_UPSERT_SQL, self._progress_row('running', self.started_at))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.finish()
+        elif issubclass(exc_type, KeyboardInterrupt):
+            self.finish('interrupted')
+        else:
+            self.finish('failed')
+        return False
+
+    def company(self, company_id, target):
+        """Event for one company (or listing page); use as `with run.company(...) as event:`"""
+        return CompanyEvent(self, company_id, target)
+
+    def set_total(self, total):
+        """Set the planned number of companies once it is known"""
+        self.total = total
+        self._update('UPDATE scrape_runs SET total = ? WHERE id = ?', (total, self.id))
+        with self._lock:
+            self._write_progress(time.time())
+
+    def record(self, event, finished_at):
+        ms = {name: round(seconds * 1000, 1) for name, seconds in event.durations.items()}
+        self.writer.write(EVENT_INSERT_SQL, (
+            self.id, event.company_id, event.target, event.started_at, finished_at,
+            ms['fetch'], ms['wait'], ms['parse'], ms['db'],
+            event.outcome, event.method, event.items, event.error
+        ), label=f"telemetry for {event.target}")
+        with self._lock:
+            self.done += 1
+            self.items += event.items
+            self.errors += event.outcome == ERROR
+            self._finished.append(finished_at)
+            if finished_at - self._progress_at >= PROGRESS_INTERVAL:
+                self._write_progress(finished_at)
+
+    def rate(self, now=None):
+        """Companies per minute over the last PROGRESS_WINDOW seconds"""
+        now = now or time.time()
+        while self._finished and self._finished[0] <= now - PROGRESS_WINDOW:
+            self._finished.popleft()
+        span = min(PROGRESS_WINDOW, now - self.started_at)
+        return len(self._finished) * 60 / span if span > 0 else 0.0
+
+    def finish(self, status='finished'):
+        """Commit the queued events and close the run and progress rows"""
+        if self._own_writer:
+            self.writer.close()
+        else:
+            self.writer.flush()
+        now = time.time()
+        self._update('UPDATE scrape_runs SET status = ?, finished_at = ? WHERE id = ?',
+                     (status, now, self.id))
+        with self._lock:
+            self._update(PROGRESS_UPSERT_SQL, self._progress_row(status, now))
+
+    def _progress_row(self, status, now):
+        return (self.id, self.scraper, os.getpid(), status, self.total, self.done,
+                self.items, self.errors, self.rate(now), self.started_at, now)
+
+    def _write_progress(self, now):
+        # Called with self._lock held; queued like the events
+        self._progress_at = now
+        self.writer.write(PROGRESS_UPSERT_SQL, self._progress_row('running', now),
+                          label=f"progress for run {self.id}")
+
+    def _update(self, sql, params):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            conn.execute(sql, params)
+            conn.commit()
+        finally:
+            conn.close()
+
+
+def set_observer(observer):
+    """Install (or with None remove) the object notified of event and stage boundaries"""
+    global _observer
+    _observer = observer
+
+
+def company_event(run, company_id, target):
+    """run.company(...), or an event that records nothing when there is no run"""
+    return CompanyEvent(run, company_id, target)
+
+
+def current_event():
+    """The event open in this thread, or None"""
+    return getattr(_current, 'event', None)
+
+
+@contextmanager
+def stage(name):
+    """Time a block against the current thread's event (no-op outside one)"""
+    event = current_event()
+    if event is None:
+        yield
+    else:
+        with event.stage(name):
+            yield
+
+
+def timed(name, func, *args, **kwargs):
+    """Call func(*args, **kwargs) timed as stage `name`, e.g. timed('fetch', driver.get, url)"""
+    with stage(name):
+        return func(*args, **kwargs)
+
+
+def wait(seconds):
+    """time.sleep() counted as waiting"""
+    with stage('wait'):
+        time.sleep(seconds)
+
+
+def record_error(error):
+    """Mark the current thread's event as failed, for code that handles its own exceptions"""
+    event = current_event()
+    if event is not None:
+        event.fail(error)
+
+
+def extraction_step(method, found_so_far):
+    """Call before each of several extraction methods with the number of items found so far
+
+    The event's method becomes the ones that added items, e.g. 'next_data_json+people_links'.
+    """
+    event = current_event()
+    if event is not None:
+        event.steps.append((method, found_so_far))
+
+
+def set_method(method):
+    """Name the extraction method that produced the current event's data"""
+    event = current_event()
+    if event is not None:
+        event.method = method
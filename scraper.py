@@ -4,7 +4,6 @@ Y Combinator Companies Scraper
 Scrapes hiring companies from YC directory and stores in SQLite database
 """
 
-import time
 import sqlite3
 import re
 from selenium import webdriver
@@ -15,6 +14,13 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import json
 
+from company_changes import setup_company_changes
+from company_names import display_name_columns, setup_display_names
+from scrape_profile import ScrapeProfiler
+from scrape_telemetry import ScrapeRun, record_error, set_method, timed, wait
+from server_control import reload_server
+from text_storage import save_company_description, setup_text_storage
+
 class YCScraper:
     def __init__(self, db_path='yc_companies.db'):
         self.db_path = db_path
@@ -42,6 +48,10 @@ class YCScraper:
             )
         ''')
         
+        setup_display_names(conn)
+        setup_company_changes(conn)
+        setup_text_storage(conn)
+        
         conn.commit()
         conn.close()
         print(f"Database initialized at {self.db_path}")
@@ -69,10 +79,10 @@ class YCScraper:
         
         try:
             print(f"Navigating to {url}...")
-            driver.get(url)
+            timed('fetch', driver.get, url)
             
             # Wait for page to load
-            time.sleep(5)
+            wait(5)
             
             # Scroll to load more companies (infinite scroll)
             print("Scrolling to load companies...")
@@ -83,7 +93,7 @@ class YCScraper:
             while scroll_attempts < max_scrolls:
                 # Scroll down
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)  # Wait for content to load
+                wait(2)  # Wait for content to load
                 
                 # Check if new content loaded
                 new_height = driver.execute_script("return document.body.scrollHeight")
@@ -142,6 +152,7 @@ class YCScraper:
             
             # Try to extract JSON data from Next.js page
             print("Trying to extract JSON data from page...")
+            json_data = None
             try:
                 json_data = driver.execute_script("""
                     if (window.__NEXT_DATA__) {
@@ -214,11 +225,13 @@ class YCScraper:
             
             self.companies = companies_data
             print(f"Extracted {len(self.companies)} companies")
+            set_method('page_links+next_data' if json_data else 'page_links')
             
             return companies_data
             
         except Exception as e:
             print(f"Error during scraping: {e}")
+            record_error(e)
             import traceback
             traceback.print_exc()
             return []
@@ -281,20 +294,38 @@ class YCScraper:
         saved_count = 0
         for company in self.companies:
             try:
+                # An unchanged company keeps its row (and id) and logs no change
                 cursor.execute('''
-                    INSERT OR REPLACE INTO companies 
-                    (name, batch, description, website, location, industry, is_hiring, yc_url)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    INSERT INTO companies 
+                    (name, batch, website, location, industry, is_hiring, yc_url,
+                     display_name, sort_name)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(name, batch) DO UPDATE SET
+                        website = excluded.website, location = excluded.location,
+                        industry = excluded.industry, is_hiring = excluded.is_hiring,
+                        yc_url = excluded.yc_url
+                    WHERE (website, location, industry, is_hiring, yc_url)
+                        IS NOT (excluded.website, excluded.location, excluded.industry,
+                                excluded.is_hiring, excluded.yc_url)
+                    RETURNING id
                 ''', (
                     company.get('name'),
                     company.get('batch'),
-                    company.get('description'),
                     company.get('website'),
                     company.get('location'),
                     company.get('industry'),
                     company.get('is_hiring', True),
-                    company.get('yc_url')
+                    company.get('yc_url'),
+                    *display_name_columns(company.get('name'))
                 ))
+                row = cursor.fetchone()
+                if row is None:
+                    # Conflict with nothing to update
+                    row = cursor.execute(
+                        'SELECT id FROM companies WHERE name = ? AND batch = ?',
+                        (company.get('name'), company.get('batch'))
+                    ).fetchone()
+                save_company_description(cursor, row[0], company.get('description'))
                 saved_count += 1
             except Exception as e:
                 print(f"Error saving company {company.get('name')}: {e}")
@@ -307,8 +338,14 @@ if __name__ == "__main__":
     url = "https://www.ycombinator.com/companies/?batch=Fall%202025&batch=Summer%202025&batch=Spring%202025&batch=Winter%202025&batch=Fall%202024&batch=Winter%202026&batch=Spring%202026&isHiring=true"
     
     scraper = YCScraper()
-    scraper.scrape_companies(url)
-    scraper.save_to_database()
+    with ScrapeProfiler.from_argv('scraper'):
+        with ScrapeRun('scraper', total=1, db_path=scraper.db_path) as run:
+            with run.company(None, url) as event:
+                scraper.scrape_companies(url)
+                with event.stage('db'):
+                    scraper.save_to_database()
+                event.found(len(scraper.companies))
+    reload_server()
     
     print("\nScraping complete!")
 
@@ -11,6 +11,18 @@ import re
 import time
 from typing import List, Dict, Optional
 
+from company_changes import setup_company_changes
+from company_names import display_name_columns, setup_display_names
+from db_writer import FOUNDER_UPSERT_SQL
+from scrape_profile import ScrapeProfiler
+from scrape_telemetry import ScrapeRun, company_event, record_error, set_method, stage, timed, wait
+from server_control import reload_server
+from stats_rollup import setup_stats_rollup
+from text_storage import founder_bio_statement, load_company_description, save_company_description, setup_text_storage
+
+# Seconds between commits while saving companies
+COMMIT_INTERVAL = 1.0
+
 class YCApiScraper:
     def __init__(self, db_path='yc_companies.db'):
         self.db_path = db_path
@@ -58,6 +70,11 @@ class YCApiScraper:
             )
         ''')
         
+        setup_stats_rollup(conn)
+        setup_display_names(conn)
+        setup_company_changes(conn)
+        setup_text_storage(conn)
+        
         conn.commit()
         conn.close()
         print(f"Database initialized at {self.db_path}")
@@ -91,25 +108,30 @@ class YCApiScraper:
             params_str += f"&filters={filters}"
         
         try:
-            response = requests.post(url, headers=headers, json={"params": params_str})
+            response = timed('fetch', requests.post, url, headers=headers, json={"params": params_str})
             response.raise_for_status()
-            data = response.json()
+            with stage('parse'):
+                data = response.json()
+            set_method('algolia_api')
             return data.get("hits", [])
         except Exception as e:
             print(f"Error searching companies: {e}")
+            record_error(e)
             if hasattr(e, 'response') and e.response is not None:
                 print(f"Response: {e.response.text[:500]}")
             return []
     
-    def get_all_companies(self) -> List[Dict]:
-        """Get all YC companies using pagination"""
+    def get_all_companies(self, run: Optional[ScrapeRun] = None) -> List[Dict]:
+        """Get all YC companies using pagination (one telemetry event per page)"""
         print("Fetching all companies from YC API...")
         all_companies = []
         page = 0
         hits_per_page = 1000
         
         while True:
-            companies = self.search_companies(hits_per_page=hits_per_page, page=page)
+            with company_event(run, None, f"algolia page {page}") as event:
+                companies = self.search_companies(hits_per_page=hits_per_page, page=page)
+                event.found(len(companies))
             if not companies:
                 break
             
@@ -138,12 +160,13 @@ class YCApiScraper:
             'founders': company.get('founders', [])
         }
     
-    def save_companies(self, companies: List[Dict], fetch_founders: bool = True):
+    def save_companies(self, companies: List[Dict], fetch_founders: bool = True, run: Optional[ScrapeRun] = None):
         """Save companies to database
         
         Args:
             companies: List of company dictionaries from API
             fetch_founders: If True, fetch founders from company pages
+            run: ScrapeRun to record a telemetry event per company in
         """
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
@@ -153,61 +176,87 @@ class YCApiScraper:
         founders_count = 0
         
         total = len(companies)
+        last_commit = time.monotonic()
         for idx, company_data in enumerate(companies, 1):
             company = self.normalize_company_data(company_data)
             
             if not company['name']:
                 continue
             
-            try:
-                # Check if company exists
-                cursor.execute('SELECT id FROM companies WHERE name = ? AND (batch = ? OR (batch IS NULL AND ? IS NULL))', 
-                             (company['name'], company['batch'], company['batch']))
-                existing = cursor.fetchone()
-                
-                if existing:
-                    # Update existing
-                    cursor.execute('''
-                        UPDATE companies 
-                        SET batch = ?, description = ?, website = ?, location = ?, 
-                            industry = ?, is_hiring = ?, yc_url = ?
-                        WHERE id = ?
-                    ''', (
-                        company['batch'], company['description'], company['website'],
-                        company['location'], company['industry'], company['is_hiring'],
-                        company['yc_url'], existing[0]
-                    ))
-                    company_id = existing[0]
-                    updated_count += 1
-                else:
-                    # Insert new
-                    cursor.execute('''
-                        INSERT INTO companies 
-                        (name, batch, description, website, location, industry, is_hiring, yc_url)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        company['name'], company['batch'], company['description'],
-                        company['website'], company['location'], company['industry'],
-                        company['is_hiring'], company['yc_url']
-                    ))
-                    company_id = cursor.lastrowid
-                    saved_count += 1
-                
-                # Fetch and save founders from company page
-                if fetch_founders:
-                    slug = company_data.get('slug')
-                    if slug:
-                        if idx % 50 == 0:
-                            print(f"  Fetching founders... ({idx}/{total})")
-                        founders = self.fetch_founders_from_page(slug)
-                        if founders:
-                            self.save_founders(cursor, company_id, company['name'], founders)
-                            founders_count += len(founders)
-                        # Small delay to be respectful
-                        time.sleep(0.1)
-                
-            except Exception as e:
-                print(f"Error saving company {company['name']}: {e}")
+            with company_event(run, None, company['name']) as event:
+                try:
+                    with event.stage('db'):
+                        # Check if company exists
+                        cursor.execute('''
+                            SELECT id, batch, website, location, industry, is_hiring, yc_url
+                            FROM companies WHERE name = ? AND (batch = ? OR (batch IS NULL AND ? IS NULL))
+                        ''', (company['name'], company['batch'], company['batch']))
+                        existing = cursor.fetchone()
+                        
+                        if existing:
+                            company_id = existing[0]
+                            values = (
+                                company['batch'], company['website'],
+                                company['location'], company['industry'], int(bool(company['is_hiring'])),
+                                company['yc_url']
+                            )
+                            # Only rewrite the row (and log a change) when something differs
+                            changed = tuple(existing[1:]) != values
+                            if changed:
+                                cursor.execute('''
+                                    UPDATE companies 
+                                    SET batch = ?, website = ?, location = ?, 
+                                        industry = ?, is_hiring = ?, yc_url = ?
+                                    WHERE id = ?
+                                ''', (*values, company_id))
+                            if (load_company_description(conn, company_id) or '') != (company['description'] or ''):
+                                save_company_description(cursor, company_id, company['description'])
+                                changed = True
+                            if changed:
+                                updated_count += 1
+                        else:
+                            # Insert new
+                            cursor.execute('''
+                                INSERT INTO companies 
+                                (name, batch, website, location, industry, is_hiring, yc_url,
+                                 display_name, sort_name)
+                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                            ''', (
+                                company['name'], company['batch'],
+                                company['website'], company['location'], company['industry'],
+                                company['is_hiring'], company['yc_url'],
+                                *display_name_columns(company['name'])
+                            ))
+                            company_id = cursor.lastrowid
+                            save_company_description(cursor, company_id, company['description'])
+                            saved_count += 1
+                    event.company_id = company_id
+                    
+                    # Fetch and save founders from company page
+                    if fetch_founders:
+                        slug = company_data.get('slug')
+                        if slug:
+                            if idx % 50 == 0:
+                                print(f"  Fetching founders... ({idx}/{total})")
+                            founders = self.fetch_founders_from_page(slug)
+                            if founders:
+                                with event.stage('db'):
+                                    self.save_founders(cursor, company_id, company['name'], founders)
+                                founders_count += len(founders)
+                                event.found(len(founders), method='next_data_script')
+                            # Small delay to be respectful
+                            wait(0.1)
+                    else:
+                        event.found(1, method='algolia_api')
+                    
+                except Exception as e:
+                    print(f"Error saving company {company['name']}: {e}")
+                    event.fail(e)
+            
+            # Commit as we go so readers (and the telemetry writer) aren't locked out for the whole run
+            if time.monotonic() - last_commit > COMMIT_INTERVAL:
+                conn.commit()
+                last_commit = time.monotonic()
         
         conn.commit()
         conn.close()
@@ -219,7 +268,7 @@ class YCApiScraper:
         """Fetch founders data from a company page by parsing JSON data"""
         try:
             url = f"https://www.ycombinator.com/companies/{slug}"
-            response = requests.get(url, headers={
+            response = timed('fetch', requests.get, url, headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
             })
             response.raise_for_status()
@@ -284,6 +333,7 @@ class YCApiScraper:
             
         except Exception as e:
             print(f"    Error fetching founders for {slug}: {e}")
+            record_error(e)
             return []
     
     def save_founders(self, cursor, company_id: int, company_name: str, founders: List[Dict]):
@@ -293,12 +343,7 @@ class YCApiScraper:
                 continue
             
             try:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO founders 
-                    (company_id, company_name, name, role, previous_company, 
-                     linkedin_url, twitter_url, yc_profile_url, bio)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                cursor.execute(FOUNDER_UPSERT_SQL, (
                     company_id,
                     company_name,
                     founder.get('name', ''),
@@ -306,8 +351,10 @@ class YCApiScraper:
                     founder.get('previousCompany', '') or founder.get('previous_company', ''),
                     founder.get('linkedin', '') or founder.get('linkedinUrl', ''),
                     founder.get('twitter', '') or founder.get('twitterUrl', '') or founder.get('x', ''),
-                    founder.get('ycUrl', '') or founder.get('yc_url', '') or founder.get('profileUrl', ''),
-                    founder.get('bio', '') or founder.get('description', '')
+                    founder.get('ycUrl', '') or founder.get('yc_url', '') or founder.get('profileUrl', '')
+                ))
+                cursor.execute(*founder_bio_statement(
+                    company_name, founder.get('name', ''), founder.get('bio', '') or founder.get('description', '')
                 ))
             except Exception as e:
                 print(f"  Error saving founder {founder.get('name')}: {e}")
@@ -318,14 +365,18 @@ class YCApiScraper:
         Args:
             fetch_founders: If True, also fetch founders from individual company pages
         """
-        companies = self.get_all_companies()
-        if companies:
-            self.save_companies(companies, fetch_founders=fetch_founders)
-            print(f"\n✅ Successfully scraped {len(companies)} companies using YC API!")
-        else:
-            print("❌ No companies found")
+        with ScrapeRun('scraper_api', db_path=self.db_path) as run:
+            companies = self.get_all_companies(run)
+            if companies:
+                run.set_total(len(companies))
+                self.save_companies(companies, fetch_founders=fetch_founders, run=run)
+                print(f"\n✅ Successfully scraped {len(companies)} companies using YC API!")
+            else:
+                print("❌ No companies found")
 
 if __name__ == "__main__":
     scraper = YCApiScraper()
-    scraper.scrape_all()
+    with ScrapeProfiler.from_argv('scraper_api'):
+        scraper.scrape_all()
+    reload_server()
 
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Control a running production web server (gunicorn, see gunicorn.conf.py)
+Scrapers call reload_server() when they finish so the workers restart with
+fresh state; without a running server this is a no-op
+"""
+
+import os
+import signal
+import sys
+
+PIDFILE = os.environ.get('GUNICORN_PIDFILE', 'gunicorn.pid')
+
+
+def server_pid(pidfile=PIDFILE):
+    """PID of the running gunicorn master, or None"""
+    try:
+        with open(pidfile) as f:
+            pid = int(f.read().strip())
+        os.kill(pid, 0)
+    except (OSError, ValueError):
+        return None
+    return pid
+
+
+def reload_server(pidfile=PIDFILE):
+    """Gracefully reload the gunicorn workers (SIGHUP); returns True if a server was signalled"""
+    pid = server_pid(pidfile)
+    if pid is None:
+        return False
+    os.kill(pid, signal.SIGHUP)
+    print(f"🔄 Reloading web server workers (pid {pid})")
+    return True
+
+
+if __name__ == "__main__":
+    pidfile = sys.argv[1] if len(sys.argv) > 1 else PIDFILE
+    if not reload_server(pidfile):
+        print(f"No running web server found ({pidfile})")
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """
 Start the Flask web server
+Usage: python3 start_server.py [--production]
+  --production  serve with gunicorn (multiple workers, see gunicorn.conf.py)
 """
 
 import sys
@@ -9,13 +11,12 @@ import os
 # Make sure we're in the right directory
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
-from app import app
-
 if __name__ == '__main__':
     PORT = 5001  # Changed from 5000 because macOS AirPlay uses 5000
+    production = '--production' in sys.argv[1:]
     
     print("="*60)
-    print("🚀 Starting YC Companies Web Dashboard")
+    print("🚀 Starting YC Companies Web Dashboard" + (" (production)" if production else ""))
     print("="*60)
     print(f"\n📊 Dashboard: http://localhost:{PORT}")
     print(f"🏢 Companies: http://localhost:{PORT}/companies")
@@ -23,8 +24,15 @@ if __name__ == '__main__':
     print("\nPress Ctrl+C to stop the server\n")
     print("="*60 + "\n")
     
+    if production:
+        # Replace this process with the gunicorn master (config: gunicorn.conf.py)
+        os.execvp(sys.executable, [sys.executable, '-m', 'gunicorn', 'app:app'])
+    
+    from app import app
+    
     try:
-        app.run(debug=True, host='0.0.0.0', port=PORT, use_reloader=False)
+        # Debugger stays off unless explicitly requested (it allows code execution)
+        app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=PORT, use_reloader=False)
     except KeyboardInterrupt:
         print("\n\nServer stopped. Goodbye!")
         sys.exit(0)
@@ -0,0 +1,210 @@
+// Virtualized, cursor-paged card grid for the companies and members pages.
+// Pages come from a keyset-paginated list endpoint as the user scrolls;
+// only the cards in (or near) the viewport exist in the DOM. Cards are
+// absolutely positioned from their index, built into a DocumentFragment in
+// idle-time batches and recycled as they scroll out of view.
+
+const GRID_PAGE_SIZE = 60;
+const GRID_MAX_PAGE_SIZE = 1000;
+const GRID_OVERSCAN_ROWS = 2;
+const GRID_IDLE_BATCH = 24;
+
+const requestIdle = window.requestIdleCallback
+    ? (callback) => window.requestIdleCallback(callback, { timeout: 100 })
+    : (callback) => setTimeout(() => callback({ timeRemaining: () => 8 }), 1);
+
+// Fetch one page of a list endpoint: {items, total, nextCursor}
+async function fetchListPage(url, after, pageSize) {
+    const separator = url.includes('?') ? '&' : '?';
+    let pageUrl = `${url}${separator}page_size=${pageSize}`;
+    if (after) {
+        pageUrl += `&after=${encodeURIComponent(after)}`;
+    }
+    const response = await fetch(pageUrl);
+    if (!response.ok) {
+        throw new Error(`${pageUrl}: HTTP ${response.status}`);
+    }
+    return {
+        items: await response.json(),
+        total: Number(response.headers.get('X-Total-Count')) || 0,
+        nextCursor: response.headers.get('X-Next-Cursor'),
+    };
+}
+
+class CardGrid {
+    // options: cardClass, cardHeight, minCardWidth, gap, renderCard(item) -> HTML,
+    // fetchPage(after, pageSize) -> {items, total, nextCursor}
+    constructor(container, options) {
+        this.container = container;
+        this.cardClass = options.cardClass;
+        this.cardHeight = options.cardHeight;
+        this.minCardWidth = options.minCardWidth;
+        this.gap = options.gap ?? 16;
+        this.renderCard = options.renderCard;
+        this.fetchPage = options.fetchPage;
+
+        this.container.classList.add('card-grid');
+        this.cards = new Map();  // item index -> element
+        this.free = [];          // recycled elements
+        this.queue = [];         // indexes waiting to be built
+        this.idleHandle = null;
+        this.frame = null;
+        this.generation = 0;
+        this.clear();
+
+        window.addEventListener('scroll', () => this.schedule(), { passive: true });
+        window.addEventListener('resize', () => this.schedule());
+    }
+
+    clear() {
+        this.generation++;
+        this.items = [];
+        this.total = 0;
+        this.nextCursor = null;
+        this.loading = null;
+        this.queue = [];
+        this.cards.forEach(card => {
+            card.remove();
+            this.free.push(card);
+        });
+        this.cards.clear();
+        this.container.style.height = '0px';
+    }
+
+    // Start over (new search/filters); resolves with the total once the first page is shown
+    async reset() {
+        this.clear();
+        await this.fetchMore(GRID_PAGE_SIZE);
+        this.update();
+        return this.total;
+    }
+
+    fetchMore(count) {
+        if (this.loading) {
+            return this.loading;
+        }
+        const generation = this.generation;
+        const pageSize = Math.min(GRID_MAX_PAGE_SIZE, Math.max(GRID_PAGE_SIZE, count));
+        this.loading = this.fetchPage(this.nextCursor, pageSize).then(page => {
+            if (generation !== this.generation) {
+                return;  // superseded by a reset
+            }
+            this.items.push(...page.items);
+            this.total = page.total;
+            this.nextCursor = page.nextCursor;
+            this.loading = null;
+        }, error => {
+            if (generation === this.generation) {
+                this.loading = null;
+            }
+            throw error;
+        });
+        return this.loading;
+    }
+
+    layout() {
+        const width = this.container.clientWidth;
+        const columns = Math.max(1, Math.floor((width + this.gap) / (this.minCardWidth + this.gap)));
+        return {
+            columns,
+            cardWidth: (width - this.gap * (columns - 1)) / columns,
+            rowHeight: this.cardHeight + this.gap,
+        };
+    }
+
+    schedule() {
+        if (this.frame === null) {
+            this.frame = requestAnimationFrame(() => {
+                this.frame = null;
+                this.update();
+            });
+        }
+    }
+
+    // Size the grid for the whole list and sync the cards with the viewport
+    update() {
+        const layout = this.layout();
+        const rows = Math.ceil(this.total / layout.columns);
+        this.container.style.height = `${Math.max(0, rows * layout.rowHeight - this.gap)}px`;
+
+        const top = -this.container.getBoundingClientRect().top;
+        const firstRow = Math.min(rows, Math.max(0, Math.floor(top / layout.rowHeight) - GRID_OVERSCAN_ROWS));
+        const lastRow = Math.min(rows, Math.max(firstRow, Math.ceil((top + window.innerHeight) / layout.rowHeight) + GRID_OVERSCAN_ROWS));
+        const start = firstRow * layout.columns;
+        const end = Math.min(this.total, lastRow * layout.columns);
+
+        // Infinite scroll: fetch (enough) further pages when the window passes the loaded items
+        if (end > this.items.length && this.nextCursor && !this.loading) {
+            const generation = this.generation;
+            this.fetchMore(end - this.items.length + GRID_PAGE_SIZE).then(() => {
+                if (generation === this.generation) {
+                    this.schedule();
+                }
+            }, error => console.error('Error loading more cards:', error));
+        }
+
+        this.renderRange(start, Math.min(end, this.items.length), layout);
+    }
+
+    renderRange(start, end, layout) {
+        this.cards.forEach((card, index) => {
+            if (index < start || index >= end) {
+                card.remove();
+                this.cards.delete(index);
+                this.free.push(card);
+            } else {
+                this.place(card, index, layout);
+            }
+        });
+
+        this.queue = [];
+        for (let index = start; index < end; index++) {
+            if (!this.cards.has(index)) {
+                this.queue.push(index);
+            }
+        }
+        this.queueLayout = layout;
+        if (this.queue.length) {
+            // One batch now so the viewport isn't blank, the rest when the browser is idle
+            this.drain({ timeRemaining: () => 0 }, false);
+        }
+    }
+
+    drain(deadline, fromIdle = true) {
+        if (fromIdle) {
+            this.idleHandle = null;
+        }
+        const fragment = document.createDocumentFragment();
+        do {
+            this.queue.splice(0, GRID_IDLE_BATCH).forEach(index => {
+                if (this.cards.has(index) || index >= this.items.length) {
+                    return;
+                }
+                const card = this.free.pop() || this.createCard();
+                card.innerHTML = this.renderCard(this.items[index]);
+                this.place(card, index, this.queueLayout);
+                this.cards.set(index, card);
+                fragment.appendChild(card);
+            });
+        } while (this.queue.length && deadline.timeRemaining() > 4);
+        this.container.appendChild(fragment);
+
+        if (this.queue.length && this.idleHandle === null) {
+            this.idleHandle = requestIdle(next => this.drain(next));
+        }
+    }
+
+    createCard() {
+        const card = document.createElement('div');
+        card.className = this.cardClass;
+        card.style.height = `${this.cardHeight}px`;
+        return card;
+    }
+
+    place(card, index, layout) {
+        const row = Math.floor(index / layout.columns);
+        const column = index % layout.columns;
+        card.style.width = `${layout.cardWidth}px`;
+        card.style.transform = `translate(${column * (layout.cardWidth + this.gap)}px, ${row * layout.rowHeight}px)`;
+    }
+}
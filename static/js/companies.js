@@ -1,42 +1,87 @@
 // Companies page JavaScript
 
-let allCompanies = [];
+let currentSearch = '';
 
-async function loadCompanies(search = '') {
+const FACETS = ['batch', 'industry', 'location', 'is_hiring'];
+
+// Filter value for companies without a batch/industry/location (company_facets.NONE_VALUE)
+const FACET_NONE = '__none__';
+
+// Query string for the search term and the selected facet values (repeated params)
+function filterParams() {
+    const params = new URLSearchParams();
+    if (currentSearch) params.append('search', currentSearch);
+    FACETS.forEach(facet => {
+        const select = document.getElementById(`filter-${facet}`);
+        Array.from(select.selectedOptions).forEach(option => {
+            if (option.value !== '') params.append(facet, option.value);
+        });
+    });
+    return params;
+}
+
+function facetLabel(facet, value) {
+    if (value === null) return '(none)';
+    if (facet === 'is_hiring') return value ? 'Hiring' : 'Not hiring';
+    return value;
+}
+
+async function loadFacets() {
+    try {
+        const response = await fetch(`/api/companies/facets?${filterParams()}`);
+        const data = await response.json();
+        FACETS.forEach(facet => {
+            const select = document.getElementById(`filter-${facet}`);
+            const selected = new Set(Array.from(select.selectedOptions).map(option => option.value));
+            select.innerHTML = facet === 'is_hiring' ? '<option value="">Hiring: any</option>' : '';
+            data.facets[facet].forEach(({value, count}) => {
+                const option = document.createElement('option');
+                option.value = value === null ? FACET_NONE : String(value);
+                option.textContent = `${facetLabel(facet, value)} (${count})`;
+                option.selected = selected.has(option.value);
+                select.appendChild(option);
+            });
+        });
+    } catch (error) {
+        console.error('Error loading facets:', error);
+    }
+}
+
+function companyCard(company) {
+    return `
+        <div class="company-name">${company.name}</div>
+        ${company.batch ? `<div class="company-info">📅 Batch: ${company.batch}</div>` : ''}
+        ${company.location ? `<div class="company-info">📍 ${company.location}</div>` : ''}
+        ${company.industry ? `<div class="company-info">🏷️ ${company.industry}</div>` : ''}
+        ${company.is_hiring ? `<div class="company-info">✅ Hiring</div>` : ''}
+        <a href="${company.yc_url}" target="_blank" class="company-url">View on YC →</a>
+    `;
+}
+
+// Companies are fetched a page at a time as the grid scrolls (card_grid.js)
+const companiesGrid = new CardGrid(document.getElementById('companies-container'), {
+    cardClass: 'company-card',
+    cardHeight: 170,
+    minCardWidth: 240,
+    renderCard: companyCard,
+    fetchPage: (after, pageSize) => fetchListPage(`/api/companies?${filterParams()}`, after, pageSize),
+});
+
+async function loadCompanies(search = currentSearch) {
+    currentSearch = search;
     const loading = document.getElementById('loading');
-    const container = document.getElementById('companies-container');
     const noResults = document.getElementById('no-results');
     
     loading.style.display = 'block';
-    container.innerHTML = '';
     noResults.style.display = 'none';
     
     try {
-        const url = search ? `/api/companies?search=${encodeURIComponent(search)}` : '/api/companies';
-        const response = await fetch(url);
-        const companies = await response.json();
-        
-        allCompanies = companies;
+        const total = await companiesGrid.reset();
         loading.style.display = 'none';
         
-        if (companies.length === 0) {
+        if (total === 0) {
             noResults.style.display = 'block';
-            return;
         }
-        
-        companies.forEach(company => {
-            const card = document.createElement('div');
-            card.className = 'company-card';
-            card.innerHTML = `
-                <div class="company-name">${company.name}</div>
-                ${company.batch ? `<div class="company-info">📅 Batch: ${company.batch}</div>` : ''}
-                ${company.location ? `<div class="company-info">📍 ${company.location}</div>` : ''}
-                ${company.industry ? `<div class="company-info">🏷️ ${company.industry}</div>` : ''}
-                ${company.is_hiring ? `<div class="company-info">✅ Hiring</div>` : ''}
-                <a href="${company.yc_url}" target="_blank" class="company-url">View on YC →</a>
-            `;
-            container.appendChild(card);
-        });
     } catch (error) {
         console.error('Error loading companies:', error);
         loading.textContent = 'Error loading companies. Please try again.';
@@ -47,8 +92,17 @@ function searchCompanies() {
     const searchInput = document.getElementById('search-input');
     const searchTerm = searchInput.value.trim();
     loadCompanies(searchTerm);
+    loadFacets();
 }
 
+// Filters narrow the list server side; facet counts refresh with them
+document.querySelectorAll('.facet-select').forEach(select => {
+    select.addEventListener('change', () => {
+        loadCompanies();
+        loadFacets();
+    });
+});
+
 // Allow Enter key to trigger search
 document.getElementById('search-input').addEventListener('keypress', function(e) {
     if (e.key === 'Enter') {
@@ -58,4 +112,5 @@ document.getElementById('search-input').addEventListener('keypress', function(e)
 
 // Load companies on page load
 loadCompanies();
+loadFacets();
 
@@ -20,7 +20,7 @@ async function loadStats() {
             new Chart(topCompaniesCtx, {
                 type: 'bar',
                 data: {
-                    labels: stats.top_companies.map(c => c.company_name.split('\n')[0].substring(0, 20)),
+                    labels: stats.top_companies.map(c => (c.company_name || '').substring(0, 20)),
                     datasets: [{
                         label: 'Founders',
                         data: stats.top_companies.map(c => c.founder_count || c.member_count),
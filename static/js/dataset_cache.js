@@ -0,0 +1,192 @@
+// Companies table dataset kept in IndexedDB between visits. A repeat visit
+// renders the stored rows at once, then asks /api/changes what changed since
+// the stored change-log version and refetches only those companies. A full
+// download happens on the first visit, after a log compaction (resync) or
+// when the store is too far behind for a delta to be worth it.
+
+const DATASET_DB = 'yc-dataset';
+const DATASET_DB_VERSION = 1;
+const MAX_DELTA_VERSIONS = 2000;
+const CHANGES_PAGE = 1000;
+const REFRESH_BATCH = 100;  // ids per /api/companies/with-founders?id= request
+const STREAM_PROGRESS_MS = 500;
+
+async function getDatasetJSON(url) {
+    const response = await fetch(url);
+    if (!response.ok) {
+        throw new Error(`${url}: HTTP ${response.status}`);
+    }
+    return response.json();
+}
+
+function requestResult(request) {
+    return new Promise((resolve, reject) => {
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    });
+}
+
+function openDatasetDB() {
+    if (!window.indexedDB) {
+        return Promise.reject(new Error('IndexedDB unavailable'));
+    }
+    const request = indexedDB.open(DATASET_DB, DATASET_DB_VERSION);
+    request.onupgradeneeded = () => {
+        const db = request.result;
+        db.createObjectStore('companies', { keyPath: 'id' });
+        db.createObjectStore('meta');
+    };
+    return requestResult(request);
+}
+
+// {version, companies} from the last visit, or null
+async function readDataset() {
+    const db = await openDatasetDB();
+    try {
+        const tx = db.transaction(['companies', 'meta'], 'readonly');
+        const [meta, companies] = await Promise.all([
+            requestResult(tx.objectStore('meta').get('companies')),
+            requestResult(tx.objectStore('companies').getAll()),
+        ]);
+        if (!meta) {
+            return null;
+        }
+        // Keep the order the rows were first listed in
+        const order = new Map(meta.order.map((id, position) => [id, position]));
+        companies.sort((a, b) => order.get(a.id) - order.get(b.id));
+        return { version: meta.version, companies };
+    } finally {
+        db.close();
+    }
+}
+
+// Store rows and the version they are current as of (replace drops everything else)
+async function writeDataset(version, companies, { upserts = companies, deletes = [], replace = false } = {}) {
+    const db = await openDatasetDB();
+    try {
+        const tx = db.transaction(['companies', 'meta'], 'readwrite');
+        const store = tx.objectStore('companies');
+        if (replace) {
+            store.clear();
+        }
+        upserts.forEach(company => store.put(company));
+        deletes.forEach(id => store.delete(id));
+        tx.objectStore('meta').put({ version, order: companies.map(company => company.id) }, 'companies');
+        await new Promise((resolve, reject) => {
+            tx.oncomplete = resolve;
+            tx.onerror = () => reject(tx.error);
+            tx.onabort = () => reject(tx.error);
+        });
+    } finally {
+        db.close();
+    }
+}
+
+// Company ids changed after `since` and the version they bring us to,
+// or null when a full download is needed instead
+async function fetchChangedIds(since) {
+    const ids = new Set();
+    let version = since;
+    for (;;) {
+        const page = await getDatasetJSON(`/api/changes?since=${version}&limit=${CHANGES_PAGE}`);
+        if (page.resync || page.version - since > MAX_DELTA_VERSIONS) {
+            return null;
+        }
+        page.changes.forEach(change => ids.add(change.company_id));
+        version = page.next_since;
+        if (!page.has_more) {
+            return { ids: Array.from(ids), version };
+        }
+    }
+}
+
+// Read the whole list as NDJSON, handing the rows so far to onProgress now and
+// then (the array being filled, not a copy: read it, don't keep or change it)
+async function streamCompanies(onProgress) {
+    const url = '/api/companies/with-founders?format=ndjson';
+    const response = await fetch(url);
+    if (!response.ok) {
+        throw new Error(`${url}: HTTP ${response.status}`);
+    }
+    const companies = [];
+    const addLines = text => text.split('\n').forEach(line => {
+        if (line) companies.push(JSON.parse(line));
+    });
+    if (!response.body || !window.TextDecoder) {
+        addLines(await response.text());
+        return companies;
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffered = '';
+    let reported = performance.now();
+    for (;;) {
+        const { done, value } = await reader.read();
+        if (done) {
+            break;
+        }
+        buffered += decoder.decode(value, { stream: true });
+        const end = buffered.lastIndexOf('\n');
+        if (end >= 0) {
+            addLines(buffered.slice(0, end));
+            buffered = buffered.slice(end + 1);
+        }
+        if (onProgress && performance.now() - reported > STREAM_PROGRESS_MS) {
+            reported = performance.now();
+            onProgress(companies);
+        }
+    }
+    addLines(buffered + decoder.decode());
+    return companies;
+}
+
+// Download everything. `version` is the change-log version the caller already
+// knows the rows are at least as new as (e.g. from the page's bootstrap data).
+async function fetchFullDataset(version = null, onProgress = null) {
+    if (version === null) {
+        // Read the version first: changes landing during the download are picked up next sync
+        ({ version } = await getDatasetJSON('/api/changes?since=0&limit=0'));
+    }
+    const companies = await streamCompanies(onProgress);
+    writeDataset(version, companies, { replace: true }).catch(error => console.warn('Dataset not stored:', error));
+    return { version, companies, changed: true };
+}
+
+// Bring `cached` ({version, companies} or null) up to date: {version, companies, changed},
+// plus changedIds (the companies a delta refetched or deleted) unless everything was downloaded
+async function syncDataset(cached) {
+    if (!cached) {
+        return fetchFullDataset();
+    }
+    const delta = await fetchChangedIds(cached.version);
+    if (!delta) {
+        return fetchFullDataset();
+    }
+    if (!delta.ids.length) {
+        return { ...cached, changed: false };
+    }
+
+    // Refetch the changed companies; ids that don't come back were deleted (or unlisted)
+    const fresh = new Map();
+    for (let i = 0; i < delta.ids.length; i += REFRESH_BATCH) {
+        const params = delta.ids.slice(i, i + REFRESH_BATCH).map(id => `id=${id}`).join('&');
+        const rows = await getDatasetJSON(`/api/companies/with-founders?${params}`);
+        rows.forEach(company => fresh.set(company.id, company));
+    }
+    const deletes = delta.ids.filter(id => !fresh.has(id));
+    const removed = new Set(deletes);
+    const companies = cached.companies
+        .filter(company => !removed.has(company.id))
+        .map(company => fresh.get(company.id) || company);
+    const known = new Set(cached.companies.map(company => company.id));
+    fresh.forEach((company, id) => {
+        if (!known.has(id)) {
+            companies.push(company);
+        }
+    });
+
+    writeDataset(delta.version, companies, { upserts: Array.from(fresh.values()), deletes })
+        .catch(error => console.warn('Dataset not stored:', error));
+    return { version: delta.version, companies, changed: true, changedIds: delta.ids };
+}
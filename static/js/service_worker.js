@@ -0,0 +1,82 @@
+// Service worker for the companies table (served as /service-worker.js so its
+// scope is the whole site). Keeps the page shell (HTML, JS, CSS) in the Cache
+// API so repeat visits start without waiting on the network; the dataset
+// itself lives in IndexedDB (dataset_cache.js). API requests pass through.
+// The page itself is network-first: it has the first rows and the stats
+// inlined, so its cached copy is only served when the network fails.
+
+const SHELL_CACHE = 'yc-shell-v1';
+const SHELL = [
+    '/',
+    '/static/css/style.css',
+    '/static/js/dataset_cache.js',
+    '/static/js/table_index.js',
+    '/static/js/table_worker.js',
+    '/static/js/table.js',
+];
+
+self.addEventListener('install', (event) => {
+    event.waitUntil(caches.open(SHELL_CACHE).then(cache => cache.addAll(SHELL)));
+    self.skipWaiting();
+});
+
+self.addEventListener('activate', (event) => {
+    event.waitUntil((async () => {
+        const names = await caches.keys();
+        await Promise.all(names.filter(name => name !== SHELL_CACHE).map(name => caches.delete(name)));
+        // A new build renames its files (build_assets.py): drop the old ones
+        const cache = await caches.open(SHELL_CACHE);
+        const requests = await cache.keys();
+        await Promise.all(requests
+            .filter(request => !SHELL.includes(new URL(request.url).pathname))
+            .map(request => cache.delete(request)));
+    })());
+    self.clients.claim();
+});
+
+// Stale-while-revalidate: answer from the cache, refresh it in the background.
+// Fingerprinted files under /static/dist/ never change, so those skip the refresh.
+self.addEventListener('fetch', (event) => {
+    const url = new URL(event.request.url);
+    if (event.request.method !== 'GET' || url.origin !== self.location.origin || !SHELL.includes(url.pathname)) {
+        return;
+    }
+    if (event.request.mode === 'navigate') {
+        event.respondWith(networkFirst(event.request));
+        return;
+    }
+    event.respondWith(caches.open(SHELL_CACHE).then(async cache => {
+        const cached = await cache.match(event.request);
+        if (cached && url.pathname.startsWith('/static/dist/')) {
+            return cached;
+        }
+        const refresh = fetch(event.request).then(response => {
+            if (response.ok) {
+                cache.put(event.request, response.clone());
+            }
+            return response;
+        });
+        if (cached) {
+            event.waitUntil(refresh.catch(() => {}));
+            return cached;
+        }
+        return refresh;
+    }));
+});
+
+async function networkFirst(request) {
+    const cache = await caches.open(SHELL_CACHE);
+    try {
+        const response = await fetch(request);
+        if (response.ok) {
+            cache.put(request, response.clone());
+        }
+        return response;
+    } catch (error) {
+        const cached = await cache.match(request);
+        if (cached) {
+            return cached;
+        }
+        throw error;
+    }
+}
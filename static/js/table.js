@@ -2,11 +2,33 @@ let allCompanies = [];
 let filteredCompanies = [];
 let currentSort = { column: null, direction: null };
 
+// Company details (with founders and bios) by id, as promises so concurrent
+// callers share one request. Filled by hover prefetch and by clicks.
+const detailCache = new Map();
+const founderCache = new Map();
+let prefetchQueue = new Set();
+let prefetchTimer = null;
+const PREFETCH_DELAY_MS = 50;
+const PREFETCH_BATCH = 50;
+
 // Load companies on page load
 document.addEventListener('DOMContentLoaded', () => {
     loadCompanies();
+    if ('serviceWorker' in navigator) {
+        navigator.serviceWorker.register('/service-worker.js').catch(error => {
+            console.warn('Service worker not registered:', error);
+        });
+    }
     document.getElementById('searchInput').addEventListener('input', filterTable);
     
+    // Prefetch details of rows the pointer rests on (batched into one ?ids= request)
+    document.getElementById('tableBody').addEventListener('mouseover', (e) => {
+        const row = e.target.closest('tr[data-id]');
+        if (row) {
+            prefetchCompanyDetails(Number(row.dataset.id));
+        }
+    });
+    
     // Setup sortable headers
     document.querySelectorAll('.sortable').forEach(header => {
         header.addEventListener('click', () => {
@@ -18,14 +40,42 @@ document.addEventListener('DOMContentLoaded', () => {
 
 async function loadCompanies() {
     try {
-        const response = await fetch('/api/companies');
-        allCompanies = await response.json();
-        
-        // Load founder counts
-        await loadFounderCounts();
+        // Render the rows stored by the last visit right away, then sync them
+        // (dataset_cache.js; founders come embedded in each company)
+        const cached = await readDataset().catch(() => null);
+        if (cached) {
+            setCompanies(cached.companies);
+            const synced = await syncDataset(cached);
+            if (synced.changed) {
+                forgetCompanyDetails(synced.changedIds || null);
+                setCompanies(synced.companies);
+            }
+            // The inlined counter may come from an older page (offline fallback)
+            updateCounter();
+            return;
+        }
         
-        filteredCompanies = allCompanies;
-        renderTable();
+        // First visit: the page came with the first rows and the stats inlined;
+        // stream in the rest, growing the table as rows arrive. The streamed
+        // rows replace the bootstrap ones once, then only new rows are indexed.
+        const bootstrap = readBootstrap();
+        if (bootstrap) {
+            setCompanies(bootstrap.companies);
+        }
+        let streaming = false;
+        const full = await fetchFullDataset(bootstrap ? bootstrap.version : null, partial => {
+            if (streaming) {
+                appendCompanies(partial.slice(allCompanies.length));
+            } else if (partial.length > allCompanies.length) {
+                streaming = true;
+                setCompanies(partial.slice());
+            }
+        });
+        if (streaming) {
+            appendCompanies(full.companies.slice(allCompanies.length));
+        } else {
+            setCompanies(full.companies);
+        }
     } catch (error) {
         console.error('Error loading companies:', error);
         document.getElementById('tableBody').innerHTML = 
@@ -33,51 +83,125 @@ async function loadCompanies() {
     }
 }
 
-async function loadFounderCounts() {
-    try {
-        const response = await fetch('/api/founders');
-        const founders = await response.json();
-        
-        // Group founders by company
-        const foundersByCompany = {};
-        founders.forEach(founder => {
-            const companyName = founder.company_name || founder.company_display_name;
-            if (companyName) {
-                const cleanName = companyName.split('\n')[0];
-                if (!foundersByCompany[cleanName]) {
-                    foundersByCompany[cleanName] = [];
-                }
-                foundersByCompany[cleanName].push(founder);
-            }
-        });
-        
-        // Add founders to companies
-        allCompanies.forEach(company => {
-            const cleanName = company.name.split('\n')[0];
-            company.founders = foundersByCompany[cleanName] || [];
-        });
-    } catch (error) {
-        console.error('Error loading founder counts:', error);
-    }
+function readBootstrap() {
+    const element = document.getElementById('bootstrap-data');
+    return element ? JSON.parse(element.textContent) : null;
 }
 
-function filterTable() {
-    const searchTerm = document.getElementById('searchInput').value.toLowerCase();
+// Filtering and sorting run in a Web Worker over a prebuilt index
+// (table_index.js): the page only posts debounced queries and renders the
+// row ids that come back. Without Worker support the same index runs here.
+const QUERY_DEBOUNCE_MS = 80;
+let companiesById = new Map();
+let indexWorker = null;
+let localIndex = null;
+let querySeq = 0;
+let queryTimer = null;
+const queryCallbacks = new Map();  // seq -> resolve
+
+// What the index needs per company (founders as a count)
+function indexRows(companies) {
+    return companies.map(company => ({
+        id: company.id,
+        name: company.name,
+        batch: company.batch,
+        founders: (company.founders || []).length,
+    }));
+}
+
+function setCompanies(companies) {
+    allCompanies = companies;
+    companiesById = new Map(companies.map(company => [company.id, company]));
+    const rows = indexRows(companies);
     
-    filteredCompanies = allCompanies.filter(company => {
-        const name = (company.name || '').toLowerCase();
-        return !searchTerm || name.includes(searchTerm);
-    });
+    if (window.Worker && !localIndex) {
+        if (!indexWorker) {
+            indexWorker = new Worker('/static/js/table_worker.js');
+            indexWorker.onmessage = (event) => applyQueryResult(event.data.seq, event.data.ids);
+            indexWorker.onerror = (event) => {
+                console.error('Table worker failed, filtering in the page instead:', event.message);
+                indexWorker.terminate();
+                indexWorker = null;
+                localIndex = new TableIndex(indexRows(allCompanies));
+                runQuery();
+            };
+        }
+        indexWorker.postMessage({ type: 'load', rows });
+    } else {
+        localIndex = new TableIndex(rows);
+    }
     
-    // Reapply current sort
-    if (currentSort.column) {
-        sortTable(currentSort.column, currentSort.direction, false);
+    return refreshTable();
+}
+
+// Re-render all rows, or rerun the active search/sort over them
+function refreshTable() {
+    filteredCompanies = allCompanies;
+    renderTable();
+    if (document.getElementById('searchInput').value || currentSort.column) {
+        return runQuery();
+    }
+    return Promise.resolve();
+}
+
+// Add rows after the ones already loaded, indexing only those
+function appendCompanies(companies) {
+    if (!companies.length) {
+        return Promise.resolve();
+    }
+    companies.forEach(company => {
+        allCompanies.push(company);
+        companiesById.set(company.id, company);
+    });
+    const rows = indexRows(companies);
+    if (indexWorker) {
+        indexWorker.postMessage({ type: 'append', rows });
     } else {
+        localIndex.append(rows);
+    }
+    return refreshTable();
+}
+
+// Send the current search and sort to the index; resolves once the result is rendered
+function runQuery() {
+    clearTimeout(queryTimer);
+    const seq = ++querySeq;
+    const message = {
+        type: 'query',
+        seq,
+        search: document.getElementById('searchInput').value,
+        column: currentSort.column,
+        direction: currentSort.direction,
+    };
+    return new Promise(resolve => {
+        queryCallbacks.set(seq, resolve);
+        if (indexWorker) {
+            indexWorker.postMessage(message);
+        } else {
+            applyQueryResult(seq, localIndex.query(message.search, message.column, message.direction));
+        }
+    });
+}
+
+function applyQueryResult(seq, ids) {
+    // Results of superseded queries are dropped
+    if (seq === querySeq) {
+        filteredCompanies = Array.from(ids, id => companiesById.get(id));
         renderTable();
     }
+    const resolve = queryCallbacks.get(seq);
+    queryCallbacks.delete(seq);
+    if (resolve) {
+        resolve();
+    }
 }
 
-function sortTable(column, direction = null, updateFiltered = true) {
+function filterTable() {
+    clearTimeout(queryTimer);
+    queryTimer = setTimeout(runQuery, QUERY_DEBOUNCE_MS);
+}
+
+function sortTable(column, direction = null) {
     // Determine sort direction
     if (direction === null) {
         if (currentSort.column === column) {
@@ -98,31 +222,7 @@ function sortTable(column, direction = null, updateFiltered = true) {
         }
     });
     
-    // Sort the data
-    const companiesToSort = updateFiltered ? filteredCompanies : allCompanies;
-    
-    companiesToSort.sort((a, b) => {
-        let aValue, bValue;
-        
-        if (column === 'name') {
-            aValue = (a.name || '').toLowerCase();
-            bValue = (b.name || '').toLowerCase();
-        } else if (column === 'founders') {
-            aValue = (a.founders || []).length;
-            bValue = (b.founders || []).length;
-        } else if (column === 'batch') {
-            aValue = (a.batch || '').toLowerCase();
-            bValue = (b.batch || '').toLowerCase();
-        }
-        
-        if (aValue < bValue) return direction === 'asc' ? -1 : 1;
-        if (aValue > bValue) return direction === 'asc' ? 1 : -1;
-        return 0;
-    });
-    
-    if (updateFiltered) {
-        renderTable();
-    }
+    return runQuery();
 }
 
 async function updateCounter() {
@@ -143,61 +243,267 @@ async function updateCounter() {
     }
 }
 
+// Windowed rendering: only the rows in (or near) the viewport exist in the
+// DOM. Spacer rows above and below stand in for the rest, and row elements
+// leaving the window are reused for rows entering it.
+const ROW_HEIGHT_FALLBACK = 37;
+const OVERSCAN_ROWS = 10;
+let rowHeight = 0;
+let visibleRows = new Map();   // index into filteredCompanies -> <tr>
+let freeRows = [];             // recycled <tr> elements
+let topSpacer = null;
+let bottomSpacer = null;
+let scrollFrame = null;
+
 function renderTable() {
     const tbody = document.getElementById('tableBody');
     
     if (filteredCompanies.length === 0) {
+        visibleRows = new Map();
+        freeRows = [];
+        topSpacer = bottomSpacer = null;
         tbody.innerHTML = '<tr><td colspan="3" class="loading">No companies found</td></tr>';
         return;
     }
     
-    tbody.innerHTML = filteredCompanies.map(company => {
-        // Clean company name - take first line only, remove location if concatenated
-        let cleanName = company.name ? company.name.split('\n')[0] : '';
-        // Remove location patterns that are concatenated (e.g., "CompanyNameSan Francisco, CA, USA")
-        // Match: city name followed by ", XX, USA" or ", Country" at the end
-        cleanName = cleanName.replace(/, [A-Z]{2}, USA$/, '') // Remove ", CA, USA" etc
-            .replace(/, (United States|USA|United Kingdom|UK|Canada|Germany|France|Spain|Italy|Netherlands|Belgium|Switzerland|Austria|Sweden|Norway|Denmark|Finland|Poland|Czech Republic|Hungary|Romania|Bulgaria|Greece|Portugal|Ireland|Croatia|Slovenia|Slovakia|Lithuania|Latvia|Estonia|Luxembourg|Malta|Cyprus|Iceland|Liechtenstein|Monaco|San Marino|Vatican City|Andorra|Gibraltar|Australia|New Zealand|Japan|South Korea|China|India|Singapore|Hong Kong|Taiwan|Thailand|Malaysia|Indonesia|Philippines|Vietnam|Cambodia|Laos|Myanmar|Bangladesh|Sri Lanka|Pakistan|Nepal|Bhutan|Maldives|Afghanistan|Iran|Iraq|Saudi Arabia|UAE|Qatar|Kuwait|Bahrain|Oman|Yemen|Jordan|Lebanon|Syria|Israel|Palestine|Turkey|Cyprus|Georgia|Armenia|Azerbaijan|Kazakhstan|Uzbekistan|Turkmenistan|Tajikistan|Kyrgyzstan|Mongolia|North Korea|Russia|Belarus|Ukraine|Moldova|Serbia|Montenegro|Bosnia and Herzegovina|North Macedonia|Albania|Kosovo)$/i, '')
-            .replace(/(San Francisco|New York|Los Angeles|Boston|Seattle|Austin|Chicago|Denver|Miami|Portland|Remote|Berlin|London|Toronto|Vancouver|Tel Aviv|Bangalore|Singapore|Tokyo|Sydney|Melbourne|Paris|Amsterdam|Stockholm|Copenhagen|Zurich|Dublin|Madrid|Barcelona|Milan|Rome|Vienna|Prague|Warsaw|Helsinki|Oslo|Brussels|Lisbon|Athens|Dubai|Hong Kong|Shanghai|Beijing|Mumbai|Delhi|Hyderabad|Chennai|Pune|Kolkata|Jakarta|Manila|Bangkok|Hanoi|Seoul|Taipei|Kuala Lumpur|Mexico City|São Paulo|Rio de Janeiro|Buenos Aires|Santiago|Lima|Bogotá|Caracas|Montevideo|Lagos|Nairobi|Cairo|Johannesburg|Cape Town|Casablanca|Tunis|Algiers|Accra|Addis Ababa|Dakar|Kampala|Dar es Salaam|Kigali|Khartoum|Kinshasa|Luanda|Maputo|Harare|Lusaka|Windhoek|Gaborone|Mbabane|Maseru|Libreville|Yaoundé|Douala|Abidjan|Ouagadougou|Bamako|Niamey|Nouakchott|Banjul|Bissau|Conakry|Freetown|Monrovia|Brazzaville|Bujumbura|Djibouti|Asmara|Malabo|Moroni|Victoria|Port Louis|Saint-Denis|Saint-Pierre|Kingston|Port-au-Prince|Santo Domingo|Havana|San Juan|Nassau|Bridgetown|Castries|Kingstown|Roseau|St\. John's|Basseterre|St\. George's|Hamilton|Road Town|The Valley|Cockburn Town|George Town|Oranjestad|Willemstad|Philipsburg|Marigot|Gustavia|Basse-Terre|Fort-de-France|Pointe-à-Pitre|Saint-Pierre|Miquelon|Saint-Barthélemy|Saint-Martin|Bonaire|Saba|Sint Eustatius|Sint Maarten|Anguilla|Montserrat|Turks and Caicos|British Virgin Islands|Cayman Islands|Bermuda|Falkland Islands|South Georgia|Saint Helena|Ascension|Tristan da Cunha|Pitcairn|Tokelau|Niue|Cook Islands|American Samoa|Guam|Northern Mariana Islands|Puerto Rico|US Virgin Islands|Wake Island|Midway Atoll|Johnston Atoll|Palmyra Atoll|Baker Island|Howland Island|Jarvis Island|Kingman Reef|Navassa Island|Serranilla Bank|Bajo Nuevo Bank|Clipperton Island|Revillagigedo Islands|Socorro Island|Clarion Island|San Benedicto Island|Roca Partida|Guadalupe Island|Cedros Island|Natividad Island|San Roque Island|Asunción Island|San Martín Island|San Jerónimo Island|San Esteban Island|Tiburón Island|Ángel de la Guarda Island|Partida Norte Island|Partida Sur Island|Espíritu Santo Island|San José Island|San Francisco Island|San Diego Island|Coronados Islands|Todos Santos Islands)$/i, '')
-            .trim();
-        
-        const founders = company.founders || [];
-        
-        let foundersDisplay = '';
-        if (founders.length > 0) {
-            foundersDisplay = founders.map((f, idx) => {
-                const roleText = f.role ? ` (${f.role})` : '';
-                return `<a href="#" class="founder-link" onclick="event.stopPropagation(); showFounderPopup(${company.id}, ${idx}); return false;">${f.name}${roleText}</a>`;
-            }).join(', ');
+    // Keep the scroll offset across filter/sort (clamped when the list got shorter)
+    const scrollY = window.scrollY;
+    if (!topSpacer || topSpacer.parentNode !== tbody) {
+        visibleRows = new Map();
+        freeRows = [];
+        topSpacer = createSpacer();
+        bottomSpacer = createSpacer();
+        tbody.replaceChildren(topSpacer, bottomSpacer);
+    }
+    updateVisibleRows(true);
+    if (window.scrollY !== scrollY) {
+        window.scrollTo(window.scrollX, scrollY);
+        updateVisibleRows();
+    }
+}
+
+function createSpacer() {
+    const row = document.createElement('tr');
+    row.className = 'spacer-row';
+    row.innerHTML = '<td colspan="3"></td>';
+    return row;
+}
+
+function createRow() {
+    const row = document.createElement('tr');
+    row.className = 'virtual-row';
+    row.innerHTML = '<td class="company-name"></td><td class="batch-cell"></td><td class="founders-cell"></td>';
+    row.addEventListener('click', () => showCompanyDetails(row.company.id));
+    return row;
+}
+
+function fillRow(row, company) {
+    if (row.company === company) {
+        return;
+    }
+    row.company = company;
+    row.dataset.id = company.id;
+    
+    // Names arrive already cleaned (display_name is computed when the row is written)
+    const cleanName = company.name || '';
+    
+    const founders = company.founders || [];
+    
+    let foundersDisplay = '';
+    if (founders.length > 0) {
+        foundersDisplay = founders.map(f => {
+            const roleText = f.role ? ` (${f.role})` : '';
+            return `<a href="#" class="founder-link" onclick="event.stopPropagation(); showFounderPopup(${company.id}, ${f.id}); return false;">${f.name}${roleText}</a>`;
+        }).join(', ');
+    } else {
+        foundersDisplay = '<span style="color: #9b9a97; font-style: italic;">No founders</span>';
+    }
+    
+    const ycLink = company.yc_url ? `<a href="${company.yc_url}" target="_blank" class="company-link" onclick="event.stopPropagation();">${cleanName}</a>` : cleanName;
+    const batchDisplay = company.batch ? `<span class="batch-badge">${company.batch}</span>` : '<span style="color: #9b9a97; font-style: italic;">—</span>';
+    
+    row.cells[0].innerHTML = ycLink;
+    row.cells[1].innerHTML = batchDisplay;
+    row.cells[2].innerHTML = foundersDisplay;
+}
+
+// Sync the materialized rows with the viewport. `dataChanged` re-checks every
+// row's company (after filter/sort); otherwise only rows entering the window are filled.
+function updateVisibleRows(dataChanged = false) {
+    const tbody = document.getElementById('tableBody');
+    if (!topSpacer || topSpacer.parentNode !== tbody) {
+        return;
+    }
+    
+    const height = rowHeight || ROW_HEIGHT_FALLBACK;
+    const count = filteredCompanies.length;
+    const viewTop = -tbody.getBoundingClientRect().top;
+    const start = Math.min(count, Math.max(0, Math.floor(viewTop / height) - OVERSCAN_ROWS));
+    const end = Math.min(count, Math.max(start, Math.ceil((viewTop + window.innerHeight) / height) + OVERSCAN_ROWS));
+    
+    // Release rows that left the window; after a filter/sort the rows that stay
+    // are refilled in place (fillRow skips rows still showing the same company)
+    visibleRows.forEach((row, index) => {
+        if (index < start || index >= end) {
+            visibleRows.delete(index);
+            freeRows.push(row);
+        } else if (dataChanged) {
+            fillRow(row, filteredCompanies[index]);
+        }
+    });
+    
+    for (let index = start; index < end; index++) {
+        if (!visibleRows.has(index)) {
+            const row = freeRows.pop() || createRow();
+            fillRow(row, filteredCompanies[index]);
+            visibleRows.set(index, row);
+        }
+    }
+    freeRows.forEach(row => row.remove());
+    
+    // Put the window's rows in order between the spacers, moving only misplaced ones
+    let previous = topSpacer;
+    for (let index = start; index < end; index++) {
+        const row = visibleRows.get(index);
+        if (previous.nextSibling !== row) {
+            tbody.insertBefore(row, previous.nextSibling);
+        }
+        previous = row;
+    }
+    
+    if (!rowHeight && end > start) {
+        rowHeight = visibleRows.get(start).getBoundingClientRect().height || ROW_HEIGHT_FALLBACK;
+    }
+    topSpacer.firstChild.style.height = `${start * rowHeight}px`;
+    bottomSpacer.firstChild.style.height = `${(count - end) * rowHeight}px`;
+}
+
+function scheduleVisibleRows() {
+    if (scrollFrame === null) {
+        scrollFrame = requestAnimationFrame(() => {
+            scrollFrame = null;
+            updateVisibleRows();
+        });
+    }
+}
+
+window.addEventListener('scroll', scheduleVisibleRows, { passive: true });
+window.addEventListener('resize', scheduleVisibleRows);
+
+async function fetchJSON(url) {
+    const response = await fetch(url);
+    if (!response.ok) {
+        throw new Error(`${url}: HTTP ${response.status}`);
+    }
+    return response.json();
+}
+
+// Fetch the queued ids in one /api/companies?ids= request and settle their cache entries
+async function flushPrefetch() {
+    prefetchTimer = null;
+    const ids = Array.from(prefetchQueue);
+    prefetchQueue = new Set();
+    
+    // Register every id before the first await so callers find the pending promise
+    const resolvers = new Map();
+    ids.forEach(id => {
+        const pending = new Promise((resolve, reject) => resolvers.set(id, { resolve, reject }));
+        pending.catch(() => {});  // a failed prefetch only matters to whoever awaits it
+        detailCache.set(id, pending);
+    });
+    
+    for (let i = 0; i < ids.length; i += PREFETCH_BATCH) {
+        const batch = ids.slice(i, i + PREFETCH_BATCH);
+        let companies = [];
+        let failure = null;
+        try {
+            companies = await fetchJSON(`/api/companies?ids=${batch.join(',')}`);
+        } catch (error) {
+            failure = error;
+        }
+        const found = new Map(companies.map(company => [company.id, company]));
+        batch.forEach(id => {
+            if (found.has(id)) {
+                resolvers.get(id).resolve(found.get(id));
+            } else {
+                detailCache.delete(id);
+                resolvers.get(id).reject(failure || new Error(`Company ${id} not found`));
+            }
+        });
+    }
+}
+
+function prefetchCompanyDetails(companyId) {
+    if (detailCache.has(companyId) || prefetchQueue.has(companyId)) {
+        return;
+    }
+    prefetchQueue.add(companyId);
+    if (!prefetchTimer) {
+        prefetchTimer = setTimeout(flushPrefetch, PREFETCH_DELAY_MS);
+    }
+}
+
+function getCompanyDetails(companyId) {
+    if (!detailCache.has(companyId)) {
+        if (prefetchQueue.has(companyId)) {
+            // Already queued: send the batch now instead of waiting for the timer
+            clearTimeout(prefetchTimer);
+            flushPrefetch();
         } else {
-            foundersDisplay = '<span style="color: #9b9a97; font-style: italic;">No founders</span>';
+            const request = fetchJSON(`/api/companies/${companyId}`).catch(error => {
+                detailCache.delete(companyId);
+                throw error;
+            });
+            detailCache.set(companyId, request);
         }
-        
-        const ycLink = company.yc_url ? `<a href="${company.yc_url}" target="_blank" class="company-link" onclick="event.stopPropagation();">${cleanName}</a>` : cleanName;
-        const batchDisplay = company.batch ? `<span class="batch-badge">${company.batch}</span>` : '<span style="color: #9b9a97; font-style: italic;">—</span>';
-        
-        return `
-            <tr onclick="showCompanyDetails(${company.id})">
-                <td class="company-name">${ycLink}</td>
-                <td class="batch-cell">${batchDisplay}</td>
-                <td class="founders-cell">${foundersDisplay}</td>
-            </tr>
-        `;
-    }).join('');
+    }
+    return detailCache.get(companyId);
+}
+
+// Drop cached details of companies that changed (all of them for null),
+// including their founders, so the next hover or click refetches them
+function forgetCompanyDetails(companyIds) {
+    if (companyIds === null) {
+        detailCache.clear();
+        founderCache.clear();
+        return;
+    }
+    companyIds.forEach(id => {
+        const company = companiesById.get(id);
+        (company ? company.founders || [] : []).forEach(founder => founderCache.delete(founder.id));
+        detailCache.delete(id);
+    });
+}
+
+async function getFounder(companyId, founderId) {
+    // Reuse the company details when they are cached (or being fetched)
+    if (detailCache.has(companyId)) {
+        const company = await detailCache.get(companyId);
+        const founder = (company.founders || []).find(f => f.id === founderId);
+        if (founder) {
+            return founder;
+        }
+    }
+    if (!founderCache.has(founderId)) {
+        const request = fetchJSON(`/api/founders/${founderId}`).catch(error => {
+            founderCache.delete(founderId);
+            throw error;
+        });
+        founderCache.set(founderId, request);
+    }
+    return founderCache.get(founderId);
 }
 
 async function showCompanyDetails(companyId) {
     try {
-        const response = await fetch(`/api/companies/${companyId}`);
-        const company = await response.json();
+        const company = await getCompanyDetails(companyId);
         
-        const cleanName = company.name.split('\n')[0];
-        document.getElementById('detailsCompanyName').textContent = cleanName;
+        document.getElementById('detailsCompanyName').textContent = company.display_name || company.name;
         
         // Display founders
         const foundersList = document.getElementById('foundersList');
         if (company.founders && company.founders.length > 0) {
-            foundersList.innerHTML = company.founders.map((founder, idx) => {
+            foundersList.innerHTML = company.founders.map(founder => {
                 let links = '';
                 if (founder.linkedin_url) {
                     links += `<a href="${founder.linkedin_url}" target="_blank">LinkedIn</a>`;
@@ -212,7 +518,7 @@ async function showCompanyDetails(companyId) {
                 return `
                     <div class="founder-item">
                         <div class="founder-name">
-                            <a href="#" class="founder-link" onclick="event.stopPropagation(); showFounderPopup(${companyId}, ${idx}); return false;">${founder.name}</a>
+                            <a href="#" class="founder-link" onclick="event.stopPropagation(); showFounderPopup(${companyId}, ${founder.id}); return false;">${founder.name}</a>
                         </div>
                         ${founder.role ? `<div class="founder-role">${founder.role}</div>` : ''}
                         ${links ? `<div class="founder-links">${links}</div>` : ''}
@@ -230,16 +536,9 @@ async function showCompanyDetails(companyId) {
     }
 }
 
-async function showFounderPopup(companyId, founderIndex) {
+async function showFounderPopup(companyId, founderId) {
     try {
-        const response = await fetch(`/api/companies/${companyId}`);
-        const company = await response.json();
-        
-        if (!company.founders || !company.founders[founderIndex]) {
-            return;
-        }
-        
-        const founder = company.founders[founderIndex];
+        const founder = await getFounder(companyId, founderId);
         
         // Create popup HTML
         let linksHTML = '';
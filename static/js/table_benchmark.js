@@ -0,0 +1,153 @@
+// Per-keystroke cost of filtering and rendering the companies table
+// (static/bench/table.html). Compares table.js (indexed query in the worker,
+// windowed rendering) with the previous approach: lowercasing every name on
+// the UI thread and rebuilding every row through tbody.innerHTML.
+
+const BENCHMARK_SIZES = [5000, 50000];
+const BENCHMARK_QUERY = 'any 42';  // typed one character at a time, then erased
+const BATCHES = ['W24', 'S24', 'W23', 'S23', 'W22', 'S22'];
+const ROLES = ['CEO', 'CTO', 'Founder', null];
+
+function syntheticCompanies(count) {
+    const companies = [];
+    for (let i = 0; i < count; i++) {
+        const founders = [];
+        for (let j = 0; j < 1 + (i % 3); j++) {
+            founders.push({ id: i * 3 + j, name: `Person ${i}-${j}`, role: ROLES[(i + j) % ROLES.length] });
+        }
+        companies.push({
+            id: i + 1,
+            name: `Company ${i}`,
+            batch: BATCHES[i % BATCHES.length],
+            yc_url: `https://www.ycombinator.com/companies/company-${i}`,
+            founders,
+        });
+    }
+    return companies;
+}
+
+// The old renderer: one HTML string for every filtered row
+function renderAllRows() {
+    const tbody = document.getElementById('tableBody');
+
+    if (filteredCompanies.length === 0) {
+        tbody.innerHTML = '<tr><td colspan="3" class="loading">No companies found</td></tr>';
+        return;
+    }
+
+    tbody.innerHTML = filteredCompanies.map(company => {
+        const cleanName = company.name || '';
+        const founders = company.founders || [];
+
+        let foundersDisplay = '';
+        if (founders.length > 0) {
+            foundersDisplay = founders.map(f => {
+                const roleText = f.role ? ` (${f.role})` : '';
+                return `<a href="#" class="founder-link" onclick="event.stopPropagation(); showFounderPopup(${company.id}, ${f.id}); return false;">${f.name}${roleText}</a>`;
+            }).join(', ');
+        } else {
+            foundersDisplay = '<span style="color: #9b9a97; font-style: italic;">No founders</span>';
+        }
+
+        const ycLink = company.yc_url ? `<a href="${company.yc_url}" target="_blank" class="company-link" onclick="event.stopPropagation();">${cleanName}</a>` : cleanName;
+        const batchDisplay = company.batch ? `<span class="batch-badge">${company.batch}</span>` : '<span style="color: #9b9a97; font-style: italic;">—</span>';
+
+        return `
+            <tr onclick="showCompanyDetails(${company.id})">
+                <td class="company-name">${ycLink}</td>
+                <td class="batch-cell">${batchDisplay}</td>
+                <td class="founders-cell">${foundersDisplay}</td>
+            </tr>
+        `;
+    }).join('');
+}
+
+function keystrokes() {
+    const values = [];
+    for (let i = 1; i <= BENCHMARK_QUERY.length; i++) {
+        values.push(BENCHMARK_QUERY.slice(0, i));
+    }
+    for (let i = BENCHMARK_QUERY.length - 1; i >= 0; i--) {
+        values.push(BENCHMARK_QUERY.slice(0, i));
+    }
+    return values;
+}
+
+const nextFrame = () => new Promise(resolve => requestAnimationFrame(() => setTimeout(resolve)));
+
+// The old filter: lowercase every name on each keystroke, then rebuild the table
+function filterAllRows(value) {
+    const searchTerm = value.toLowerCase();
+    filteredCompanies = allCompanies.filter(company => {
+        const name = (company.name || '').toLowerCase();
+        return !searchTerm || name.includes(searchTerm);
+    });
+    renderAllRows();
+}
+
+// Time from keystroke to rendered rows (including the layout it causes).
+// `blocked` is the part spent on the UI thread, during which input is frozen.
+async function timeTyping(strategy, size) {
+    const input = document.getElementById('searchInput');
+    input.value = '';
+    await setCompanies(syntheticCompanies(size));
+    strategy('');
+    await nextFrame();
+
+    const total = [];
+    const blocked = [];
+    for (const value of keystrokes()) {
+        input.value = value;
+        const start = performance.now();
+        const pending = strategy(value);
+        const busy = performance.now() - start;
+        if (pending) {
+            await pending;
+        }
+        document.getElementById('tableBody').offsetHeight;  // force layout
+        total.push(performance.now() - start);
+        blocked.push(pending ? busy + lastRenderMs : total[total.length - 1]);
+        await nextFrame();  // let the frame paint before the next keystroke
+    }
+    return { total, blocked };
+}
+
+// Render time of the latest windowed render, for the UI-thread share of a worker query
+let lastRenderMs = 0;
+const windowedRender = renderTable;
+renderTable = function () {
+    const start = performance.now();
+    windowedRender();
+    document.getElementById('tableBody').offsetHeight;
+    lastRenderMs = performance.now() - start;
+};
+
+const STRATEGIES = [
+    ['worker + windowed', () => runQuery()],
+    ['old (innerHTML)', value => { filterAllRows(value); }],
+];
+
+function median(timings) {
+    const sorted = [...timings].sort((a, b) => a - b);
+    return sorted[Math.floor(sorted.length / 2)];
+}
+
+async function runBenchmark() {
+    const output = document.getElementById('benchmarkResults');
+    const lines = [`${'rows'.padStart(7)} ${'approach'.padEnd(18)} ${'median ms'.padStart(10)} ${'max ms'.padStart(8)} ${'UI-thread ms'.padStart(13)} ${'DOM rows'.padStart(9)}`];
+    output.textContent = 'Running...';
+
+    for (const size of BENCHMARK_SIZES) {
+        for (const [name, strategy] of STRATEGIES) {
+            const { total, blocked } = await timeTyping(strategy, size);
+            const domRows = document.getElementById('tableBody').rows.length;
+            lines.push(`${String(size).padStart(7)} ${name.padEnd(18)} ${median(total).toFixed(1).padStart(10)} ` +
+                       `${Math.max(...total).toFixed(1).padStart(8)} ${median(blocked).toFixed(1).padStart(13)} ${String(domRows).padStart(9)}`);
+            output.textContent = lines.join('\n');
+        }
+    }
+
+    console.log(lines.join('\n'));
+}
+
+document.getElementById('runBenchmark').addEventListener('click', runBenchmark);
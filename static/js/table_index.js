@@ -0,0 +1,136 @@
+// Search/sort index over the companies table rows. Runs inside the table
+// worker (table_worker.js) and, where Workers are unavailable, in the page.
+// Rows are {id, name, batch, founders} with founders as a count. Rows can be
+// appended while the dataset streams in, without rebuilding what's indexed.
+
+const NGRAM = 3;
+
+class TableIndex {
+    constructor(rows = []) {
+        this.ids = [];
+        this.names = [];
+        this.keys = { name: this.names, batch: [], founders: [] };
+        this.ngrams = new Map();  // trigram -> ascending row positions of names containing it
+        this.append(rows);
+    }
+
+    // Index more rows after the ones already there
+    append(rows) {
+        rows.forEach(row => {
+            const position = this.ids.length;
+            const name = (row.name || '').toLowerCase();
+            this.ids.push(row.id);
+            this.names.push(name);
+            this.keys.batch.push((row.batch || '').toLowerCase());
+            this.keys.founders.push(row.founders || 0);
+
+            const seen = new Set();
+            for (let i = 0; i + NGRAM <= name.length; i++) {
+                const gram = name.slice(i, i + NGRAM);
+                if (!seen.has(gram)) {
+                    seen.add(gram);
+                    let list = this.ngrams.get(gram);
+                    if (!list) {
+                        list = [];
+                        this.ngrams.set(gram, list);
+                    }
+                    list.push(position);
+                }
+            }
+        });
+        // Sort orders cover all rows, so they are rebuilt on next use
+        this.permutations = {};  // "column:direction" -> Int32Array of row positions
+        this.ranks = {};         // same key -> rank of each row position
+    }
+
+    // Stable sort order of all rows for a column, built on first use
+    permutation(column, direction) {
+        const key = `${column}:${direction}`;
+        if (!this.permutations[key]) {
+            const values = this.keys[column];
+            const sign = direction === 'desc' ? -1 : 1;
+            const order = Array.from(values.keys()).sort((a, b) => {
+                if (values[a] < values[b]) return -sign;
+                if (values[a] > values[b]) return sign;
+                return 0;
+            });
+            const ranks = new Int32Array(order.length);
+            order.forEach((position, rank) => { ranks[position] = rank; });
+            this.permutations[key] = Int32Array.from(order);
+            this.ranks[key] = ranks;
+        }
+        return this.permutations[key];
+    }
+
+    // Ascending row positions whose name contains `search` (null means all rows)
+    match(search) {
+        search = search.toLowerCase();
+        if (!search) {
+            return null;
+        }
+        if (search.length < NGRAM) {
+            const matches = [];
+            this.names.forEach((name, position) => {
+                if (name.includes(search)) matches.push(position);
+            });
+            return matches;
+        }
+
+        // Candidates contain every trigram of the query; check the rest by substring
+        const lists = [];
+        for (let i = 0; i + NGRAM <= search.length; i++) {
+            const list = this.ngrams.get(search.slice(i, i + NGRAM));
+            if (!list) {
+                return [];
+            }
+            lists.push(list);
+        }
+        lists.sort((a, b) => a.length - b.length);
+        let candidates = Array.from(lists[0]);
+        for (let i = 1; i < lists.length && candidates.length; i++) {
+            candidates = intersectSorted(candidates, lists[i]);
+        }
+        return candidates.filter(position => this.names[position].includes(search));
+    }
+
+    // Company ids matching `search`, in the requested order (source order without a column)
+    query(search, column, direction) {
+        const matches = this.match(search || '');
+        if (!column || !this.keys[column]) {
+            return matches === null ? Int32Array.from(this.ids) : Int32Array.from(matches, position => this.ids[position]);
+        }
+
+        const order = this.permutation(column, direction);
+        let positions;
+        if (matches === null) {
+            positions = order;
+        } else if (matches.length * 16 < order.length) {
+            // Few matches: sort them by rank instead of walking the whole permutation
+            const ranks = this.ranks[`${column}:${direction}`];
+            positions = matches.sort((a, b) => ranks[a] - ranks[b]);
+        } else {
+            const selected = new Uint8Array(order.length);
+            matches.forEach(position => { selected[position] = 1; });
+            positions = order.filter(position => selected[position]);
+        }
+        return Int32Array.from(positions, position => this.ids[position]);
+    }
+}
+
+function intersectSorted(a, b) {
+    const result = [];
+    let i = 0;
+    let j = 0;
+    while (i < a.length && j < b.length) {
+        if (a[i] === b[j]) {
+            result.push(a[i]);
+            i++;
+            j++;
+        } else if (a[i] < b[j]) {
+            i++;
+        } else {
+            j++;
+        }
+    }
+    return result;
+}
@@ -0,0 +1,21 @@
+// Companies table worker: holds the TableIndex and answers queries with row ids
+//   {type: 'load', rows}                                  -> builds the index
+//   {type: 'append', rows}                                -> indexes more rows
+//   {type: 'query', seq, search, column, direction}       -> {seq, ids: Int32Array}
+
+// Absolute so build_assets.py can point it at the fingerprinted build
+importScripts('/static/js/table_index.js');
+
+let index = null;
+
+self.onmessage = (event) => {
+    const message = event.data;
+    if (message.type === 'load') {
+        index = new TableIndex(message.rows);
+    } else if (message.type === 'append') {
+        index.append(message.rows);
+    } else if (message.type === 'query') {
+        const ids = index ? index.query(message.search, message.column, message.direction) : new Int32Array(0);
+        self.postMessage({ seq: message.seq, ids }, [ids.buffer]);
+    }
+};
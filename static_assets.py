@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Fingerprinted static assets
+build_assets.py writes minified copies of the JS/CSS (and the self-hosted
+fonts) to static/dist under content-hashed names, with .br/.gz siblings, and
+a manifest mapping each source path ('js/table.js') to its build
+('js/table.3f2a1b9c0d.js'). Templates link assets through asset_url(), which
+falls back to the plain source file when there is no build (or in debug
+mode), and dist files are served precompressed with an immutable
+Cache-Control since their names change whenever their content does.
+"""
+
+import json
+import mimetypes
+import os
+
+from flask import abort, current_app, request, send_file
+from werkzeug.security import safe_join
+
+from json_stream import negotiate_encoding
+
+DIST_DIR = 'dist'
+MANIFEST_NAME = 'manifest.json'
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# Content-Encoding -> file suffix, in order of preference
+PRECOMPRESSED = {'br': '.br', 'gzip': '.gz'}
+
+
+class StaticAssets:
+    """Manifest lookups and precompressed serving for one static folder"""
+
+    def __init__(self, static_folder, static_url_path='/static'):
+        self.dist_folder = os.path.join(static_folder, DIST_DIR)
+        self.manifest_path = os.path.join(self.dist_folder, MANIFEST_NAME)
+        self.source_url = static_url_path
+        self.dist_url = f'{static_url_path}/{DIST_DIR}'
+        self._manifest = {}
+        self._manifest_mtime = None
+
+    def manifest(self):
+        """Source path -> built path; re-read whenever build_assets.py rewrites it"""
+        try:
+            mtime = os.stat(self.manifest_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime != self._manifest_mtime:
+            manifest = {}
+            if mtime is not None:
+                with open(self.manifest_path, encoding='utf-8') as f:
+                    manifest = json.load(f)
+            self._manifest, self._manifest_mtime = manifest, mtime
+        return self._manifest
+
+    def built(self, path):
+        """Built file name for a source path, or None (no build, or debug mode)"""
+        if current_app.debug:
+            return None
+        return self.manifest().get(path)
+
+    def url(self, path):
+        """URL of an asset given its path under static/"""
+        built = self.built(path)
+        if built:
+            return f'{self.dist_url}/{built}'
+        return f'{self.source_url}/{path}'
+
+    def send(self, filename):
+        """Serve a dist file, precompressed when the client accepts it"""
+        path = safe_join(self.dist_folder, filename)
+        if path is None or not os.path.isfile(path):
+            abort(404)
+
+        available = [encoding for encoding, suffix in PRECOMPRESSED.items()
+                     if os.path.isfile(path + suffix)]
+        encoding = negotiate_encoding(request.headers.get('Accept-Encoding'), available)
+        mimetype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if encoding:
+            response = send_file(path + PRECOMPRESSED[encoding], mimetype=mimetype)
+            response.headers['Content-Encoding'] = encoding
+        else:
+            response = send_file(path, mimetype=mimetype)
+        if available:
+            response.vary.add('Accept-Encoding')
+        response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+        return response
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Trigger-maintained statistics rollup for the dashboard
+Keeps /api/stats a constant-time read instead of re-aggregating every table
+"""
+
+import sqlite3
+import sys
+
+from company_names import setup_display_names
+
+# A company counts towards total_companies when its URL is a real company page
+COUNTED_COMPANY = "{0}.yc_url LIKE '%/companies/%' AND {0}.yc_url NOT LIKE '%?%'"
+
+# Batch buckets follow the same rules as the old GROUP BY query
+HAS_BATCH = "{0}.batch IS NOT NULL AND {0}.batch != ''"
+
+
+def _company_delta(row, sign):
+    """SQL statements adding (sign=+1) or removing (sign=-1) a company row's contribution"""
+    op = '+' if sign > 0 else '-'
+    counted = COUNTED_COMPANY.format(row)
+    has_batch = HAS_BATCH.format(row)
+    statements = [
+        f"""UPDATE stats_rollup SET value = value {op} 1
+            WHERE metric = 'total_companies' AND bucket = '' AND ({counted});""",
+        f"""UPDATE stats_rollup SET value = value {op} 1
+            WHERE metric = 'companies_with_founders' AND bucket = '' AND {row}.founder_count > 0;""",
+    ]
+    if sign > 0:
+        statements.append(
+            f"""INSERT INTO stats_rollup (metric, bucket, value)
+                SELECT 'batch', {row}.batch, 1 WHERE {has_batch}
+                ON CONFLICT(metric, bucket) DO UPDATE SET value = value + 1;"""
+        )
+    else:
+        statements.append(
+            f"""UPDATE stats_rollup SET value = value - 1
+                WHERE metric = 'batch' AND bucket = {row}.batch AND ({has_batch});"""
+        )
+        statements.append("DELETE FROM stats_rollup WHERE metric = 'batch' AND value <= 0;")
+    return '\n'.join(statements)
+
+
+def _founder_delta(company_id, sign, count_founder=True):
+    """SQL statements adding or removing one founder from a company's count"""
+    op = '+' if sign > 0 else '-'
+    # founder_count reaches 1 after the first founder is added, 0 after the last is removed
+    boundary = 1 if sign > 0 else 0
+    statements = []
+    if count_founder:
+        statements.append(
+            f"""UPDATE stats_rollup SET value = value {op} 1
+                WHERE metric = 'total_founders' AND bucket = '';"""
+        )
+    statements.append(
+        f"UPDATE companies SET founder_count = founder_count {op} 1 WHERE id = {company_id};"
+    )
+    statements.append(
+        f"""UPDATE stats_rollup SET value = value {op} 1
+            WHERE metric = 'companies_with_founders' AND bucket = ''
+            AND (SELECT founder_count FROM companies WHERE id = {company_id}) = {boundary};"""
+    )
+    return '\n'.join(statements)
+
+
+# INSERT OR REPLACE deletes the conflicting row without firing delete triggers
+# (recursive_triggers is off). The BEFORE INSERT triggers note the rows an insert
+# could replace in stats_replace_candidates; the *_after_replace triggers retract
+# those that are actually gone once the insert happened. An insert that is
+# ignored or turned into an update never fires AFTER INSERT, so its candidates
+# are simply cleared by the next insert.
+REPLACED = "source = '{0}' AND (row_id = NEW.id OR row_id NOT IN (SELECT id FROM {0}))"
+
+TRIGGERS = {
+    'stats_companies_before_insert': """
+        CREATE TRIGGER stats_companies_before_insert BEFORE INSERT ON companies
+        BEGIN
+            DELETE FROM stats_replace_candidates WHERE source = 'companies';
+            INSERT INTO stats_replace_candidates (source, row_id, yc_url, batch, founder_count)
+            SELECT 'companies', id, yc_url, batch, founder_count FROM companies
+            WHERE id = NEW.id OR (name = NEW.name AND batch = NEW.batch);
+        END
+    """,
+    'stats_companies_after_replace': f"""
+        CREATE TRIGGER stats_companies_after_replace AFTER INSERT ON companies
+        WHEN EXISTS (SELECT 1 FROM stats_replace_candidates WHERE {REPLACED.format('companies')})
+        BEGIN
+            UPDATE stats_rollup SET value = value - (
+                SELECT COUNT(*) FROM stats_replace_candidates old_row
+                WHERE {REPLACED.format('companies')} AND {COUNTED_COMPANY.format('old_row')})
+            WHERE metric = 'total_companies' AND bucket = '';
+            UPDATE stats_rollup SET value = value - (
+                SELECT COUNT(*) FROM stats_replace_candidates
+                WHERE {REPLACED.format('companies')} AND founder_count > 0)
+            WHERE metric = 'companies_with_founders' AND bucket = '';
+            UPDATE stats_rollup SET value = value - (
+                SELECT COUNT(*) FROM stats_replace_candidates
+                WHERE {REPLACED.format('companies')} AND batch = stats_rollup.bucket)
+            WHERE metric = 'batch' AND bucket IN (
+                SELECT batch FROM stats_replace_candidates old_row
+                WHERE {REPLACED.format('companies')} AND {HAS_BATCH.format('old_row')});
+            DELETE FROM stats_rollup WHERE metric = 'batch' AND value <= 0;
+            DELETE FROM stats_replace_candidates WHERE source = 'companies';
+        END
+    """,
+    'stats_companies_after_insert': f"""
+        CREATE TRIGGER stats_companies_after_insert AFTER INSERT ON companies
+        BEGIN
+            {_company_delta('NEW', +1)}
+        END
+    """,
+    'stats_companies_after_delete': f"""
+        CREATE TRIGGER stats_companies_after_delete AFTER DELETE ON companies
+        BEGIN
+            {_company_delta('OLD', -1)}
+        END
+    """,
+    'stats_companies_after_update': f"""
+        CREATE TRIGGER stats_companies_after_update AFTER UPDATE OF yc_url, batch ON companies
+        BEGIN
+            {_company_delta('OLD', -1)}
+            {_company_delta('NEW', +1)}
+        END
+    """,
+    'stats_founders_before_insert': """
+        CREATE TRIGGER stats_founders_before_insert BEFORE INSERT ON founders
+        BEGIN
+            DELETE FROM stats_replace_candidates WHERE source = 'founders';
+            INSERT INTO stats_replace_candidates (source, row_id, company_id)
+            SELECT 'founders', id, company_id FROM founders
+            WHERE id = NEW.id OR (company_name = NEW.company_name AND name = NEW.name);
+        END
+    """,
+    'stats_founders_after_replace': f"""
+        CREATE TRIGGER stats_founders_after_replace AFTER INSERT ON founders
+        WHEN EXISTS (SELECT 1 FROM stats_replace_candidates WHERE {REPLACED.format('founders')})
+        BEGIN
+            UPDATE stats_rollup SET value = value - (
+                SELECT COUNT(*) FROM stats_replace_candidates WHERE {REPLACED.format('founders')})
+            WHERE metric = 'total_founders' AND bucket = '';
+            UPDATE companies SET founder_count = founder_count - (
+                SELECT COUNT(*) FROM stats_replace_candidates
+                WHERE {REPLACED.format('founders')} AND company_id = companies.id)
+            WHERE id IN (SELECT company_id FROM stats_replace_candidates WHERE {REPLACED.format('founders')});
+            UPDATE stats_rollup SET value = value - (
+                SELECT COUNT(*) FROM companies
+                WHERE founder_count = 0
+                AND id IN (SELECT company_id FROM stats_replace_candidates WHERE {REPLACED.format('founders')}))
+            WHERE metric = 'companies_with_founders' AND bucket = '';
+            DELETE FROM stats_replace_candidates WHERE source = 'founders';
+        END
+    """,
+    'stats_founders_after_insert': f"""
+        CREATE TRIGGER stats_founders_after_insert AFTER INSERT ON founders
+        BEGIN
+            {_founder_delta('NEW.company_id', +1)}
+        END
+    """,
+    'stats_founders_after_delete': f"""
+        CREATE TRIGGER stats_founders_after_delete AFTER DELETE ON founders
+        BEGIN
+            {_founder_delta('OLD.company_id', -1)}
+        END
+    """,
+    'stats_founders_after_update': f"""
+        CREATE TRIGGER stats_founders_after_update AFTER UPDATE OF company_id ON founders
+        WHEN OLD.company_id IS NOT NEW.company_id
+        BEGIN
+            {_founder_delta('OLD.company_id', -1, count_founder=False)}
+            {_founder_delta('NEW.company_id', +1, count_founder=False)}
+        END
+    """,
+}
+
+
+def _has_column(conn, table, column):
+    """Check whether a table already has a column"""
+    return any(row[1] == column for row in conn.execute(f'PRAGMA table_info({table})'))
+
+
+def setup_stats_rollup(conn):
+    """Create the rollup table, founder_count column, indexes and triggers if missing
+
+    Returns True when the rollup was created and had to be rebuilt from scratch.
+    """
+    existing = dict(conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type IN ('table', 'trigger')"
+    ).fetchall())
+    # Triggers are recreated whenever their definition in this file changes
+    if 'stats_rollup' in existing and all(existing.get(name) == sql.strip() for name, sql in TRIGGERS.items()):
+        return False
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS stats_rollup (
+            metric TEXT NOT NULL,
+            bucket TEXT NOT NULL DEFAULT '',
+            value INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (metric, bucket)
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS stats_replace_candidates (
+            source TEXT NOT NULL,
+            row_id INTEGER NOT NULL,
+            yc_url TEXT,
+            batch TEXT,
+            founder_count INTEGER,
+            company_id INTEGER
+        )
+    ''')
+    if not _has_column(conn, 'companies', 'founder_count'):
+        conn.execute('ALTER TABLE companies ADD COLUMN founder_count INTEGER NOT NULL DEFAULT 0')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_founders_company_id ON founders(company_id)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_companies_founder_count ON companies(founder_count)')
+
+    for name, sql in TRIGGERS.items():
+        conn.execute(f'DROP TRIGGER IF EXISTS {name}')
+        conn.execute(sql)
+
+    rebuild_stats(conn)
+    return True
+
+
+def rebuild_stats(conn):
+    """Recompute every rollup value and founder_count from the base tables"""
+    conn.execute('DELETE FROM stats_rollup')
+    conn.execute('DELETE FROM stats_replace_candidates')
+    conn.execute('''
+        UPDATE companies SET founder_count = (
+            SELECT COUNT(*) FROM founders WHERE founders.company_id = companies.id
+        )
+    ''')
+    conn.execute(f'''
+        INSERT INTO stats_rollup (metric, bucket, value)
+        SELECT 'total_companies', '', COUNT(*) FROM companies c
+        WHERE {COUNTED_COMPANY.format('c')}
+    ''')
+    conn.execute('''
+        INSERT INTO stats_rollup (metric, bucket, value)
+        SELECT 'total_founders', '', COUNT(*) FROM founders
+    ''')
+    conn.execute('''
+        INSERT INTO stats_rollup (metric, bucket, value)
+        SELECT 'companies_with_founders', '', COUNT(*) FROM companies
+        WHERE founder_count > 0
+    ''')
+    conn.execute(f'''
+        INSERT INTO stats_rollup (metric, bucket, value)
+        SELECT 'batch', c.batch, COUNT(*) FROM companies c
+        WHERE {HAS_BATCH.format('c')}
+        GROUP BY c.batch
+    ''')
+    conn.commit()
+
+
+def read_stats(conn):
+    """Read the dashboard statistics from the rollup (constant time)"""
+    totals = dict(conn.execute(
+        "SELECT metric, value FROM stats_rollup WHERE metric != 'batch'"
+    ).fetchall())
+
+    batch_stats = conn.execute('''
+        SELECT bucket AS batch, value AS count
+        FROM stats_rollup
+        WHERE metric = 'batch'
+        ORDER BY value DESC
+    ''').fetchall()
+
+    top_companies = conn.execute('''
+        SELECT display_name AS company_name, founder_count
+        FROM companies
+        WHERE founder_count > 0
+        ORDER BY founder_count DESC
+        LIMIT 10
+    ''').fetchall()
+
+    return {
+        'total_companies': totals.get('total_companies', 0),
+        'companies_with_founders': totals.get('companies_with_founders', 0),
+        'total_founders': totals.get('total_founders', 0),
+        'batch_stats': [{'batch': batch, 'count': count} for batch, count in batch_stats],
+        'top_companies': [
+            {'company_name': name, 'founder_count': count} for name, count in top_companies
+        ]
+    }
+
+
+if __name__ == "__main__":
+    db_path = sys.argv[1] if len(sys.argv) > 1 else 'yc_companies.db'
+
+    conn = sqlite3.connect(db_path)
+    setup_display_names(conn)
+    if not setup_stats_rollup(conn):
+        rebuild_stats(conn)
+    stats = read_stats(conn)
+    conn.close()
+
+    print(f"✅ Rebuilt stats rollup for {db_path}")
+    print(f"   Companies: {stats['total_companies']}")
+    print(f"   Companies with founders: {stats['companies_with_founders']}")
+    print(f"   Founders: {stats['total_founders']}")
+    print(f"   Batches: {len(stats['batch_stats'])}")
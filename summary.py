@@ -4,21 +4,13 @@ Summary view of YC Companies Database
 """
 
 import sqlite3
-import re
 
-def clean_name(name):
-    """Clean company name - remove location if concatenated"""
-    if not name:
-        return ''
-    # Remove location patterns
-    name = re.sub(r'[A-Z][a-z]+[A-Z][a-z]+,?\s+[A-Z]{2},?\s+[A-Z]{2,}', '', name)
-    # Take first line only
-    name = name.split('\n')[0].strip()
-    return name
+from company_names import setup_display_names
 
 def get_summary(db_path='yc_companies.db'):
     """Get database summary"""
     conn = sqlite3.connect(db_path)
+    setup_display_names(conn)
     cursor = conn.cursor()
     
     # Total companies
@@ -51,13 +43,13 @@ def get_summary(db_path='yc_companies.db'):
     
     # Sample companies
     cursor.execute('''
-        SELECT name, batch, location, yc_url 
+        SELECT display_name, batch, location, yc_url 
         FROM companies 
         WHERE yc_url LIKE "%/companies/%" 
         AND yc_url NOT LIKE "%?%" 
         AND yc_url NOT LIKE "%industry=%" 
         AND yc_url NOT LIKE "%batch=%"
-        ORDER BY name
+        ORDER BY sort_name
         LIMIT 50
     ''')
     companies = cursor.fetchall()
@@ -86,11 +78,10 @@ def display_summary():
     print("="*80 + "\n")
     
     for i, (name, batch, location, yc_url) in enumerate(summary['companies'], 1):
-        clean = clean_name(name)
         batch_str = batch if batch else 'N/A'
         location_str = location if location else 'N/A'
         
-        print(f"{i:3}. {clean:<45} | Batch: {batch_str:<15} | {location_str}")
+        print(f"{i:3}. {name:<45} | Batch: {batch_str:<15} | {location_str}")
         if yc_url:
             print(f"     {yc_url}")
         print()
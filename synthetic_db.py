@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Synthetic companies/founders databases for benchmarks
+Rows look like real scrapes: batches skewed towards recent years (some
+missing or in short form), skewed locations and industries, descriptions
+and bios with a long tail (a few run to thousands of words), dirty names
+(location glued on, extra lines, stray whitespace), directory listing URLs
+and a share of duplicate rows for remove_duplicates.py.
+
+The tables use the scrapers' schema; the app adds display names, rollups,
+side tables and triggers on first start (or app.prepare_database()).
+
+Usage: python3 synthetic_db.py <companies, e.g. 10k|100k|1m> [db_path] [--seed=N]
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import time
+
+SIZES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+
+# Bump when the generated data changes, so cached databases are rebuilt
+GENERATOR_VERSION = 1
+
+CHUNK_SIZE = 10_000
+
+# Share of companies written a second time (same URL, or same name without one)
+URL_DUPLICATE_RATE = 0.015
+NAME_DUPLICATE_RATE = 0.005
+
+# Founders per company: weights for 0, 1, 2, 3, 4
+FOUNDER_COUNT_WEIGHTS = (8, 30, 40, 17, 5)
+
+LOCATIONS = (
+    ('San Francisco, CA, USA', 38), ('New York, NY, USA', 12), ('Remote', 6),
+    ('Los Angeles, CA, USA', 4), ('Boston, MA, USA', 4), ('Seattle, WA, USA', 3),
+    ('Austin, TX, USA', 2), ('London, United Kingdom', 4), ('Toronto, Canada', 2),
+    ('Bangalore, India', 3), ('Berlin, Germany', 2), ('Paris, France', 2),
+    ('Singapore', 2), ('Mexico City, Mexico', 1), ('São Paulo, Brazil', 1),
+    ('Lagos, Nigeria', 1), ('Tel Aviv, Israel', 1), (None, 12),
+)
+
+INDUSTRIES = (
+    ('B2B', 36), ('Fintech', 12), ('Healthcare', 11), ('Consumer', 9), ('Industrials', 6),
+    ('Education', 4), ('Real Estate and Construction', 3), ('Government', 2),
+    ('Unspecified', 2), (None, 15),
+)
+
+# Glued onto names the way some listing scrapes did, e.g. "NimbusSanFrancisco, CA, USA"
+GLUED_LOCATIONS = ('SanFrancisco, CA, USA', 'NewYork, NY, USA', 'LosAngeles, CA, USA', 'PaloAlto, CA, USA')
+
+NAME_PREFIXES = (
+    'Nimbus', 'Quanta', 'Vela', 'Orbit', 'Lumen', 'Ferro', 'Atlas', 'Pylon', 'Kite', 'Cobalt',
+    'Helix', 'Nova', 'Sable', 'Tidal', 'Vector', 'Zephyr', 'Argo', 'Basil', 'Cinder', 'Delta',
+    'Ember', 'Fable', 'Grove', 'Harbor', 'Iris', 'Juno', 'Kestrel', 'Lark', 'Mosaic', 'Nectar',
+    'Onyx', 'Prism', 'Quill', 'Rally', 'Sonar', 'Terra', 'Umber', 'Vivid', 'Wren', 'Yonder',
+)
+NAME_SUFFIXES = (
+    '', 'ly', 'io', 'AI', 'Labs', 'Health', 'Pay', 'Stack', 'Works', 'Bio', 'HQ', 'Cloud',
+    'Robotics', 'Data', 'Ops', 'Hub', 'Logic', 'Base', 'Flow', 'Grid',
+)
+NAME_QUALIFIERS = ('', 'Systems', 'Technologies', 'Inc', 'Co', 'Group', 'Analytics', 'Security')
+
+FIRST_NAMES = (
+    'Alex', 'Priya', 'Wei', 'Sam', 'Maria', 'Jordan', 'Aisha', 'Diego', 'Yuki', 'Noah',
+    'Fatima', 'Liam', 'Chen', 'Sofia', 'Omar', 'Emma', 'Ravi', 'Hana', 'Lucas', 'Zara',
+    'Mateo', 'Ines', 'Kofi', 'Mei', 'Daniel', 'Amara', 'Jonas', 'Leila', 'Arjun', 'Nina',
+)
+LAST_NAMES = (
+    'Smith', 'Patel', 'Zhang', 'Garcia', 'Kim', 'Nguyen', 'Okafor', 'Müller', 'Rossi', 'Cohen',
+    'Singh', 'Tanaka', 'Silva', 'Haddad', 'Johansson', 'Kowalski', 'Dubois', 'Ivanova', 'Mensah',
+    'Fernández', 'Chowdhury', 'Park', 'Schmidt', 'Ali', 'Brown', 'Lopez', 'Wang', 'Sato',
+)
+ROLES = (
+    ('Founder', 20), ('Co-Founder & CEO', 30), ('Co-Founder & CTO', 25), ('Co-Founder', 15),
+    ('Founder & CEO', 6), ('Co-Founder & COO', 4),
+)
+PREVIOUS_COMPANIES = ('Google', 'Stripe', 'Meta', 'Amazon', 'Palantir', 'McKinsey', 'Uber', 'Airbnb', 'Microsoft')
+
+SENTENCES = (
+    'We build infrastructure that lets developers ship AI features in days instead of months.',
+    'Our platform automates the back-office workflows that finance teams still run in spreadsheets.',
+    'Hospitals use our software to cut patient intake time in half.',
+    'We are an open-source alternative to legacy observability tools.',
+    'Customers include fast-growing startups and several Fortune 500 companies.',
+    'The team previously built payments systems that processed billions of dollars.',
+    'We help logistics operators track every shipment in real time.',
+    'Our API turns unstructured documents into clean, structured data.',
+    'Small businesses use us to get paid faster and manage cash flow.',
+    'We make it simple for teams to run secure, compliant cloud environments.',
+    'Our robots handle repetitive tasks on factory floors.',
+    'Students learn faster with personalized tutoring powered by language models.',
+    'We are hiring engineers who want to work on hard distributed systems problems.',
+    'Revenue has grown 20% month over month since launch.',
+    'We partner with insurers to make claims processing instant.',
+    'Our marketplace connects contractors with homeowners across the country.',
+    'Every month thousands of developers deploy with our CLI.',
+    'We replace manual compliance reviews with continuous automated checks.',
+)
+
+
+def parse_size(value):
+    """'10k', '100k', '1m' or a plain number of companies"""
+    value = value.strip().lower()
+    if value in SIZES:
+        return SIZES[value]
+    if value.endswith('k'):
+        return int(float(value[:-1]) * 1_000)
+    if value.endswith('m'):
+        return int(float(value[:-1]) * 1_000_000)
+    return int(value)
+
+
+def _weighted(pairs):
+    values = [value for value, _ in pairs]
+    cumulative, total = [], 0
+    for _, weight in pairs:
+        total += weight
+        cumulative.append(total)
+    return values, cumulative
+
+
+def _batches():
+    """(batch, weight) pairs: batches grow every year, newest ones largest"""
+    pairs = []
+    for year in range(2005, 2027):
+        seasons = ('Winter', 'Summer') if year < 2024 else ('Winter', 'Spring', 'Summer', 'Fall')
+        for season in seasons:
+            pairs.append((f'{season} {year}', 1.3 ** (year - 2005)))
+    return pairs
+
+
+BATCHES = _batches()
+
+
+class _Generator:
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.batches = _weighted(BATCHES)
+        self.locations = _weighted(LOCATIONS)
+        self.industries = _weighted(INDUSTRIES)
+        self.roles = _weighted(ROLES)
+        self.now = time.time()
+
+    def pick(self, weighted):
+        values, cumulative = weighted
+        return self.rng.choices(values, cum_weights=cumulative)[0]
+
+    def text(self, mu, sigma, cap):
+        """A few sentences usually, occasionally pages of them (lognormal)"""
+        rng = self.rng
+        count = min(cap, int(rng.lognormvariate(mu, sigma)) + 1)
+        sentences = rng.choices(SENTENCES, k=count)
+        if count > 6:
+            # Long texts come in paragraphs
+            for i in range(5, count, rng.randint(4, 8)):
+                sentences[i] = '\n\n' + sentences[i]
+        return ' '.join(sentences)
+
+    def company_name(self, i):
+        prefix = NAME_PREFIXES[i % len(NAME_PREFIXES)]
+        suffix = NAME_SUFFIXES[(i // len(NAME_PREFIXES)) % len(NAME_SUFFIXES)]
+        qualifier = NAME_QUALIFIERS[(i // (len(NAME_PREFIXES) * len(NAME_SUFFIXES))) % len(NAME_QUALIFIERS)]
+        round_number = i // (len(NAME_PREFIXES) * len(NAME_SUFFIXES) * len(NAME_QUALIFIERS))
+        name = prefix + suffix if suffix in ('', 'ly', 'io') else f'{prefix} {suffix}'
+        if qualifier:
+            name += f' {qualifier}'
+        if round_number:
+            name += f' {round_number + 1}'
+        return name
+
+    def dirty(self, name, location, batch, description):
+        """Scraped names are not always clean: location glued on, extra lines, whitespace"""
+        rng = self.rng
+        roll = rng.random()
+        if roll < 0.05:
+            return name + rng.choice(GLUED_LOCATIONS)
+        if roll < 0.10 and location:
+            return f'{name}\n{location}'
+        if roll < 0.13:
+            one_liner = description.split('.')[0] if description else 'Building something new'
+            return f'{name}\n{one_liner}\n{batch or ""}'.rstrip()
+        if roll < 0.16:
+            return f' {name}  '
+        return name
+
+    def created_at(self):
+        seconds = self.now - self.rng.random() * 90 * 86400
+        return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(seconds))
+
+    def company(self, company_id, i):
+        rng = self.rng
+        clean = self.company_name(i)
+        slug = clean.lower().replace(' ', '-')
+
+        roll = rng.random()
+        batch = None if roll < 0.06 else self.pick(self.batches)
+        if batch and roll > 0.96:
+            season, year = batch.split()
+            batch = f'{season[0]}{year[2:]}'  # short form, e.g. W25
+
+        location = self.pick(self.locations)
+        description = None if rng.random() < 0.08 else self.text(1.2, 0.9, 400)
+
+        if rng.random() < 0.02:
+            # A directory listing link scraped as if it were a company
+            listing = rng.choice(('batch=Winter%202025', 'industry=Fintech', 'isHiring=true&batch=Summer%202024'))
+            yc_url = f'https://www.ycombinator.com/companies?{listing}'
+        else:
+            yc_url = f'https://www.ycombinator.com/companies/{slug}'
+
+        return (
+            company_id,
+            self.dirty(clean, location, batch, description),
+            batch,
+            description,
+            None if rng.random() < 0.1 else f'https://{slug}.com',
+            location,
+            self.pick(self.industries),
+            rng.random() < 0.3,
+            yc_url,
+            self.created_at(),
+        )
+
+    def duplicate(self, company_id, row, by_url):
+        """A second, sparser copy of a company (older scrape, different batch form)"""
+        rng = self.rng
+        _, name, batch, description, website, location, industry, is_hiring, yc_url, _ = row
+        if by_url:
+            # Same URL; the batch differs so UNIQUE(name, batch) doesn't reject it
+            return (company_id, name.split('\n')[0].strip(), None, None, website,
+                    location if rng.random() < 0.5 else None, None, is_hiring, yc_url, self.created_at())
+        return (company_id, name, None, description if rng.random() < 0.3 else None, None,
+                None, industry, is_hiring, None, self.created_at())
+
+    def founders(self, company_id, company_name):
+        rng = self.rng
+        count = rng.choices(range(len(FOUNDER_COUNT_WEIGHTS)), weights=FOUNDER_COUNT_WEIGHTS)[0]
+        names = set()
+        while len(names) < count:
+            names.add(f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}')
+        rows = []
+        for name in sorted(names):
+            handle = name.lower().replace(' ', '-')
+            rows.append((
+                company_id,
+                company_name,
+                name,
+                self.pick(self.roles),
+                rng.choice(PREVIOUS_COMPANIES) if rng.random() < 0.3 else None,
+                f'https://www.linkedin.com/in/{handle}-{company_id}' if rng.random() < 0.7 else None,
+                f'https://x.com/{handle.replace("-", "")}{company_id}' if rng.random() < 0.4 else None,
+                f'https://www.ycombinator.com/people/{handle}' if rng.random() < 0.5 else None,
+                self.text(1.0, 1.0, 150) if rng.random() < 0.6 else None,
+                self.created_at(),
+            ))
+        return rows
+
+
+def build_database(db_path, companies, seed=0):
+    """Write a fresh database with `companies` companies (plus duplicates) and their founders"""
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    generator = _Generator(seed)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute('PRAGMA journal_mode=OFF')
+    conn.execute('PRAGMA synchronous=OFF')
+    conn.execute('''
+        CREATE TABLE companies (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            batch TEXT,
+            description TEXT,
+            website TEXT,
+            location TEXT,
+            industry TEXT,
+            is_hiring BOOLEAN DEFAULT 1,
+            yc_url TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(name, batch)
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE founders (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            company_id INTEGER,
+            company_name TEXT,
+            name TEXT NOT NULL,
+            role TEXT,
+            previous_company TEXT,
+            linkedin_url TEXT,
+            twitter_url TEXT,
+            yc_profile_url TEXT,
+            bio TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (company_id) REFERENCES companies(id),
+            UNIQUE(company_name, name)
+        )
+    ''')
+
+    rng = generator.rng
+    company_id = 0
+    for start in range(0, companies, CHUNK_SIZE):
+        company_rows, founder_rows = [], []
+        for i in range(start, min(start + CHUNK_SIZE, companies)):
+            company_id += 1
+            row = generator.company(company_id, i)
+            company_rows.append(row)
+            founder_rows += generator.founders(company_id, row[1])
+
+            roll = rng.random()
+            if roll < URL_DUPLICATE_RATE + NAME_DUPLICATE_RATE:
+                company_id += 1
+                company_rows.append(generator.duplicate(company_id, row, by_url=roll < URL_DUPLICATE_RATE))
+
+        conn.executemany('''
+            INSERT OR IGNORE INTO companies
+            (id, name, batch, description, website, location, industry, is_hiring, yc_url, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', company_rows)
+        conn.executemany('''
+            INSERT OR IGNORE INTO founders
+            (company_id, company_name, name, role, previous_company, linkedin_url, twitter_url,
+             yc_profile_url, bio, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', founder_rows)
+    conn.commit()
+    conn.close()
+
+
+def cached_database(companies, directory, seed=0):
+    """Path of a generated database in `directory`, building it only if it isn't there yet"""
+    os.makedirs(directory, exist_ok=True)
+    db_path = os.path.join(directory, f'synthetic-{companies}-seed{seed}-v{GENERATOR_VERSION}.db')
+    if not os.path.exists(db_path):
+        tmp_path = f'{db_path}.{os.getpid()}.tmp'
+        build_database(tmp_path, companies, seed)
+        os.replace(tmp_path, db_path)
+    return db_path
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if not args:
+        print(__doc__.strip().splitlines()[-1])
+        sys.exit(1)
+    seed = 0
+    for arg in sys.argv[1:]:
+        if arg.startswith('--seed='):
+            seed = int(arg.split('=', 1)[1])
+
+    companies = parse_size(args[0])
+    db_path = args[1] if len(args) > 1 else f'synthetic_{args[0].lower()}.db'
+
+    print(f"🏗️  Building {db_path} with {companies:,} companies (seed {seed})...")
+    start = time.perf_counter()
+    build_database(db_path, companies, seed)
+
+    conn = sqlite3.connect(db_path)
+    total_companies = conn.execute('SELECT COUNT(*) FROM companies').fetchone()[0]
+    total_founders = conn.execute('SELECT COUNT(*) FROM founders').fetchone()[0]
+    conn.close()
+    print(f"✅ {total_companies:,} companies, {total_founders:,} founders, "
+          f"{os.path.getsize(db_path) / 1e6:.0f} MB in {time.perf_counter() - start:.1f}s")
@@ -0,0 +1,35 @@
+"""
+Shared fixtures for the tests: a small synthetic database (synthetic_db.py)
+"""
+
+import os
+import sys
+
+import pytest
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+import synthetic_db
+
+COMPANIES = 200
+
+
+@pytest.fixture
+def raw_db(tmp_path):
+    """Generated database as a scraper would leave it"""
+    db_path = os.path.join(tmp_path, 'yc_companies.db')
+    synthetic_db.build_database(db_path, COMPANIES)
+    return db_path
+
+
+@pytest.fixture
+def client(raw_db, monkeypatch):
+    """Test client of the app serving the generated database (response cache off)"""
+    import app as app_module
+    from response_cache import ResponseCache
+
+    monkeypatch.setitem(app_module.app.config, 'DATABASE', raw_db)
+    monkeypatch.setattr(app_module, '_schema_ready', False)
+    monkeypatch.setattr(app_module, 'response_cache', ResponseCache(0))
+    return app_module.app.test_client()
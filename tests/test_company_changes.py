@@ -0,0 +1,102 @@
+"""
+Re-saving unchanged founders must not touch their rows or the change log
+"""
+
+import os
+import sqlite3
+
+import pytest
+
+from company_changes import current_version
+from db_writer import DBWriter
+from scraper_api import YCApiScraper
+
+FOUNDERS = [
+    {'name': 'Ada Founder', 'role': 'CEO', 'linkedin': 'https://linkedin.com/in/ada', 'bio': 'Built things.'},
+    {'name': 'Bo Builder', 'role': 'CTO'},
+]
+
+
+def _scraper(tmp_path):
+    scraper = YCApiScraper(os.path.join(tmp_path, 'yc_companies.db'))
+    conn = sqlite3.connect(scraper.db_path)
+    company_id = conn.execute('''
+        INSERT INTO companies (name, batch, yc_url, display_name, sort_name)
+        VALUES ('Acme', 'Winter 2025', 'https://www.ycombinator.com/companies/acme', 'Acme', 'acme')
+    ''').lastrowid
+    conn.commit()
+    return scraper, conn, company_id
+
+
+def _founders(conn):
+    return conn.execute('SELECT id, company_id, name, role FROM founders ORDER BY id').fetchall()
+
+
+def test_unchanged_founders_log_nothing(tmp_path):
+    scraper, conn, company_id = _scraper(tmp_path)
+    scraper.save_founders(conn.cursor(), company_id, 'Acme', FOUNDERS)
+    conn.commit()
+    founders, version = _founders(conn), current_version(conn)
+
+    scraper.save_founders(conn.cursor(), company_id, 'Acme', FOUNDERS)
+    conn.commit()
+    assert _founders(conn) == founders
+    assert current_version(conn) == version
+    assert conn.execute('SELECT COUNT(*) FROM founder_texts').fetchone()[0] == 1
+
+    scraper.save_founders(conn.cursor(), company_id, 'Acme', [dict(FOUNDERS[1], role='CEO')])
+    conn.commit()
+    assert current_version(conn) == version + 1
+    assert [row[0] for row in _founders(conn)] == [row[0] for row in founders]
+
+
+def test_writer_upsert_logs_only_changes(tmp_path):
+    scraper, conn, company_id = _scraper(tmp_path)
+    founders = [{'name': 'Ada Founder', 'role': 'CEO', 'bio': 'Built things.'}]
+    with DBWriter(scraper.db_path) as writer:
+        writer.write_founders(company_id, 'Acme', founders)
+        writer.flush()
+        version = current_version(conn)
+        writer.write_founders(company_id, 'Acme', founders)
+    assert current_version(conn) == version
+    assert len(_founders(conn)) == 1
+
+
+@pytest.fixture
+def changed_client(client, raw_db):
+    """The app, with a few companies edited after its change log was set up"""
+    client.get('/api/stats')
+    conn = sqlite3.connect(raw_db)
+    conn.execute("UPDATE companies SET website = 'https://example.com' WHERE id <= 3")
+    conn.commit()
+    conn.close()
+    return client
+
+
+def _changes(client, **args):
+    response = client.get('/api/changes', query_string=args)
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def test_limit_zero_reads_only_the_version(changed_client):
+    page = _changes(changed_client, since=0, limit=0)
+    assert page['changes'] == [] and page['has_more'] is False
+    assert page['version'] > 0
+
+
+@pytest.mark.parametrize('limit', [-1, -1000])
+def test_negative_limit_is_clamped(changed_client, limit):
+    page = _changes(changed_client, since=0, limit=limit)
+    assert len(page['changes']) == 1 and page['has_more'] is True
+    assert page['next_since'] > 0
+
+
+def test_paging_reaches_the_end(changed_client):
+    since, pages = 0, 0
+    while True:
+        page = _changes(changed_client, since=since, limit=2)
+        since, pages = page['next_since'], pages + 1
+        if not page['has_more']:
+            break
+    assert since == page['version'] and pages == 2
@@ -0,0 +1,45 @@
+"""
+Selecting "(none)" must filter to the companies the null facet count covers
+"""
+
+import sqlite3
+
+import pytest
+from werkzeug.datastructures import MultiDict
+
+from company_facets import LISTED_COMPANY, NONE_VALUE, facet_condition, facet_counts, parse_facet_filters
+
+
+@pytest.fixture
+def conn(raw_db):
+    conn = sqlite3.connect(raw_db)
+    # Some scrapers store an empty string rather than NULL
+    conn.execute("UPDATE companies SET location = '' WHERE id % 17 = 0")
+    yield conn
+    conn.close()
+
+
+def _matching(conn, args):
+    condition, params = facet_condition(parse_facet_filters(MultiDict(args)))
+    return conn.execute(f'SELECT COUNT(*) FROM companies WHERE {LISTED_COMPANY} AND {condition}',
+                        params).fetchone()[0]
+
+
+def _count(counts, facet, value):
+    return next(entry['count'] for entry in counts[facet] if entry['value'] == value)
+
+
+@pytest.mark.parametrize('facet', ['batch', 'location'])
+def test_none_value(conn, facet):
+    counts = facet_counts(conn, {})
+    assert [entry['value'] for entry in counts[facet]].count(None) == 1
+    assert '' not in [entry['value'] for entry in counts[facet]]
+    assert _matching(conn, [(facet, NONE_VALUE)]) == _count(counts, facet, None) > 0
+
+
+def test_none_combined_with_values(conn):
+    counts = facet_counts(conn, {})
+    batch = next(entry['value'] for entry in counts['batch'] if entry['value'] is not None)
+    assert (_matching(conn, [('batch', NONE_VALUE), ('batch', batch)])
+            == _count(counts, 'batch', None) + _count(counts, 'batch', batch))
+    assert parse_facet_filters(MultiDict([('batch', NONE_VALUE), ('batch', batch)])) == {'batch': [None, batch]}
@@ -0,0 +1,92 @@
+"""
+Every company row gets a display name, whether or not its writer computed one
+"""
+
+import sqlite3
+
+import pytest
+
+from company_names import NAME_RULES_VERSION, clean_company_name, display_name_columns, setup_display_names
+
+
+@pytest.fixture
+def conn(raw_db):
+    conn = sqlite3.connect(raw_db)
+    setup_display_names(conn)
+    yield conn
+    conn.close()
+
+
+def _names(conn, company_id):
+    return conn.execute('SELECT display_name, sort_name FROM companies WHERE id = ?', (company_id,)).fetchone()
+
+
+def test_backfilled(conn):
+    assert conn.execute('SELECT COUNT(*) FROM companies WHERE display_name IS NULL').fetchone()[0] == 0
+
+
+def test_insert_without_display_name(conn):
+    company_id = conn.execute(
+        "INSERT INTO companies (name, batch) VALUES ('  Acme Robotics \r\nSan Francisco, CA, USA', 'Winter 2025')"
+    ).lastrowid
+    assert _names(conn, company_id) == ('Acme Robotics', 'acme robotics')
+
+
+def test_writer_display_name_is_kept(conn):
+    name = 'Acme RoboticsSan Francisco, CA, USA'
+    company_id = conn.execute(
+        'INSERT INTO companies (name, batch, display_name, sort_name) VALUES (?, ?, ?, ?)',
+        (name, 'Winter 2025', *display_name_columns(name))
+    ).lastrowid
+    assert _names(conn, company_id) == display_name_columns(name)
+
+
+def test_rename(conn):
+    company_id = conn.execute('SELECT id FROM companies LIMIT 1').fetchone()[0]
+    conn.execute("UPDATE companies SET name = 'Renamed Co\nRemote' WHERE id = ?", (company_id,))
+    assert _names(conn, company_id) == ('Renamed Co', 'renamed co')
+
+    conn.execute('UPDATE companies SET name = ?, display_name = ?, sort_name = ? WHERE id = ?',
+                 ('Other Co', *display_name_columns('Other Co'), company_id))
+    assert _names(conn, company_id) == ('Other Co', 'other co')
+
+
+@pytest.mark.parametrize('name', ['Salima', 'BuildRemote', 'Pineapple Rome', 'Hello Paris', 'Lima Labs',
+                                  'OsloWorks', 'Remote', 'Victoria'])
+def test_names_ending_in_a_city_are_kept(name):
+    assert clean_company_name(name) == name
+
+
+@pytest.mark.parametrize('raw,clean', [
+    ('NimbusSanFrancisco, CA, USA', 'Nimbus'),
+    ('AcmeSan Francisco, CA, USA', 'Acme'),
+    ('Acme, San Francisco, CA, USA', 'Acme'),
+    ('Acme Berlin, Germany', 'Acme'),
+    ('Acme, London', 'Acme'),
+    ('Acme, CA, USA', 'Acme'),
+    ('Acme\nNew York, NY, USA', 'Acme'),
+])
+def test_location_tails_are_stripped(raw, clean):
+    assert clean_company_name(raw) == clean
+
+
+def test_names_from_older_rules_are_recomputed(conn):
+    company_id = conn.execute(
+        "INSERT INTO companies (name, batch, display_name, sort_name) VALUES ('Salima', 'W25', 'Sa', 'sa')"
+    ).lastrowid
+    conn.execute('UPDATE display_name_rules SET version = ?', (NAME_RULES_VERSION - 1,))
+    setup_display_names(conn)
+    assert _names(conn, company_id) == ('Salima', 'salima')
+
+
+def test_search_matches_raw_and_display_name(client, raw_db):
+    conn = sqlite3.connect(raw_db)
+    conn.execute('''
+        INSERT INTO companies (name, batch, yc_url)
+        VALUES ('Quokkaly\nQuokkas for everyone', 'Winter 2025', 'https://www.ycombinator.com/companies/quokkaly')
+    ''')
+    conn.commit()
+    conn.close()
+    for search in ('Quokkaly', 'Quokkas for'):
+        names = [company['name'] for company in client.get(f'/api/companies?search={search}').get_json()]
+        assert names == ['Quokkaly'], search
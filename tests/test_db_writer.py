@@ -0,0 +1,87 @@
+"""
+A failing writer thread must surface its error instead of deadlocking producers;
+a closed writer must not linger or drop records silently
+"""
+
+import gc
+import os
+import sqlite3
+import weakref
+
+import pytest
+
+from db_writer import DBWriter
+
+
+def _broken_writer(tmp_path, **options):
+    # The directory doesn't exist, so the writer thread can't open the database
+    return DBWriter(os.path.join(tmp_path, 'missing', 'yc_companies.db'), **options)
+
+
+def test_write_raises_once_the_queue_is_full(tmp_path):
+    writer = _broken_writer(tmp_path, max_pending=2)
+    with pytest.raises(sqlite3.OperationalError):
+        for _ in range(10):
+            writer.write('SELECT 1')
+    with pytest.raises(sqlite3.OperationalError):
+        writer.close()
+    writer.close()  # the error is only reported once
+
+
+def test_flush_and_close_raise(tmp_path):
+    writer = _broken_writer(tmp_path)
+    with pytest.raises(sqlite3.OperationalError):
+        writer.write('SELECT 1')
+        writer.flush()
+    with pytest.raises(sqlite3.OperationalError):
+        writer.close()
+
+
+def test_commit_failure_stops_the_writer(tmp_path, monkeypatch):
+    db_path = os.path.join(tmp_path, 'yc_companies.db')
+    sqlite3.connect(db_path).execute('CREATE TABLE t (x)')
+    writer = DBWriter(db_path)
+    writer.write('INSERT INTO t VALUES (1)')
+    assert writer.flush()
+
+    def disk_full(conn, batch):
+        raise sqlite3.OperationalError('database or disk is full')
+
+    monkeypatch.setattr(writer, '_commit', disk_full)
+    writer.write('INSERT INTO t VALUES (2)')
+    with pytest.raises(sqlite3.OperationalError):
+        writer.flush()
+    with pytest.raises(sqlite3.OperationalError):
+        writer.write('INSERT INTO t VALUES (3)')
+    with pytest.raises(sqlite3.OperationalError):
+        writer.close()
+
+
+def test_healthy_writer(tmp_path):
+    db_path = os.path.join(tmp_path, 'yc_companies.db')
+    sqlite3.connect(db_path).execute('CREATE TABLE t (x)')
+    with DBWriter(db_path, max_pending=5) as writer:
+        for i in range(50):
+            writer.write('INSERT INTO t VALUES (?)', (i,))
+        assert writer.flush(timeout=5)
+    assert sqlite3.connect(db_path).execute('SELECT COUNT(*) FROM t').fetchone()[0] == 50
+
+
+def test_closed_writer_is_not_kept_alive(tmp_path):
+    db_path = os.path.join(tmp_path, 'yc_companies.db')
+    sqlite3.connect(db_path).execute('CREATE TABLE t (x)')
+    writer = DBWriter(db_path)
+    writer.write('INSERT INTO t VALUES (1)')
+    writer.close()
+    ref = weakref.ref(writer)
+    del writer
+    gc.collect()
+    assert ref() is None
+
+
+def test_founders_without_a_name_are_reported(tmp_path, capsys):
+    writer = DBWriter(os.path.join(tmp_path, 'yc_companies.db'))
+    queued = writer.write_founders(1, 'Acme', [{'name': ''}, {'role': 'CEO'}])
+    assert queued == 0
+    assert capsys.readouterr().out.count('Skipping founder without a name for Acme') == 2
+    writer.close()
@@ -0,0 +1,41 @@
+"""
+Work done by a telemetry observer must not be charged to the company event
+"""
+
+import time
+
+import pytest
+
+import scrape_telemetry
+from scrape_telemetry import CompanyEvent
+
+
+class SlowObserver:
+    """Stands in for ScrapeProfiler taking a tracemalloc snapshot"""
+
+    def event_started(self, event):
+        pass
+
+    def event_finished(self, event):
+        time.sleep(0.2)
+
+    def stage_started(self, name):
+        pass
+
+    def stage_finished(self, name):
+        pass
+
+
+@pytest.fixture
+def slow_observer():
+    scrape_telemetry.set_observer(SlowObserver())
+    yield
+    scrape_telemetry.set_observer(None)
+
+
+def test_observer_time_is_not_parse_time(slow_observer):
+    with CompanyEvent(None, 1, 'Acme') as event:
+        with event.stage('fetch'):
+            time.sleep(0.01)
+    assert event.durations['fetch'] >= 0.01
+    assert event.durations['parse'] < 0.1
@@ -0,0 +1,96 @@
+"""
+The trigger-maintained rollup must match rebuild_stats() after any kind of write
+"""
+
+import sqlite3
+
+import pytest
+
+from stats_rollup import rebuild_stats, setup_stats_rollup
+
+COMPANY_COLUMNS = '(name, batch, website, location, industry, is_hiring, yc_url)'
+FOUNDER_COLUMNS = '(company_id, company_name, name, role)'
+
+COMPANY_UPSERT = f'''
+    INSERT INTO companies {COMPANY_COLUMNS} VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(name, batch) DO UPDATE SET yc_url = excluded.yc_url, website = excluded.website
+'''
+FOUNDER_UPSERT = f'''
+    INSERT INTO founders {FOUNDER_COLUMNS} VALUES (?, ?, ?, ?)
+    ON CONFLICT(company_name, name) DO UPDATE SET company_id = excluded.company_id, role = excluded.role
+'''
+
+WRITES = {
+    'replace': (f'INSERT OR REPLACE INTO companies {COMPANY_COLUMNS} VALUES (?, ?, ?, ?, ?, ?, ?)',
+                f'INSERT OR REPLACE INTO founders {FOUNDER_COLUMNS} VALUES (?, ?, ?, ?)'),
+    'ignore': (f'INSERT OR IGNORE INTO companies {COMPANY_COLUMNS} VALUES (?, ?, ?, ?, ?, ?, ?)',
+               f'INSERT OR IGNORE INTO founders {FOUNDER_COLUMNS} VALUES (?, ?, ?, ?)'),
+    'upsert': (COMPANY_UPSERT, FOUNDER_UPSERT),
+}
+
+
+@pytest.fixture
+def conn(raw_db):
+    conn = sqlite3.connect(raw_db)
+    setup_stats_rollup(conn)
+    yield conn
+    conn.close()
+
+
+def snapshot(conn):
+    """Everything the triggers maintain"""
+    return (
+        conn.execute('SELECT metric, bucket, value FROM stats_rollup ORDER BY metric, bucket').fetchall(),
+        conn.execute('SELECT id, founder_count FROM companies ORDER BY id').fetchall(),
+    )
+
+
+def assert_matches_rebuild(conn):
+    maintained = snapshot(conn)
+    rebuild_stats(conn)
+    assert maintained == snapshot(conn)
+
+
+@pytest.mark.parametrize('write', sorted(WRITES))
+def test_rewriting_existing_rows(conn, write):
+    company_sql, founder_sql = WRITES[write]
+    companies = conn.execute('''
+        SELECT c.id, c.name, c.batch, f.name FROM companies c JOIN founders f ON f.company_id = c.id
+        WHERE c.batch IS NOT NULL AND c.yc_url LIKE '%/companies/%'
+        GROUP BY c.id LIMIT 5
+    ''').fetchall()
+    other_id = companies[-1][0]
+    for company_id, name, batch, founder in companies[:-1]:
+        # Same company, URL now outside the counted set; same founder moved to another company
+        conn.execute(company_sql, (name, batch, 'https://example.com', 'Remote', 'B2B', 1,
+                                   'https://www.ycombinator.com/launches/x'))
+        conn.execute(founder_sql, (other_id, name, founder, 'CEO'))
+    conn.commit()
+    assert_matches_rebuild(conn)
+
+
+@pytest.mark.parametrize('write', sorted(WRITES))
+def test_new_rows(conn, write):
+    company_sql, founder_sql = WRITES[write]
+    cursor = conn.execute(company_sql, ('Brand New Co', 'Winter 2025', 'https://brandnew.example', 'Remote',
+                                       'B2B', 1, 'https://www.ycombinator.com/companies/brand-new-co'))
+    company_id = cursor.lastrowid
+    conn.execute(founder_sql, (company_id, 'Brand New Co', 'Ada Founder', 'CEO'))
+    conn.commit()
+    assert_matches_rebuild(conn)
+
+
+def test_ignored_write_then_delete(conn):
+    """Candidates left by an ignored insert must not be retracted by a later, unrelated insert"""
+    company_id, name, batch = conn.execute(
+        "SELECT id, name, batch FROM companies WHERE batch IS NOT NULL AND yc_url LIKE '%/companies/%' LIMIT 1"
+    ).fetchone()
+    conn.execute(f'INSERT OR IGNORE INTO companies {COMPANY_COLUMNS} VALUES (?, ?, ?, ?, ?, ?, ?)',
+                 (name, batch, None, None, None, 1, None))
+    conn.execute('DELETE FROM founders WHERE company_id = ?', (company_id,))
+    conn.execute('DELETE FROM companies WHERE id = ?', (company_id,))
+    conn.execute(f'INSERT INTO companies {COMPANY_COLUMNS} VALUES (?, ?, ?, ?, ?, ?, ?)',
+                 ('Unrelated Co', 'Summer 2024', None, None, None, 1,
+                  'https://www.ycombinator.com/companies/unrelated-co'))
+    conn.commit()
+    assert_matches_rebuild(conn)
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Side-table storage for large text columns
+companies.description and founders.bio live in company_texts/founder_texts,
+zlib-compressed when that pays off, so list scans over the main tables only
+touch the small columns. Only the detail endpoints load the text back.
+"""
+
+import sqlite3
+import sys
+import zlib
+
+# Texts shorter than this are stored as-is; compression overhead isn't worth it
+COMPRESS_MIN_BYTES = 256
+
+
+def pack_text(text):
+    """Return (value, compressed) for storing a text; value is None for empty text"""
+    if not text:
+        return None, 0
+    raw = text.encode('utf-8')
+    if len(raw) >= COMPRESS_MIN_BYTES:
+        packed = zlib.compress(raw, 6)
+        if len(packed) < len(raw):
+            return packed, 1
+    return text, 0
+
+
+def unpack_text(value, compressed):
+    """Inverse of pack_text"""
+    if value is None:
+        return None
+    if compressed:
+        return zlib.decompress(value).decode('utf-8')
+    return value
+
+
+def _has_table(conn, table):
+    """Check whether a table exists (scraper.py's databases have no founders table)"""
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone() is not None
+
+
+def setup_text_storage(conn):
+    """Create the side tables and the triggers that clean them up with their owners
+
+    The founders trigger is only created once a founders table exists.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS company_texts (
+            company_id INTEGER PRIMARY KEY,
+            description BLOB,
+            compressed INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS founder_texts (
+            founder_id INTEGER PRIMARY KEY,
+            bio BLOB,
+            compressed INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS texts_companies_after_delete AFTER DELETE ON companies
+        BEGIN
+            DELETE FROM company_texts WHERE company_id = OLD.id;
+        END
+    ''')
+    if _has_table(conn, 'founders'):
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS texts_founders_after_delete AFTER DELETE ON founders
+            BEGIN
+                DELETE FROM founder_texts WHERE founder_id = OLD.id;
+            END
+        ''')
+    conn.commit()
+
+
+def register_text_functions(conn):
+    """Make unpack_text() callable from SQL on this connection"""
+    conn.create_function('unpack_text', 2, unpack_text, deterministic=True)
+
+
+def save_company_description(cursor, company_id, description):
+    """Store (or clear) a company's description in the side table"""
+    value, compressed = pack_text(description)
+    if value is None:
+        cursor.execute('DELETE FROM company_texts WHERE company_id = ?', (company_id,))
+    else:
+        cursor.execute('''
+            INSERT OR REPLACE INTO company_texts (company_id, description, compressed)
+            VALUES (?, ?, ?)
+        ''', (company_id, value, compressed))
+
+
+def save_founder_bio(cursor, founder_id, bio):
+    """Store (or clear) a founder's bio in the side table"""
+    value, compressed = pack_text(bio)
+    if value is None:
+        cursor.execute('DELETE FROM founder_texts WHERE founder_id = ?', (founder_id,))
+    else:
+        cursor.execute('''
+            INSERT OR REPLACE INTO founder_texts (founder_id, bio, compressed)
+            VALUES (?, ?, ?)
+        ''', (founder_id, value, compressed))
+
+
+def founder_bio_statement(company_name, name, bio):
+    """(sql, params) storing a bio keyed by the founder's natural key
+
+    Used by the batched writer, which doesn't know the founder id up front.
+    """
+    value, compressed = pack_text(bio)
+    if value is None:
+        return ('''
+            DELETE FROM founder_texts
+            WHERE founder_id = (SELECT id FROM founders WHERE company_name = ? AND name = ?)
+        ''', (company_name, name))
+    return ('''
+        INSERT OR REPLACE INTO founder_texts (founder_id, bio, compressed)
+        SELECT id, ?, ? FROM founders WHERE company_name = ? AND name = ?
+    ''', (value, compressed, company_name, name))
+
+
+def load_company_description(conn, company_id):
+    """Load one company's description"""
+    row = conn.execute(
+        'SELECT description, compressed FROM company_texts WHERE company_id = ?', (company_id,)
+    ).fetchone()
+    return unpack_text(row[0], row[1]) if row else None
+
+
+def load_company_descriptions(conn, company_ids):
+    """Load descriptions for a list of company ids, returns {company_id: description}"""
+    company_ids = list(company_ids)
+    if not company_ids:
+        return {}
+    placeholders = ','.join(['?'] * len(company_ids))
+    rows = conn.execute(f'''
+        SELECT company_id, description, compressed FROM company_texts
+        WHERE company_id IN ({placeholders})
+    ''', company_ids).fetchall()
+    return {company_id: unpack_text(description, compressed) for company_id, description, compressed in rows}
+
+
+def load_founder_bios(conn, founder_ids):
+    """Load bios for a list of founder ids, returns {founder_id: bio}"""
+    founder_ids = list(founder_ids)
+    if not founder_ids:
+        return {}
+    placeholders = ','.join(['?'] * len(founder_ids))
+    rows = conn.execute(f'''
+        SELECT founder_id, bio, compressed FROM founder_texts
+        WHERE founder_id IN ({placeholders})
+    ''', founder_ids).fetchall()
+    return {founder_id: unpack_text(bio, compressed) for founder_id, bio, compressed in rows}
+
+
+def offload_texts(conn, vacuum=False):
+    """Move any inline description/bio values into the side tables
+
+    Also drops side rows whose owner is gone (INSERT OR REPLACE deletes
+    without firing the cleanup triggers). Returns (descriptions, bios) moved.
+    """
+    setup_text_storage(conn)
+    cursor = conn.cursor()
+
+    rows = cursor.execute(
+        "SELECT id, description FROM companies WHERE description IS NOT NULL AND description != ''"
+    ).fetchall()
+    for company_id, description in rows:
+        save_company_description(cursor, company_id, description)
+    cursor.execute('UPDATE companies SET description = NULL WHERE description IS NOT NULL')
+    moved_descriptions = len(rows)
+
+    moved_bios = 0
+    if _has_table(conn, 'founders'):
+        rows = cursor.execute(
+            "SELECT id, bio FROM founders WHERE bio IS NOT NULL AND bio != ''"
+        ).fetchall()
+        for founder_id, bio in rows:
+            save_founder_bio(cursor, founder_id, bio)
+        cursor.execute('UPDATE founders SET bio = NULL WHERE bio IS NOT NULL')
+        cursor.execute('DELETE FROM founder_texts WHERE founder_id NOT IN (SELECT id FROM founders)')
+        moved_bios = len(rows)
+
+    cursor.execute('DELETE FROM company_texts WHERE company_id NOT IN (SELECT id FROM companies)')
+    conn.commit()
+
+    if vacuum:
+        conn.execute('VACUUM')
+    return moved_descriptions, moved_bios
+
+
+if __name__ == "__main__":
+    db_path = sys.argv[1] if len(sys.argv) > 1 else 'yc_companies.db'
+
+    conn = sqlite3.connect(db_path)
+    moved_descriptions, moved_bios = offload_texts(conn, vacuum=True)
+    conn.close()
+
+    print(f"✅ Moved {moved_descriptions} descriptions and {moved_bios} bios to side tables")
@@ -8,10 +8,14 @@ import sqlite3
 import sys
 from tabulate import tabulate
 
+from company_names import setup_display_names
+from text_storage import register_text_functions, setup_text_storage
+
 def view_companies(db_path='yc_companies.db', limit=None):
     """Display companies from database"""
     try:
         conn = sqlite3.connect(db_path)
+        setup_display_names(conn)
         cursor = conn.cursor()
         
         # Get total count
@@ -24,7 +28,7 @@ def view_companies(db_path='yc_companies.db', limit=None):
             return
         
         # Get companies
-        query = "SELECT name, batch, location, industry, website, yc_url FROM companies ORDER BY name"
+        query = "SELECT display_name, batch, location, industry, website, yc_url FROM companies ORDER BY sort_name"
         if limit:
             query += f" LIMIT {limit}"
         
@@ -35,9 +39,6 @@ def view_companies(db_path='yc_companies.db', limit=None):
         companies_display = []
         for row in companies:
             name, batch, location, industry, website, yc_url = row
-            # Clean name - take first line only if multiline
-            if name:
-                name = name.split('\n')[0].strip()
             # Convert None to empty string
             cleaned_row = [
                 name or '',
@@ -72,17 +73,21 @@ def view_companies(db_path='yc_companies.db', limit=None):
 def search_companies(db_path='yc_companies.db', search_term=None):
     """Search companies by name"""
     conn = sqlite3.connect(db_path)
+    setup_display_names(conn)
+    setup_text_storage(conn)
+    register_text_functions(conn)
     cursor = conn.cursor()
     
     if search_term:
         cursor.execute("""
-            SELECT name, batch, location, industry, website, yc_url 
-            FROM companies 
-            WHERE name LIKE ? OR description LIKE ?
-            ORDER BY name
+            SELECT display_name, batch, location, industry, website, yc_url 
+            FROM companies c
+            LEFT JOIN company_texts t ON t.company_id = c.id
+            WHERE display_name LIKE ? OR unpack_text(t.description, t.compressed) LIKE ?
+            ORDER BY sort_name
         """, (f'%{search_term}%', f'%{search_term}%'))
     else:
-        cursor.execute("SELECT name, batch, location, industry, website, yc_url FROM companies ORDER BY name")
+        cursor.execute("SELECT display_name, batch, location, industry, website, yc_url FROM companies ORDER BY sort_name")
     
     companies = cursor.fetchall()
     